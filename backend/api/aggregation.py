@@ -0,0 +1,207 @@
+# API App aggregation.py
+
+from collections import defaultdict
+import numpy as np
+from django.db.models import Q
+
+from .models import * # Import models
+from .scoring import task_means, grouped_means, propagate_means # Vectorized averaging kernel
+
+
+# NOTE:
+# - This is the one place where task -> CLO -> PLO averages are calculated for the performance views
+# - An OutcomeAggregator loads everything for a scope (sections, courses or evaluation instruments) in a
+#   constant number of queries (tasks, raw gradebook rows, Task-CLO mappings, PLO-CLO mappings) into NumPy arrays
+#   and then answers any number of CLO/PLO questions about subsets of that scope with the kernel in scoring.py
+# - Two averaging modes exist because the endpoints historically differ in how a task's average is taken:
+#     NORMALIZED: the average of every student's (score / total_possible_score) * 100 (rows with a total of 0 are skipped)
+#     RATIO:      (average score / average total possible score) * 100, used by the section endpoints
+
+NORMALIZED = "normalized"
+RATIO = "ratio"
+
+
+class OutcomeAggregator:
+   """
+   Purpose: Loads the gradebook and mapping data for a scope once and computes task, CLO and PLO averages from it.
+   Args:
+      sections (iterable | QuerySet): Sections (or section IDs) whose tasks are in scope
+      courses (iterable | QuerySet): Courses (or course IDs) whose sections' tasks are in scope
+      instruments (iterable | QuerySet): Evaluation instruments (or IDs) whose tasks are in scope
+   """
+   def __init__(self, sections=None, courses=None, instruments=None):
+      tasks = EmbeddedTask.objects.all()
+      scope_clos = CourseLearningObjective.objects.all()  # CLOs of the courses in scope, reported even when no task is mapped to them
+      if sections is not None:
+         tasks = tasks.filter(evaluation_instrument__section__in=sections)
+         scope_clos = scope_clos.filter(course__section__in=sections)
+      if courses is not None:
+         tasks = tasks.filter(evaluation_instrument__section__course__in=courses)
+         scope_clos = scope_clos.filter(course__in=courses)
+      if instruments is not None:
+         tasks = tasks.filter(evaluation_instrument__in=instruments)
+         scope_clos = scope_clos.filter(course__section__evaluationinstrument__in=instruments)
+
+      # Query 1: Every task in scope along with where it lives
+      self.tasks = {}  # {task_id: (instrument_id, section_id, course_id, evaluation_type_id)}
+      self.tasks_by_section = defaultdict(list)
+      self.tasks_by_instrument = defaultdict(list)
+      self.section_courses = {}  # {section_id: course_id}
+      for task_id, instrument_id, section_id, course_id, evaluation_type_id in tasks.order_by("embedded_task_id").values_list(
+         "embedded_task_id",
+         "evaluation_instrument_id",
+         "evaluation_instrument__section_id",
+         "evaluation_instrument__section__course_id",
+         "evaluation_instrument__evaluation_type_id",
+      ):
+         self.tasks[task_id] = (instrument_id, section_id, course_id, evaluation_type_id)
+         self.tasks_by_section[section_id].append(task_id)
+         self.tasks_by_instrument[instrument_id].append(task_id)
+         self.section_courses[section_id] = course_id
+      self.task_ids = np.array(list(self.tasks.keys()), dtype=np.int64)  # Sorted, a task's index into the arrays below is its position here
+      self.task_positions = {task_id: position for position, task_id in enumerate(self.tasks.keys())}
+      self.task_sections = np.array([task[1] for task in self.tasks.values()], dtype=np.int64)
+
+      # Query 2: The raw gradebook rows for every task in scope, averaged per task by the kernel
+      gradebook = np.array(
+         list(StudentTaskMapping.objects.filter(task__in=tasks).values_list("task_id", "score", "total_possible_score")),
+         dtype=np.float64,
+      ).reshape(-1, 3)
+      normalized, ratio = task_means(
+         np.searchsorted(self.task_ids, gradebook[:, 0].astype(np.int64)),
+         gradebook[:, 1],
+         gradebook[:, 2],
+         len(self.task_ids),
+      )
+      self.task_means = {NORMALIZED: normalized, RATIO: ratio}
+
+      # Query 3: Task -> CLO mappings for every task in scope
+      self.task_clos = defaultdict(list)  # {task_id: [clo_id, ...]}
+      self.clo_designations = {}  # {clo_id: designation}
+      task_clo_mappings = TaskCLOMapping.objects.filter(task__in=tasks)
+      for task_id, clo_id, designation in task_clo_mappings.values_list("task_id", "clo_id", "clo__designation"):
+         self.task_clos[task_id].append(clo_id)
+         self.clo_designations[clo_id] = designation
+      self.task_clo_tasks = np.array([self.task_positions[task_id] for task_id, clo_ids in self.task_clos.items() for clo_id in clo_ids], dtype=np.int64)
+      self.task_clo_clos = np.array([clo_id for clo_ids in self.task_clos.values() for clo_id in clo_ids], dtype=np.int64)
+
+      # Query 4: CLO -> PLO mappings for the mapped CLOs and for every CLO of the courses in scope
+      self.clo_plos = defaultdict(list)  # {clo_id: [plo_id, ...]}
+      plo_clo_mappings = PLOCLOMapping.objects.filter(
+         Q(clo__in=task_clo_mappings.values("clo")) | Q(clo__in=scope_clos.values("clo_id"))
+      )
+      for clo_id, plo_id in plo_clo_mappings.order_by("pk").values_list("clo_id", "plo_id"):  # Reports list a CLO's PLOs in mapping order
+         self.clo_plos[clo_id].append(plo_id)
+      self.plo_clo_clos = np.array([clo_id for clo_id, plo_ids in self.clo_plos.items() for plo_id in plo_ids], dtype=np.int64)
+      self.plo_clo_plos = np.array([plo_id for plo_ids in self.clo_plos.values() for plo_id in plo_ids], dtype=np.int64)
+
+      # (Section, CLO) and (course, CLO) pairs are packed into a single integer key: owner_id * clo_key_base + clo_id
+      self.clo_key_base = int(max(self.task_clo_clos.max(initial=0), self.plo_clo_clos.max(initial=0))) + 1
+      self.task_clo_section_keys = self.task_sections[self.task_clo_tasks] * self.clo_key_base + self.task_clo_clos
+
+   def positions_for(self, task_ids):
+      """
+      Returns the array positions of the given task IDs, skipping tasks that are not in scope.
+      """
+      return np.array([self.task_positions[task_id] for task_id in task_ids if task_id in self.task_positions], dtype=np.int64)
+
+   def task_average(self, task_id, mode=NORMALIZED):
+      """
+      Returns the average (out of 100) for a single task, 0 if the task has no usable scores.
+      """
+      if task_id not in self.task_positions:
+         return 0
+      return float(self.task_means[mode][self.task_positions[task_id]])
+
+   def task_ids_for(self, section_ids=None, instrument_ids=None):
+      """
+      Returns the IDs of the tasks in scope that belong to the given sections and/or instruments.
+      """
+      if section_ids is None and instrument_ids is None:
+         return list(self.tasks.keys())
+      task_ids = []
+      for section_id in section_ids or []:
+         task_ids.extend(self.tasks_by_section.get(section_id, []))
+      for instrument_id in instrument_ids or []:
+         task_ids.extend(self.tasks_by_instrument.get(instrument_id, []))
+      return task_ids
+
+   def section_ids_for(self, course_ids):
+      """
+      Returns the IDs of the sections in scope (that have at least one task) that belong to the given courses.
+      """
+      course_ids = set(course_ids)
+      return [section_id for section_id, course_id in self.section_courses.items() if course_id in course_ids]
+
+   def task_performance(self, task_ids=None, mode=NORMALIZED):
+      """
+      Returns {task_id: average} for the given tasks (every task in scope by default).
+      """
+      if task_ids is None:
+         task_ids = self.tasks.keys()
+      return {task_id: self.task_average(task_id, mode) for task_id in task_ids}
+
+   def clo_performance(self, task_ids, mode=NORMALIZED):
+      """
+      Returns {clo_id: average} where each CLO's average is the mean of the averages of the given tasks mapped to it.
+      """
+      positions = self.positions_for(task_ids)
+      clo_ids, averages = propagate_means(self.task_means[mode][positions], positions, self.task_clo_tasks, self.task_clo_clos)
+      return dict(zip(clo_ids.tolist(), averages.tolist()))
+
+   def section_clo_performance(self, section_id, mode=NORMALIZED):
+      """
+      Returns {clo_id: average} for a single section.
+      """
+      return self.clo_performance(self.tasks_by_section.get(section_id, []), mode)
+
+   def section_clo_keys(self, section_ids, mode=NORMALIZED):
+      """
+      Returns (keys, averages) holding the average of every (section, CLO) pair of the given sections, keyed as section_id * clo_key_base + clo_id.
+      """
+      positions = self.positions_for(self.task_ids_for(section_ids=section_ids))
+      return propagate_means(self.task_means[mode][positions], positions, self.task_clo_tasks, self.task_clo_section_keys)
+
+   def course_clo_performance(self, section_ids, mode=NORMALIZED):
+      """
+      Returns {clo_id: average} where each CLO's average is the mean of its per-section averages.
+      """
+      keys, averages = self.section_clo_keys(section_ids, mode)
+      clo_ids, averages = grouped_means(keys % self.clo_key_base, averages)
+      return dict(zip(clo_ids.tolist(), averages.tolist()))
+
+   def plo_performance(self, clo_performance):
+      """
+      Returns {plo_id: average} where each PLO's average is the mean of the given CLO averages mapped to it.
+      """
+      clo_ids = np.fromiter(clo_performance.keys(), dtype=np.int64, count=len(clo_performance))
+      averages = np.fromiter(clo_performance.values(), dtype=np.float64, count=len(clo_performance))
+      plo_ids, averages = propagate_means(averages, clo_ids, self.plo_clo_clos, self.plo_clo_plos)
+      return dict(zip(plo_ids.tolist(), averages.tolist()))
+
+   def program_plo_performance(self, section_ids, mode=NORMALIZED):
+      """
+      Returns {plo_id: average} for sections spanning several courses. CLO averages are taken per course first,
+      then every (course, CLO -> PLO) contribution is averaged together.
+      """
+      keys, averages = self.section_clo_keys([section_id for section_id in section_ids if section_id in self.section_courses], mode)
+      section_ids, clo_ids = keys // self.clo_key_base, keys % self.clo_key_base
+      course_ids = np.array([self.section_courses[section_id] for section_id in section_ids.tolist()], dtype=np.int64)
+      course_clo_keys, averages = grouped_means(course_ids * self.clo_key_base + clo_ids, averages)
+      # Each PLO sums its contributions course by course and, within a course, by CLO ID (the order the per-course mapping
+      # query used to return them in), so the floating point result and its rounding in the reports stay the same
+      _, first_seen, inverse = np.unique(course_clo_keys // self.clo_key_base, return_index=True, return_inverse=True)
+      order = np.lexsort((course_clo_keys % self.clo_key_base, first_seen[inverse]))
+      plo_ids, averages = propagate_means(averages[order], course_clo_keys[order] % self.clo_key_base, self.plo_clo_clos, self.plo_clo_plos)
+      return dict(zip(plo_ids.tolist(), averages.tolist()))
+
+   def clo_evaluation_type_ids(self, section_ids):
+      """
+      Returns {clo_designation: {evaluation_type_id, ...}} for the evaluation types used to assess each CLO in the given sections.
+      """
+      clo_evaluation_types = defaultdict(set)
+      for task_id in self.task_ids_for(section_ids=section_ids):
+         evaluation_type_id = self.tasks[task_id][3]
+         for clo_id in self.task_clos.get(task_id, []):
+            clo_evaluation_types[self.clo_designations[clo_id]].add(evaluation_type_id)
+      return dict(clo_evaluation_types)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from . import signals  # noqa: F401 (registers the rollup signal receivers)
+        from . import sqlite_tuning  # noqa: F401 (registers the SQLite connection pragmas)
@@ -0,0 +1,275 @@
+# API App bulk.py
+
+from collections import defaultdict
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, transaction
+
+from .models import * # Import models
+from .rollups import TRACKED_FIELDS, schedule_mapping_refresh # bulk_create() / bulk_update() send no signals, the rollups are refreshed from here
+from .report_cache import REPORT_SOURCE_MODELS, schedule_data_version_bump # Same for the report cache's data version
+
+
+# NOTE:
+# - Shared helpers of the bulk write paths (see ingestion.py) and the bulk create / partial update / delete of the mapping
+#   tables (TaskCLOMapping, PLOCLOMapping, ProgramCourseMapping, StudentTaskMapping), served by the *Bulk views in views/mappings.py
+# - A batch is validated as a whole before anything is written: every foreign key is checked against one pk__in query per
+#   related table, and the mapping's unique pair (e.g. task + CLO) against the rest of the batch and one query on the table
+# - Invalid items are reported by their index and skipped, the others are written with bulk_create() / bulk_update() (or one
+#   DELETE per BATCH_SIZE rows) in a single transaction. With atomic=True a single invalid item means nothing is written
+# - Deletes go through QuerySet.delete(), which sends post_delete, so signals.py keeps the rollups and the data version current.
+#   Creates and updates send no signals and schedule both themselves (schedule_refresh(), also used by ingestion.py)
+
+BATCH_SIZE = 500  # Rows per INSERT/UPDATE and IDs per IN (...) clause, keeps every statement well below SQLite's variable limit
+
+
+def existing_pks(model, pks):
+   """
+   Returns the subset of pks that are primary keys of model, looked up BATCH_SIZE at a time.
+   """
+   pks, existing = list(set(pks) - {None}), set()
+   for start in range(0, len(pks), BATCH_SIZE):
+      existing.update(model.objects.filter(pk__in=pks[start:start + BATCH_SIZE]).values_list("pk", flat=True))
+   return existing
+
+
+def fill_created_pks(model, objects, **filters):
+   """
+   Makes sure objects written with bulk_create() know their primary keys. Backends that cannot return them from the
+   INSERT (MySQL) get them by reading the rows back in insertion order.
+   """
+   if connection.features.can_return_rows_from_bulk_insert or not objects:
+      return objects
+   pks = list(model.objects.filter(**filters).order_by("-pk").values_list("pk", flat=True)[:len(objects)])
+   for obj, pk in zip(objects, reversed(pks)):
+      obj.pk = pk
+   return objects
+
+
+def schedule_refresh(model, owner_ids):
+   """
+   Purpose: Does what signals.py would have done for rows written without signals (bulk_create(), bulk_update()): queues the
+            refresh of the rollups the rows feed into and the data version bump, both run when the transaction commits.
+            The rollups are always refreshed before the data version moves forward (the bump drains pending refreshes first),
+            so a metric cached under the new version (see metrics.py) is never computed from rollups older than that version.
+   Args:
+      model (Model): The model the rows were written to
+      owner_ids (iterable): Values of the model's tracked foreign key on those rows (see TRACKED_FIELDS in rollups.py),
+                            e.g. the task IDs of gradebook rows, empty for models no rollup depends on
+   """
+   if model in TRACKED_FIELDS:
+      schedule_mapping_refresh(model, owner_ids)
+   if model in REPORT_SOURCE_MODELS:
+      schedule_data_version_bump()
+
+
+# START - Mapping Tables
+def _writable_fields(model):
+   return [field for field in model._meta.concrete_fields if not field.primary_key]
+
+
+def _unique_fields(model):
+   """
+   Returns the attnames of the mapping's pseudo composite key (its unique constraint), e.g. ("task_id", "clo_id").
+   """
+   return tuple(model._meta.get_field(name).attname for name in model._meta.constraints[0].fields)
+
+
+def _parse_pk(model, value):
+   try:
+      return model._meta.pk.to_python(value) if value is not None else None
+   except DjangoValidationError:
+      return None
+
+
+def _clean_items(model, items, partial):
+   """
+   Validates the field values of every item of a batch.
+   Args:
+      partial (bool): Only the fields present are validated (updates), otherwise every field is required
+   Returns:
+      list: ({attname: value}, {field name: [messages]}) per item
+   """
+   fields = _writable_fields(model)
+   field_names = {field.name for field in fields}
+   parsed, related_pks = [], defaultdict(set)
+   for item in items:
+      values, errors = {}, {}
+      if not isinstance(item, dict):
+         parsed.append((values, {"non_field_errors": ["Expected an object."]}))
+         continue
+      unknown = set(item) - field_names - {"pk", model._meta.pk.name}
+      if unknown:
+         errors["non_field_errors"] = [f"Unknown field(s): {', '.join(sorted(unknown))}."]
+      for field in fields:
+         if field.name not in item:
+            if not partial:
+               errors[field.name] = ["This field is required."]
+            continue
+         try:
+            if item[field.name] is None and not field.null:
+               raise DjangoValidationError("This field may not be null.")
+            if field.is_relation:
+               value = field.target_field.to_python(item[field.name])
+               related_pks[field].add(value)
+            else:
+               value = field.clean(item[field.name], None)
+         except DjangoValidationError as e:
+            errors[field.name] = e.messages
+            continue
+         values[field.attname] = value
+      parsed.append((values, errors))
+
+   # Every foreign key of the batch, one query per related table
+   existing = {field: existing_pks(field.related_model, pks) for field, pks in related_pks.items()}
+   for values, errors in parsed:
+      for field, pks in existing.items():
+         if field.attname in values and values[field.attname] not in pks:
+            errors[field.name] = [f"{field.related_model.__name__} {values[field.attname]} does not exist."]
+   return parsed
+
+
+def _taken_pairs(model, pairs):
+   """
+   Returns {pair: pk} for the given pairs of the mapping's unique fields that already exist in the table.
+   """
+   first, second = _unique_fields(model)
+   pairs, taken = list(set(pairs)), {}
+   for start in range(0, len(pairs), BATCH_SIZE):
+      chunk = pairs[start:start + BATCH_SIZE]
+      rows = model.objects.filter(**{f"{first}__in": {a for a, _ in chunk}, f"{second}__in": {b for _, b in chunk}}).values_list(first, second, "pk")
+      taken.update(((a, b), pk) for a, b, pk in rows)  # May hold a few pairs that were not asked for, they are never looked up
+   return taken
+
+
+def _finish(results, atomic):
+   """
+   Returns whether the valid items of the batch may be written.
+   """
+   return not (atomic and any(result["errors"] for result in results))
+
+
+def bulk_create_mappings(model, items, atomic=False):
+   """
+   Purpose: Creates mapping rows, e.g. [{"task": 1, "clo": 2}, ...] for TaskCLOMapping.
+   Returns:
+      tuple: (results, written), one result per item: {"index": i, "pk": ...} once created, {"index": i, "errors": {...}} otherwise
+   """
+   unique = _unique_fields(model)
+   parsed = _clean_items(model, items, partial=False)
+   taken = _taken_pairs(model, [tuple(values[name] for name in unique) for values, errors in parsed if not errors])
+
+   results, objects, seen = [], [], set()
+   for index, (values, errors) in enumerate(parsed):
+      if not errors:
+         pair = tuple(values[name] for name in unique)
+         if pair in taken or pair in seen:
+            errors["non_field_errors"] = ["This mapping already exists."]
+         seen.add(pair)
+      results.append({"index": index, "errors": errors})
+      if not errors:
+         objects.append((index, model(**values)))
+   if not _finish(results, atomic):
+      return results, False
+
+   with transaction.atomic():
+      rows = [obj for _, obj in objects]
+      model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+      fill_created_pks(model, rows)
+      if rows:
+         schedule_refresh(model, {getattr(row, TRACKED_FIELDS[model]) for row in rows} if model in TRACKED_FIELDS else ())
+   for index, obj in objects:
+      results[index] = {"index": index, "pk": obj.pk}
+   return results, True
+
+
+def bulk_update_mappings(model, items, atomic=False):
+   """
+   Purpose: Partially updates mapping rows, every item names its row with "pk", e.g. [{"pk": 7, "clo": 3}, ...].
+   Returns:
+      tuple: (results, written), one result per item: {"index": i, "pk": ...} once updated, {"index": i, "errors": {...}} otherwise
+   """
+   unique = _unique_fields(model)
+   parsed = _clean_items(model, items, partial=True)
+   pks = [_parse_pk(model, item.get("pk", item.get(model._meta.pk.name))) if isinstance(item, dict) else None for item in items]
+   instances = {}
+   for start in range(0, len(pks), BATCH_SIZE):
+      instances.update(model.objects.in_bulk([pk for pk in pks[start:start + BATCH_SIZE] if pk is not None]))
+
+   # The unique pair every row will have after the update
+   new_pairs = {}
+   for index, (pk, (values, errors)) in enumerate(zip(pks, parsed)):
+      if pk in instances and not errors:
+         new_pairs[index] = tuple(values.get(name, getattr(instances[pk], name)) for name in unique)
+   taken = _taken_pairs(model, new_pairs.values())
+
+   results, updates, seen_pks, seen_pairs = [], [], set(), set()
+   for index, (pk, (values, errors)) in enumerate(zip(pks, parsed)):
+      if pk is None:
+         errors["pk"] = ["A valid primary key is required."]
+      elif pk not in instances:
+         errors["pk"] = [f"{model.__name__} {pk} does not exist."]
+      elif pk in seen_pks:
+         errors["pk"] = ["This row is listed more than once."]
+      elif not values and not errors:
+         errors["non_field_errors"] = ["No fields to update."]
+      elif not errors:
+         pair = new_pairs[index]
+         if taken.get(pair, pk) != pk or pair in seen_pairs:
+            errors["non_field_errors"] = ["This mapping already exists."]
+         seen_pairs.add(pair)
+      seen_pks.add(pk)
+      results.append({"index": index, "errors": errors})
+      if not errors:
+         updates.append((index, instances[pk], values))
+   if not _finish(results, atomic):
+      return results, False
+
+   with transaction.atomic():
+      owner_ids, fields = set(), set()
+      for _, instance, values in updates:
+         if model in TRACKED_FIELDS:
+            owner_ids.add(getattr(instance, TRACKED_FIELDS[model]))  # The row's previous owner needs a refresh too
+         for attname, value in values.items():
+            setattr(instance, attname, value)
+            fields.add(model._meta.get_field(attname).name)
+         if model in TRACKED_FIELDS:
+            owner_ids.add(getattr(instance, TRACKED_FIELDS[model]))
+      if updates:
+         model.objects.bulk_update([instance for _, instance, _ in updates], sorted(fields), batch_size=BATCH_SIZE)
+         schedule_refresh(model, owner_ids)
+   for index, instance, _ in updates:
+      results[index] = {"index": index, "pk": instance.pk}
+   return results, True
+
+
+def bulk_delete_mappings(model, items, atomic=False):
+   """
+   Purpose: Deletes mapping rows by primary key, e.g. [7, 8, 9].
+   Returns:
+      tuple: (results, written), one result per item: {"index": i, "pk": ...} once deleted, {"index": i, "errors": {...}} otherwise
+   """
+   pks = [_parse_pk(model, item) for item in items]
+   existing = existing_pks(model, pks)
+
+   results, seen = [], set()
+   for index, pk in enumerate(pks):
+      errors = {}
+      if pk is None:
+         errors["pk"] = ["A valid primary key is required."]
+      elif pk not in existing:
+         errors["pk"] = [f"{model.__name__} {pk} does not exist."]
+      elif pk in seen:
+         errors["pk"] = ["This row is listed more than once."]
+      seen.add(pk)
+      results.append({"index": index, "errors": errors})
+   if not _finish(results, atomic):
+      return results, False
+
+   deleted = [(index, pk) for index, (pk, result) in enumerate(zip(pks, results)) if not result["errors"]]
+   with transaction.atomic():
+      for start in range(0, len(deleted), BATCH_SIZE):
+         model.objects.filter(pk__in=[pk for _, pk in deleted[start:start + BATCH_SIZE]]).delete()  # Sends post_delete (see signals.py)
+   for index, pk in deleted:
+      results[index] = {"index": index, "pk": pk}
+   return results, True
+# STOP - Mapping Tables
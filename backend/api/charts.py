@@ -0,0 +1,215 @@
+# API App charts.py
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, BrokenExecutor
+from io import BytesIO
+import numpy as np
+from django.conf import settings
+
+# Graphing imports (object-oriented API only, pyplot's global figure state is never touched)
+import matplotlib
+matplotlib.use("Agg") # Uses the 'Agg' backend for matplotlib to ensure no GUI instances are spun up (seaborn loads pyplot)
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import seaborn as sns
+
+
+# NOTE:
+# - This is the chart rendering service behind the performance reports, views/report_pdfs.py gathers the numbers and this module draws them
+# - Every renderer (bar_chart, box_plot, heatmap) takes plain, picklable data and returns the chart as PNG bytes. Each call
+#   draws on its own Figure/FigureCanvasAgg pair, so renders never share state and can run side by side
+# - render() hands a chart to a bounded pool of spawned worker processes (settings.CHART_RENDER_WORKERS) and returns a Future,
+#   so a report starts all of its charts up front and only waits for them when it places them in the PDF
+# - With CHART_RENDER_WORKERS = 0 charts are drawn right away in the calling thread (tests, debugging)
+
+BAR_COLOR = '#2b7fff'  # Deeper blue color
+BOX_COLOR = '#2b7fff'  # Deep navy blue box background
+MEDIAN_COLOR = '#f82001'
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+# START - Renderers
+def _new_figure(figsize):
+   """
+   Returns a fresh figure with its own Agg canvas attached.
+   """
+   figure = Figure(figsize=figsize)
+   FigureCanvasAgg(figure)
+   return figure
+
+
+def _to_png(figure, dpi=None):
+   """
+   Returns the figure as PNG bytes.
+   """
+   image = BytesIO()
+   figure.savefig(image, format='png', bbox_inches='tight', dpi=dpi or 'figure')
+   return image.getvalue()
+
+
+def _no_data(ax, title):
+   """
+   Turns the axes into an empty plot with a message.
+   """
+   ax.text(0.5, 0.5, "No Data Available", fontsize=14, ha='center', va='center', transform=ax.transAxes)
+   ax.set_xticks([])
+   ax.set_yticks([])
+   ax.set_frame_on(False)
+   ax.set_title(title)
+
+
+def bar_chart(data, title, xlabel, ylabel, whole_number_ticks=False):
+   """
+   Purpose: Draws a bar chart of averages (0 to 100).
+   Args:
+      data (dict): {label: average}, drawn in the dictionary's order
+      whole_number_ticks (bool): Puts a tick on every whole number between the smallest and largest label (numeric labels, e.g. CLO designations)
+   Returns:
+      bytes: The chart as a PNG
+   """
+   figure = _new_figure((6, 4))
+   ax = figure.add_subplot()
+   if data:
+      ax.bar(list(data.keys()), list(data.values()), color=BAR_COLOR)
+      ax.set_xlabel(xlabel)
+      ax.set_ylabel(ylabel)
+      ax.set_ylim(0, 100)  # Set y-axis range from 0 to 100
+      ax.set_title(title)
+      if whole_number_ticks:
+         x_ticks = sorted(int(x) for x in data.keys())
+         ax.set_xticks(np.arange(min(x_ticks), max(x_ticks) + 1, 1))
+   else:  # If there's no data, create an empty plot with a message
+      _no_data(ax, title)
+   return _to_png(figure)
+
+
+def box_plot(groups, labels, title, xlabel, figsize):
+   """
+   Purpose: Draws a box plot of student average grades (0 to 100), one box per group.
+   Args:
+      groups (list): A list of grades for every box
+      labels (list | None): The x-axis label of every box, None hides the x-axis ticks
+   Returns:
+      bytes: The chart as a PNG
+   """
+   figure = _new_figure(figsize)
+   ax = figure.add_subplot()
+   if groups:
+      boxplot = ax.boxplot(groups, patch_artist=True)
+
+      # Style Stuff
+      for box in boxplot['boxes']:
+         box.set(facecolor=BOX_COLOR)
+      for median in boxplot['medians']:
+         median.set(linewidth=3, color=MEDIAN_COLOR)  # Thicker median line
+
+      if labels:
+         ax.set_xticks(range(1, len(labels) + 1), labels)
+      else:
+         ax.set_xticks([])  # Remove x-axis ticks completely
+      ax.set_ylabel("Average Grade (%)")
+      ax.set_ylim(0, 100)  # Ensure y-axis runs from 0% to 100%
+      ax.set_title(title)
+   else:  # If there's no data, create an empty plot with a message
+      _no_data(ax, title)
+   ax.set_xlabel(xlabel)
+   return _to_png(figure)
+
+
+def heatmap(matrix, xticklabels, yticklabels, title, xlabel, ylabel):
+   """
+   Purpose: Draws a blue-themed heatmap of performance scores (0 to 100), NaN cells are shown as "N/A".
+   Args:
+      matrix (list): Rows of scores, one row per y-axis label
+   Returns:
+      bytes: The chart as a high resolution (300 DPI) PNG
+   """
+   # Create annotations for values and "N/A" for missing data
+   annotations = [["N/A" if np.isnan(value) else f"{value:.1f}%" for value in row] for row in matrix]
+
+   # The seaborn theme is only applied while this chart is drawn, it does not leak into the other charts
+   with sns.axes_style("whitegrid"), sns.plotting_context("notebook"):
+      figure = _new_figure((12, 8))
+      ax = figure.add_subplot()
+      sns.heatmap(
+         matrix,
+         cmap="Blues",
+         annot=annotations,
+         fmt="",
+         cbar=True,
+         cbar_kws={'label': 'Performance Score (%)'},
+         xticklabels=xticklabels,
+         yticklabels=yticklabels,
+         vmin=0,
+         vmax=100,
+         linewidths=0.5,
+         linecolor='#cccccc',
+         ax=ax,
+      )
+
+      # Enhance visual styling
+      ax.set_title(title, fontsize=20, pad=20)
+      ax.set_xlabel(xlabel, fontsize=15)
+      ax.set_ylabel(ylabel, fontsize=18)
+      for label in ax.get_xticklabels():
+         label.set(rotation=20, ha='right', fontsize=15)
+      for label in ax.get_yticklabels():
+         label.set(rotation=0, fontsize=15)
+
+      # Add custom colorbar label
+      ax.collections[0].colorbar.set_label('Performance Score (%)', rotation=270, labelpad=20)
+
+      figure.tight_layout()
+      return _to_png(figure, dpi=300)
+# STOP - Renderers
+
+
+# START - Render Pool
+def get_pool():
+   """
+   Returns the shared chart rendering pool, creating it on first use (None when charts are drawn in the calling thread).
+   """
+   global _pool
+   if settings.CHART_RENDER_WORKERS <= 0:
+      return None
+   with _pool_lock:
+      if _pool is None:
+         _pool = ProcessPoolExecutor(max_workers=settings.CHART_RENDER_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+      return _pool
+
+
+def render(renderer, *args, **kwargs):
+   """
+   Purpose: Starts drawing a chart.
+   Args:
+      renderer (callable): bar_chart, box_plot or heatmap
+      *args, **kwargs: The renderer's arguments
+   Returns:
+      Future: Resolves to the chart's PNG bytes, pass it to image() once the chart is needed
+   """
+   global _pool
+   pool = get_pool()
+   if pool is not None:
+      try:
+         return pool.submit(renderer, *args, **kwargs)
+      except BrokenExecutor:  # A worker died (e.g. killed for memory), drop the pool and draw this chart here
+         with _pool_lock:
+            _pool = None
+
+   future = Future()
+   try:
+      future.set_result(renderer(*args, **kwargs))
+   except Exception as e:
+      future.set_exception(e)
+   return future
+
+
+def image(chart):
+   """
+   Waits for a chart started with render() and returns it as an in-memory PNG, ready for ReportLab's Image.
+   """
+   return BytesIO(chart.result())
+# STOP - Render Pool
@@ -0,0 +1,622 @@
+# API App ingestion.py
+
+import codecs
+import csv
+import re
+from collections import defaultdict
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+
+from .models import * # Import models
+from .serializers import EmbeddedTaskSerializer, EvaluationInstrumentSerializer
+from .bulk import BATCH_SIZE, existing_pks, fill_created_pks, schedule_refresh # Shared bulk write helpers, bulk_create() sends no signals
+from .report_cache import schedule_data_version_bump # Moves the reports' data version forward
+
+
+# NOTE:
+# - This is the batched write path for gradebooks: rows are validated and built in memory, the lookups they need are done
+#   with one query per model, and everything is written with bulk_create() in chunks of BATCH_SIZE rows
+# - bulk_create() does not send post_save, so every function here schedules the rollup refresh and the data version bump
+#   itself (once per call, both run when the surrounding transaction commits)
+# - Bad input raises IngestionError before anything is written for that step, callers run inside transaction.atomic() so a
+#   failure leaves nothing behind
+# - Gradebook files (import_gradebook_file) are the exception: they are read as a stream and committed IMPORT_CHUNK_ROWS students
+#   at a time, bad rows are skipped and reported instead of failing the whole import
+# - Background ingestion jobs (see ingestion_jobs.py) also commit IMPORT_CHUNK_ROWS students at a time, a JSON gradebook is
+#   checked row by row before anything is written (ingest_gradebook_in_chunks)
+# - upsert_scores() is the re-upload path: already graded student/task pairs get their new score in the same bulk statement
+# - create_courses() onboards whole accreditation versions: every course, CLO and PLO-CLO mapping of the batch is validated
+#   first (foreign keys against ID sets fetched with one query per model) and only then written, all in one transaction
+
+IMPORT_CHUNK_ROWS = 200  # Students per transaction when importing a gradebook file
+
+
+class IngestionError(Exception):
+   """
+   Raised for input that cannot be ingested. detail is the body of the API's 400 response: {"error": message}, or the
+   serializer errors of the offending row.
+   """
+   def __init__(self, detail):
+      super().__init__(detail)
+      self.detail = detail if isinstance(detail, dict) else {"error": detail}
+
+
+# START - Evaluation Instrument Gradebook
+def create_tasks(instrument, tasks):
+   """
+   Purpose: Creates an evaluation instrument's tasks.
+   Args:
+      instrument (EvaluationInstrument): The instrument the tasks belong to
+      tasks (list): Validated EmbeddedTaskSerializer data
+   Returns:
+      list: The created EmbeddedTask objects, in the order of tasks
+   """
+   task_objects = [
+      EmbeddedTask(evaluation_instrument=instrument, task_number=task["task_number"], task_text=task.get("task_text"))
+      for task in tasks
+   ]
+   EmbeddedTask.objects.bulk_create(task_objects, batch_size=BATCH_SIZE)
+   return fill_created_pks(EmbeddedTask, task_objects, evaluation_instrument=instrument)
+
+
+def create_task_clo_mappings(task_id_map, clo_mappings):
+   """
+   Purpose: Maps tasks to CLOs, every CLO ID is checked with a single query.
+   Args:
+      task_id_map (dict): {task_number: embedded_task_id}, keyed the way the request sent the task numbers
+      clo_mappings (list): [{"task_number": ..., "cloIds": [...]}, ...]
+   Returns:
+      int: The number of mappings created
+   """
+   pairs = []
+   for mapping_data in clo_mappings:
+      task_number = mapping_data.get("task_number")
+      if task_number not in task_id_map:
+         raise IngestionError(f"Task {task_number} does not exist.")
+      pairs.extend((task_id_map[task_number], clo_id) for clo_id in mapping_data.get("cloIds") or [])
+
+   existing_clo_ids = {
+      str(clo_id) for clo_id in CourseLearningObjective.objects.filter(clo_id__in={clo_id for _, clo_id in pairs}).values_list("clo_id", flat=True)
+   }
+   mappings = {}  # {(task_id, clo_id): TaskCLOMapping}, a pair listed twice is only mapped once
+   for task_id, clo_id in pairs:
+      if str(clo_id) not in existing_clo_ids:
+         raise IngestionError(f"CLO with ID {clo_id} does not exist.")
+      mappings.setdefault((task_id, int(clo_id)), TaskCLOMapping(task_id=task_id, clo_id=int(clo_id)))
+
+   TaskCLOMapping.objects.bulk_create(mappings.values(), batch_size=BATCH_SIZE)
+   return len(mappings)
+
+
+def create_missing_students(students):
+   """
+   Purpose: Creates the students of a gradebook that do not exist yet (looked up by email with one query), existing students are left untouched.
+   Args:
+      students (list): [{"username": email, "firstName": ..., "lastName": ...}, ...]
+   Returns:
+      int: The number of students created
+   """
+   new_students = {}  # {email: Student}, the first entry of an email wins (like get_or_create)
+   for student_data in students:
+      email = student_data.get("username", "")
+      if not email:
+         raise IngestionError("Invalid student data")
+      new_students.setdefault(email, Student(email=email, first_name=student_data.get("firstName", ""), last_name=student_data.get("lastName", "")))
+
+   return _create_students(new_students)
+
+
+def _create_students(new_students):
+   """
+   Inserts the students of {email: Student} whose email is not taken yet, returns how many were inserted.
+   """
+   existing_emails = set()
+   emails = list(new_students)
+   for start in range(0, len(emails), BATCH_SIZE):
+      existing_emails.update(Student.objects.filter(email__in=emails[start:start + BATCH_SIZE]).values_list("email", flat=True))
+
+   created = [student for email, student in new_students.items() if email not in existing_emails]
+   Student.objects.bulk_create(created, batch_size=BATCH_SIZE)
+   return len(created)
+
+
+def create_scores(task_id_map, students):
+   """
+   Purpose: Writes a gradebook's scores (one StudentTaskMapping row per student and task).
+   Args:
+      task_id_map (dict): {task_number: embedded_task_id}, scores refer to tasks by str(taskId)
+      students (list): [{"username": email, "tasks": [{"taskId": ..., "manualScore": ..., "possiblePoints": ...}, ...]}, ...]
+   Returns:
+      int: The number of scores written
+   """
+   scores = []
+   for student_data in students:
+      for task_data in student_data["tasks"]:
+         task_id = task_id_map.get(str(task_data["taskId"]))
+         if not task_id:
+            raise IngestionError(f"Task {task_data['taskId']} of student {student_data['username']} does not exist.")
+         scores.append(StudentTaskMapping(
+            student_id=student_data["username"],
+            task_id=task_id,
+            score=task_data.get("manualScore", None),
+            total_possible_score=task_data.get("possiblePoints", None),
+         ))
+   StudentTaskMapping.objects.bulk_create(scores, batch_size=BATCH_SIZE)
+   return len(scores)
+
+
+def upsert_scores(scores):
+   """
+   Purpose: Writes gradebook rows, correcting the score of every student/task pair that is already graded instead of failing
+            on the unique_student_task constraint. Unchanged rows are not written at all, the rest go out as
+            INSERT ... ON CONFLICT (student, task) DO UPDATE statements.
+   Args:
+      scores (list): Unsaved StudentTaskMapping objects, when a student/task pair is listed twice the last one wins
+   Returns:
+      dict: {"inserted": n, "updated": n, "unchanged": n}
+   """
+   rows = {(score.student_id, score.task_id): score for score in scores}
+   task_ids = {task_id for _, task_id in rows}
+   emails = list({email for email, _ in rows})
+
+   existing = {}  # {(student, task): (score, total_possible_score)}
+   for start in range(0, len(emails), BATCH_SIZE):
+      for email, task_id, score, total_possible_score in StudentTaskMapping.objects.filter(student__in=emails[start:start + BATCH_SIZE], task__in=task_ids).values_list("student_id", "task_id", "score", "total_possible_score"):
+         existing[(email, task_id)] = (score, total_possible_score)
+
+   counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+   changed = []
+   for key, row in rows.items():
+      if key not in existing:
+         counts["inserted"] += 1
+      elif existing[key] != (row.score, row.total_possible_score):
+         counts["updated"] += 1
+      else:
+         counts["unchanged"] += 1
+         continue
+      changed.append(row)
+
+   StudentTaskMapping.objects.bulk_create(
+      changed,
+      batch_size=BATCH_SIZE,
+      update_conflicts=True,
+      unique_fields=["student", "task"],
+      update_fields=["score", "total_possible_score"],
+   )
+   if changed:
+      schedule_refresh(StudentTaskMapping, {row.task_id for row in changed})
+   return counts
+
+
+def ingest_gradebook(instrument, tasks, clo_mappings, students):
+   """
+   Purpose: Writes a new evaluation instrument's tasks, their CLO mappings, any new students and every score in a handful of bulk INSERTs.
+   Args:
+      instrument (EvaluationInstrument): The freshly created instrument
+      tasks (list): [{"task_number": ..., "task_text": ...}, ...]
+      clo_mappings (list): [{"task_number": ..., "cloIds": [...]}, ...]
+      students (list): The gradebook, see create_scores()
+   Returns:
+      dict: {task_number: embedded_task_id}, keyed by the task numbers exactly as they were sent
+   """
+   task_id_map = _create_instrument_tasks(instrument, tasks, clo_mappings)
+   create_missing_students(students)
+   create_scores(task_id_map, students)
+
+   schedule_refresh(StudentTaskMapping, task_id_map.values())  # Also refreshes the CLO/PLO rollups of the tasks' section
+   return task_id_map
+
+
+def _create_instrument_tasks(instrument, tasks, clo_mappings):
+   """
+   Validates and creates a new instrument's tasks and maps them to their CLOs, returns {task_number: embedded_task_id}.
+   """
+   task_serializer = EmbeddedTaskSerializer(data=[dict(task, evaluation_instrument=instrument.pk) for task in tasks], many=True)
+   if not task_serializer.is_valid():
+      raise IngestionError(next(errors for errors in task_serializer.errors if errors))  # The first task that failed
+   task_objects = create_tasks(instrument, task_serializer.validated_data)
+   task_id_map = {task["task_number"]: task_object.embedded_task_id for task, task_object in zip(tasks, task_objects)}
+   create_task_clo_mappings(task_id_map, clo_mappings)
+   return task_id_map
+
+
+def ingest_gradebook_in_chunks(instrument_data, tasks, clo_mappings, students, progress=None):
+   """
+   Purpose: Background job version of EvaluationInstrumentListCreate.post() (see ingestion_jobs.py). Every student row is checked
+            first, then the instrument, its tasks and CLO mappings are written in one short transaction and the students and scores
+            IMPORT_CHUNK_ROWS rows at a time, each chunk in its own transaction, so the write lock is never held for the whole import.
+            If a chunk fails to write, the instrument is deleted again, taking the scores written so far with it.
+   Args:
+      instrument_data (dict): The request's instrumentInfo
+      tasks, clo_mappings, students: See ingest_gradebook()
+      progress (callable): Called as progress(rows_validated, rows_written) as the rows are checked and after every chunk
+   Returns:
+      dict: The created instrument's ID and how many tasks, students and scores were created
+   Raises:
+      IngestionError: Bad input, nothing was written
+   """
+   progress = progress or (lambda rows_validated, rows_written: None)
+   task_numbers = {task.get("task_number") for task in tasks or [] if isinstance(task, dict)}
+   for index, student_data in enumerate(students):  # The same checks create_missing_students() and create_scores() make
+      if not isinstance(student_data, dict) or not student_data.get("username"):
+         raise IngestionError("Invalid student data")
+      for task_data in student_data.get("tasks") or []:
+         if str(task_data.get("taskId")) not in task_numbers:
+            raise IngestionError(f"Task {task_data.get('taskId')} of student {student_data['username']} does not exist.")
+      if (index + 1) % IMPORT_CHUNK_ROWS == 0:
+         progress(index + 1, 0)
+   progress(len(students), 0)
+
+   with transaction.atomic():
+      instrument_serializer = EvaluationInstrumentSerializer(data=instrument_data)
+      if not instrument_serializer.is_valid():
+         raise IngestionError(instrument_serializer.errors)
+      instrument = instrument_serializer.save()
+      task_id_map = _create_instrument_tasks(instrument, tasks, clo_mappings)
+
+   result = {"evaluation_instrument_id": instrument.pk, "tasks_created": len(task_id_map), "students_created": 0, "scores_created": 0}
+   try:
+      for start in range(0, len(students), IMPORT_CHUNK_ROWS):
+         chunk = students[start:start + IMPORT_CHUNK_ROWS]
+         with transaction.atomic():
+            result["students_created"] += create_missing_students(chunk)
+            result["scores_created"] += create_scores(task_id_map, chunk)
+         progress(len(students), start + len(chunk))
+   except Exception:
+      instrument.delete()  # Cascades to the tasks and scores, post_delete keeps the rollups current (see signals.py)
+      raise
+
+   schedule_refresh(StudentTaskMapping, task_id_map.values())
+   return result
+# STOP - Evaluation Instrument Gradebook
+
+
+# START - Gradebook Files
+EMAIL_HEADERS = {"email", "username", "student", "studentemail"}  # Accepted names of the email column (case, spaces and underscores ignored)
+FIRST_NAME_HEADERS = {"firstname", "first"}
+LAST_NAME_HEADERS = {"lastname", "last"}
+POINTS_POSSIBLE = "pointspossible"
+
+
+def _normalized(cell):
+   if isinstance(cell, float) and cell.is_integer():  # Excel stores "3" as 3.0
+      cell = int(cell)
+   return re.sub(r"[\s_\-]", "", str(cell)).lower()
+
+
+def _cell(row, column):
+   return row[column] if column is not None and column < len(row) else ""
+
+
+def _number(cell):
+   """
+   Returns the cell as a float, None for a blank cell. Raises ValueError for anything else.
+   """
+   if isinstance(cell, (int, float)):
+      return float(cell)
+   cell = str(cell).strip()
+   return float(cell) if cell else None
+
+
+def read_gradebook_rows(uploaded_file):
+   """
+   Purpose: Yields the rows of an uploaded gradebook (lists of cell values) one at a time, the file is never loaded whole.
+   Args:
+      uploaded_file (UploadedFile): A .csv (UTF-8) or .xlsx file, large uploads are already spooled to disk by Django
+   """
+   name = uploaded_file.name.lower()
+   if name.endswith(".csv"):
+      yield from csv.reader(codecs.iterdecode(uploaded_file, "utf-8-sig"))
+   elif name.endswith(".xlsx"):
+      try:
+         import openpyxl  # Only needed for Excel uploads
+      except ImportError:
+         raise IngestionError("Excel gradebooks need the openpyxl package on the server, upload a CSV export instead.")
+      workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)  # read_only streams the sheet
+      try:
+         for row in workbook.active.iter_rows(values_only=True):
+            yield ["" if cell is None else cell for cell in row]
+      finally:
+         workbook.close()
+   else:
+      raise IngestionError("Unsupported file type, upload a .csv or .xlsx gradebook.")
+
+
+def _parse_header(header, instrument):
+   """
+   Returns the email column, the first/last name columns (None when missing), {column: EmbeddedTask} and the ignored headers.
+   A task column is any header ending in one of the instrument's task numbers ("3", "Task 3", "Q3").
+   """
+   tasks = {}
+   for task in EmbeddedTask.objects.filter(evaluation_instrument=instrument).order_by("pk"):
+      tasks.setdefault(task.task_number, task)
+
+   email_column = first_name_column = last_name_column = None
+   task_columns, ignored, unknown_tasks = {}, [], []
+   for column, cell in enumerate(header):
+      name = _normalized(cell)
+      if not name:
+         continue
+      if name in EMAIL_HEADERS:
+         email_column = column
+      elif name in FIRST_NAME_HEADERS:
+         first_name_column = column
+      elif name in LAST_NAME_HEADERS:
+         last_name_column = column
+      elif re.search(r"\d+$", name):
+         task_number = int(re.search(r"\d+$", name).group())
+         if task_number in tasks:
+            task_columns[column] = tasks[task_number]
+         else:
+            unknown_tasks.append(str(cell))
+      else:
+         ignored.append(str(cell))  # Other columns of the export (section, totals...)
+
+   if email_column is None:
+      raise IngestionError("The header row needs an email column.")
+   if unknown_tasks:
+      raise IngestionError(f"These columns do not match a task of the evaluation instrument: {', '.join(unknown_tasks)}")
+   if not task_columns:
+      raise IngestionError("The header row has no task columns.")
+   return email_column, first_name_column, last_name_column, task_columns, ignored
+
+
+def _write_gradebook_chunk(chunk, total_possible, report, upsert):
+   """
+   Writes one chunk of parsed gradebook rows in its own transaction. Without upsert, students that already have scores
+   on the instrument are skipped and reported; with it, their scores are corrected (see upsert_scores()).
+   """
+   with transaction.atomic():
+      taken = defaultdict(list)  # {email: [task numbers already graded]}
+      if not upsert:
+         for email, task_number in StudentTaskMapping.objects.filter(student__in=[row[1] for row in chunk], task__in=total_possible).values_list("student_id", "task__task_number"):
+            taken[email].append(task_number)
+
+      new_students, scores = {}, []
+      for row_number, email, first_name, last_name, row_scores in chunk:
+         if email in taken:
+            report["errors"].append({"row": row_number, "error": f"{email} already has scores for task(s) {', '.join(map(str, sorted(taken[email])))} of this evaluation instrument."})
+            continue
+         new_students[email] = Student(email=email, first_name=first_name, last_name=last_name)
+         scores.extend(
+            StudentTaskMapping(student_id=email, task_id=task_id, score=score, total_possible_score=total_possible[task_id])
+            for task_id, score in row_scores.items()
+         )
+         report["imported_rows"] += 1
+
+      report["students_created"] += _create_students(new_students)
+      if upsert:
+         counts = upsert_scores(scores)
+         report["scores_created"] += counts["inserted"]
+         report["scores_updated"] += counts["updated"]
+         report["scores_unchanged"] += counts["unchanged"]
+      else:
+         StudentTaskMapping.objects.bulk_create(scores, batch_size=BATCH_SIZE)
+         report["scores_created"] += len(scores)
+         if scores:
+            schedule_refresh(StudentTaskMapping, {score.task_id for score in scores})
+
+
+def import_gradebook_file(instrument, uploaded_file, upsert=False, progress=None):
+   """
+   Purpose: Imports a gradebook export into an existing evaluation instrument.
+   The first row is the header (an email column, optional first/last name columns and one column per task), the second row
+   gives every task's points possible (its email cell reads "Points Possible") and every other row is one student.
+   Blank score cells are left ungraded. Students that do not exist yet are created.
+   Args:
+      instrument (EvaluationInstrument): The instrument the tasks belong to
+      uploaded_file (UploadedFile): See read_gradebook_rows()
+      upsert (bool): Re-upload mode, scores that already exist are corrected instead of their rows being skipped
+      progress (callable): Called with the report after every chunk that was written
+   Returns:
+      dict: How many rows were read and imported, students and scores created, the ignored columns and an error for every skipped row
+   Raises:
+      IngestionError: The file cannot be imported at all (nothing was written)
+   """
+   rows = read_gradebook_rows(uploaded_file)
+   try:
+      header = next(rows, None)
+      if header is None:
+         raise IngestionError("The file is empty.")
+      email_column, first_name_column, last_name_column, task_columns, ignored = _parse_header(header, instrument)
+
+      points_row = next(rows, None)
+      if points_row is None or _normalized(_cell(points_row, email_column)) != POINTS_POSSIBLE:
+         raise IngestionError('The second row must be the "Points Possible" row.')
+      total_possible = {}
+      for column, task in task_columns.items():
+         try:
+            total_possible[task.pk] = _number(_cell(points_row, column))
+         except ValueError:
+            total_possible[task.pk] = None
+         if total_possible[task.pk] is None:
+            raise IngestionError(f"The points possible of task {task.task_number} is not a number.")
+   except (UnicodeDecodeError, csv.Error):
+      raise IngestionError("The file could not be read, CSV gradebooks must be UTF-8 encoded.")
+
+   report = {
+      "evaluation_instrument_id": instrument.evaluation_instrument_id,
+      "rows": 0,
+      "imported_rows": 0,
+      "students_created": 0,
+      "scores_created": 0,
+      "scores_updated": 0,
+      "scores_unchanged": 0,
+      "ignored_columns": ignored,
+      "errors": [],
+   }
+   chunk, seen_emails = [], set()
+   row_number = 2
+   try:
+      for row_number, row in enumerate(rows, start=3):
+         if not any(str(cell).strip() for cell in row):
+            continue  # Blank line
+         report["rows"] += 1
+
+         email = str(_cell(row, email_column)).strip()
+         if not email:
+            report["errors"].append({"row": row_number, "error": "Missing student email."})
+            continue
+         if email in seen_emails:
+            report["errors"].append({"row": row_number, "error": f"{email} is listed more than once."})
+            continue
+         seen_emails.add(email)
+
+         row_scores, bad_cells = {}, []
+         for column, task in task_columns.items():
+            try:
+               score = _number(_cell(row, column))
+            except ValueError:
+               bad_cells.append(f"task {task.task_number} ({_cell(row, column)!r})")
+               continue
+            if score is not None:
+               row_scores[task.pk] = score
+         if bad_cells:
+            report["errors"].append({"row": row_number, "error": f"Scores are not numbers: {', '.join(bad_cells)}."})
+            continue
+
+         chunk.append((row_number, email, str(_cell(row, first_name_column)).strip(), str(_cell(row, last_name_column)).strip(), row_scores))
+         if len(chunk) >= IMPORT_CHUNK_ROWS:
+            _write_gradebook_chunk(chunk, total_possible, report, upsert)
+            chunk = []
+            if progress:
+               progress(report)
+   except (UnicodeDecodeError, csv.Error) as e:  # The rows before this one are still imported
+      report["errors"].append({"row": row_number + 1, "error": f"The file could not be read past this row: {e}"})
+
+   if chunk:
+      _write_gradebook_chunk(chunk, total_possible, report, upsert)
+   if progress:
+      progress(report)
+   return report
+# STOP - Gradebook Files
+
+
+# START - Courses
+def _as_id(value):
+   """
+   Returns value as an integer primary key, None when it is not one.
+   """
+   try:
+      return int(value)
+   except (TypeError, ValueError):
+      return None
+
+
+def _field_errors(instance, exclude):
+   """
+   Runs the model's field validation (lengths, ranges...) without the foreign keys, returns the messages.
+   """
+   try:
+      instance.clean_fields(exclude=exclude)
+   except DjangoValidationError as e:
+      return [f"{field}: {' '.join(messages)}" for field, messages in e.message_dict.items()]
+   return []
+
+
+def _parse_course(item):
+   """
+   Turns one course of a batch ({"course": {...}, "clos": [...], "plo_clo_mappings": [...]}, the CourseListCreate.post body)
+   into unsaved objects. Returns (course, program ID, [CourseLearningObjective], [(CLO designation, PLO ID)], errors).
+   """
+   course_data = item.get("course") or {}
+   errors = []
+   for key, label in (("program", "program_id"), ("accreditationVersion", "accreditation_version"), ("courseNumber", "course_number"), ("courseName", "course_name"), ("description", "course_description")):
+      if not course_data.get(key):
+         errors.append(f"Missing {label}.")
+
+   course_number = _as_id(course_data.get("courseNumber"))
+   if course_data.get("courseNumber") and course_number is None:
+      errors.append("course_number must be an integer.")
+   course = Course(
+      a_version_id=_as_id(course_data.get("accreditationVersion")),
+      course_number=course_number,
+      name=course_data.get("courseName"),
+      description=course_data.get("description"),
+   )
+   if not errors:
+      errors.extend(_field_errors(course, exclude=["a_version"]))
+
+   clos, designations = [], set()
+   for index, clo_data in enumerate(item.get("clos") or []):
+      clo = CourseLearningObjective(designation=clo_data.get("designation"), description=clo_data.get("description"), created_by_id=_as_id(clo_data.get("created_by")))
+      clo_errors = _field_errors(clo, exclude=["course", "created_by"])
+      if clo.created_by_id is None:
+         clo_errors.append("created_by: This field is required.")
+      if str(clo.designation) in designations:
+         clo_errors.append(f"designation: CLO {clo.designation} is listed more than once.")
+      designations.add(str(clo.designation))
+      errors.extend(f"CLO {index + 1}: {error}" for error in clo_errors)
+      clos.append(clo)
+
+   mappings = []
+   for mapping_data in item.get("plo_clo_mappings") or []:
+      clo_designation, plo_id = mapping_data.get("cloDesignation"), _as_id(mapping_data.get("plo"))
+      if str(clo_designation) not in designations or plo_id is None:
+         errors.append("Invalid CLO-PLO mapping data.")
+      else:
+         mappings.append((str(clo_designation), plo_id))
+
+   return course, _as_id(course_data.get("program")), clos, mappings, errors
+
+
+def create_courses(items):
+   """
+   Purpose: Creates a batch of courses with their program mappings, CLOs and PLO-CLO mappings. Every item is validated before
+            anything is written, foreign keys are checked against one ID query per model, and the batch is written with one
+            bulk INSERT per table inside a single transaction, so either every course is created or none is.
+   Args:
+      items (list): CourseListCreate.post bodies, {"course": {...}, "clos": [...], "plo_clo_mappings": [...]}
+   Returns:
+      tuple: (results, created), results holds one entry per item in order:
+             {"index": i, "course_id": ..., "clo_ids": {designation: clo_id}} once created, {"index": i, "errors": [...]} otherwise
+   """
+   parsed = [_parse_course(item) for item in items]
+
+   # Every foreign key of the batch, checked with one query per model
+   programs = existing_pks(Program, [program_id for _, program_id, _, _, _ in parsed])
+   versions = existing_pks(AccreditationVersion, [course.a_version_id for course, _, _, _, _ in parsed])
+   plos = existing_pks(ProgramLearningObjective, [plo_id for _, _, _, mappings, _ in parsed for _, plo_id in mappings])
+   users = existing_pks(User, [clo.created_by_id for _, _, clos, _, _ in parsed for clo in clos])
+
+   results, valid = [], True
+   for index, (course, program_id, clos, mappings, errors) in enumerate(parsed):
+      if program_id is not None and program_id not in programs:
+         errors.append(f"Program {program_id} does not exist.")
+      if course.a_version_id is not None and course.a_version_id not in versions:
+         errors.append(f"Accreditation version {course.a_version_id} does not exist.")
+      errors.extend(f"User {user_id} does not exist." for user_id in sorted({clo.created_by_id for clo in clos} - users - {None}))
+      errors.extend(f"PLO {plo_id} does not exist." for plo_id in sorted({plo_id for _, plo_id in mappings} - plos))
+      results.append({"index": index, "errors": errors})
+      valid = valid and not errors
+   if not valid:
+      return results, False
+
+   with transaction.atomic():
+      courses = [course for course, _, _, _, _ in parsed]
+      Course.objects.bulk_create(courses, batch_size=BATCH_SIZE)
+      fill_created_pks(Course, courses)
+      ProgramCourseMapping.objects.bulk_create(
+         [ProgramCourseMapping(program_id=program_id, course=course) for course, program_id, _, _, _ in parsed], batch_size=BATCH_SIZE
+      )
+
+      all_clos = []
+      for course, _, clos, _, _ in parsed:
+         for clo in clos:
+            clo.course = course
+            all_clos.append(clo)
+      CourseLearningObjective.objects.bulk_create(all_clos, batch_size=BATCH_SIZE)
+      fill_created_pks(CourseLearningObjective, all_clos)
+
+      plo_clo_mappings = {}  # {(plo_id, clo_id): PLOCLOMapping}, a pair listed twice is only mapped once
+      for index, (course, _, clos, mappings, _) in enumerate(parsed):
+         clo_ids = {str(clo.designation): clo.clo_id for clo in clos}
+         for designation, plo_id in mappings:
+            plo_clo_mappings.setdefault((plo_id, clo_ids[designation]), PLOCLOMapping(plo_id=plo_id, clo_id=clo_ids[designation]))
+         results[index] = {"index": index, "course_id": course.course_id, "clo_ids": clo_ids}
+      PLOCLOMapping.objects.bulk_create(plo_clo_mappings.values(), batch_size=BATCH_SIZE)
+
+      # New CLOs have no tasks yet, so no rollup depends on them, only the reports' data version moves
+      schedule_data_version_bump()
+   return results, True
+# STOP - Courses
@@ -0,0 +1,175 @@
+# API App ingestion_jobs.py
+
+import json
+import logging
+import os
+import threading
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.files import File
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import * # Import models
+from . import ingestion # The chunked write paths the jobs run
+
+
+# NOTE:
+# - Large gradebooks can be imported as jobs instead of inside the upload request: POST evaluation-instruments/?background=true
+#   or evaluation-instruments/<pk>/gradebook/?background=true -> poll ingestion-jobs/<pk>/ for progress, final counts and errors
+# - Works like report_jobs.py: the IngestionJob table is the queue, a job is handed to the worker pool once its row is committed
+#   and only runs after being moved from 'queued' to 'running'. Leftover queued jobs: python manage.py run_ingestion_jobs
+# - Unlike report jobs, a job whose worker died mid-import is not run again: the chunks it committed are kept, so run_ingestion_jobs
+#   fails it instead once it has been running for longer than settings.INGESTION_JOB_STALE_SECONDS (rows_written tells how far it got)
+# - Jobs write IMPORT_CHUNK_ROWS students per transaction (see ingestion.py), so on SQLite other requests get the write lock
+#   between chunks instead of waiting for the whole import
+# - The pool is picked with settings.INGESTION_JOB_EXECUTOR / INGESTION_JOB_WORKERS:
+#     thread: worker threads inside the web server process (imports are database bound, one worker keeps SQLite writers in line)
+#     inline: the job runs right away in the calling thread (tests, debugging)
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+   """
+   Returns the shared worker pool, creating it on first use.
+   """
+   global _executor
+   with _executor_lock:
+      if _executor is None:
+         _executor = ThreadPoolExecutor(max_workers=max(1, settings.INGESTION_JOB_WORKERS), thread_name_prefix="ingestion-job")
+      return _executor
+
+
+def enqueue_ingestion_job(job):
+   """
+   Purpose: Hands a queued job to the worker pool once the transaction that created it commits.
+   """
+   if settings.INGESTION_JOB_EXECUTOR == "inline":
+      transaction.on_commit(lambda: run_ingestion_job(job.pk))
+   else:
+      transaction.on_commit(lambda: _submit(job.pk))
+
+
+def _submit(job_id):
+   try:
+      get_executor().submit(run_ingestion_job, job_id)
+   except Exception:  # The job stays queued, run_ingestion_jobs will pick it up
+      logger.exception("Could not hand ingestion job %s to the worker pool", job_id)
+
+
+def upload_path_for(job_id, file_name):
+   return os.path.join(settings.INGESTION_JOB_DIR, f"ingestion_job_{job_id}{os.path.splitext(file_name)[1].lower()}")
+
+
+def save_upload(job, uploaded_file):
+   """
+   Purpose: Copies an uploaded gradebook file next to its job, chunk by chunk (large uploads are already spooled to disk).
+   """
+   os.makedirs(settings.INGESTION_JOB_DIR, exist_ok=True)
+   job.upload_path = upload_path_for(job.pk, uploaded_file.name)
+   with open(job.upload_path, "wb") as destination:
+      for chunk in uploaded_file.chunks():
+         destination.write(chunk)
+   job.save(update_fields=["upload_path"])
+
+
+def _error_text(detail):
+   return detail["error"] if list(detail) == ["error"] else json.dumps(detail)  # Serializer errors are kept as JSON
+
+
+def run_ingestion_job(job_id):
+   """
+   Purpose: Runs a queued ingestion job, recording its progress and outcome on the job.
+   Returns:
+      bool: False if the job was not queued (already claimed by another worker or missing), True otherwise
+   """
+   try:
+      # Claim the job, only one worker can move it out of 'queued'
+      claimed = IngestionJob.objects.filter(pk=job_id, status="queued").update(status="running", started_at=timezone.now())
+      if not claimed:
+         return False
+
+      job = IngestionJob.objects.get(pk=job_id)
+      try:
+         result = _run_gradebook(job) if job.source == "gradebook" else _run_gradebook_file(job)
+      except ingestion.IngestionError as e:  # Bad input, nothing was written
+         IngestionJob.objects.filter(pk=job_id).update(status="failed", error=_error_text(e.detail), finished_at=timezone.now())
+         return True
+      except Exception as e:
+         logger.exception("Ingestion job %s failed", job_id)
+         IngestionJob.objects.filter(pk=job_id).update(status="failed", error=f"Import failed: {e}", finished_at=timezone.now())
+         return True
+      finally:
+         if job.upload_path and os.path.exists(job.upload_path):
+            os.remove(job.upload_path)  # Imported or not, the file is not needed anymore
+
+      IngestionJob.objects.filter(pk=job_id).update(status="succeeded", result=result, finished_at=timezone.now())
+      return True
+   finally:
+      if settings.INGESTION_JOB_EXECUTOR == "thread":
+         connection.close()  # Worker threads each hold their own connection, do not leak them
+
+
+def _run_gradebook(job):
+   def progress(rows_validated, rows_written):
+      IngestionJob.objects.filter(pk=job.pk).update(rows_validated=rows_validated, rows_written=rows_written)
+
+   payload = job.payload
+   result = ingestion.ingest_gradebook_in_chunks(payload["instrumentInfo"], payload.get("tasks"), payload["cloMappings"], payload["students"], progress)
+   IngestionJob.objects.filter(pk=job.pk).update(evaluation_instrument_id=result["evaluation_instrument_id"])
+   return result
+
+
+def _run_gradebook_file(job):
+   def progress(report):
+      IngestionJob.objects.filter(pk=job.pk).update(rows_validated=report["rows"], rows_written=report["imported_rows"])
+
+   if job.evaluation_instrument is None:
+      raise ingestion.IngestionError("The evaluation instrument was deleted before the import ran.")
+   with open(job.upload_path, "rb") as upload:
+      return ingestion.import_gradebook_file(
+         job.evaluation_instrument,
+         File(upload, name=job.payload.get("file_name", job.upload_path)),  # The file type is told by its name
+         upsert=job.payload.get("mode") == "upsert",
+         progress=progress,
+      )
+
+
+def fail_stale_ingestion_jobs():
+   """
+   Purpose: Fails the jobs that have been 'running' for longer than settings.INGESTION_JOB_STALE_SECONDS and drops their uploads.
+   Returns:
+      int: The number of jobs that were failed
+   """
+   cutoff = timezone.now() - timedelta(seconds=settings.INGESTION_JOB_STALE_SECONDS)
+   stale = IngestionJob.objects.filter(status="running", started_at__lt=cutoff)
+   upload_paths = [path for path in stale.values_list("upload_path", flat=True) if path]
+   failed = stale.update(
+      status="failed",
+      error="The import stopped before finishing (its worker was lost), the rows written up to then were kept.",
+      finished_at=timezone.now(),
+   )
+   for path in upload_paths:
+      if os.path.exists(path):
+         os.remove(path)
+   if failed:
+      logger.warning("Failed %s ingestion job(s) left running for over %s seconds", failed, settings.INGESTION_JOB_STALE_SECONDS)
+   return failed
+
+
+def run_queued_ingestion_jobs():
+   """
+   Purpose: Fails stale jobs, then runs every job that is still queued, oldest first, in the calling process.
+   Returns:
+      int: The number of jobs that were run
+   """
+   fail_stale_ingestion_jobs()
+   ran = 0
+   for job_id in IngestionJob.objects.filter(status="queued").order_by("created_at").values_list("pk", flat=True):
+      ran += run_ingestion_job(job_id)
+   return ran
@@ -0,0 +1,192 @@
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.models import *
+from api.views import EvaluationInstrumentListCreate, EvaluationInstrumentGradebookImport
+
+
+class _QueryCounter:
+   """
+   Database execute wrapper that counts the queries run through it.
+   """
+   def __init__(self):
+      self.count = 0
+
+   def __call__(self, execute, sql, params, many, context):
+      self.count += 1
+      return execute(sql, params, many, context)
+
+
+def build_dataset(courses, sections_per_course, students, seed=7):
+   """
+   Purpose: Creates a synthetic program (same shape as seed_regression_dataset() in api/tests.py, at any scale) to upload gradebooks into.
+   Half of the gradebook's students exist beforehand, the other half are created by the upload.
+   Returns:
+      tuple: (superuser, [(section, [clo_id, ...]), ...], [student_email, ...])
+   """
+   rng = random.Random(seed)
+   role = UserRole.objects.create(role_name="root")
+   user = User.objects.create_user("D00000001", "root@desu.edu", password=None, role=role, first_name="Root", last_name="User", is_superuser=True)
+   organization = AccreditationOrganization.objects.create(name="ABET", description="Accreditation Board")
+   version = AccreditationVersion.objects.create(a_organization=organization, year=2025)
+   plos = [ProgramLearningObjective.objects.create(a_version=version, designation=letter, description=f"PLO {letter}") for letter in "abcdef"]
+   program = Program.objects.create(designation="CSCI", description="Computer Science")
+   semester = Semester.objects.create(designation=202501)
+   EvaluationType.objects.create(type_name="Exam", description="desc")
+
+   sections = []
+   for course_index in range(courses):
+      course = Course.objects.create(a_version=version, course_number=100 + course_index, name=f"Course {course_index}", description="desc")
+      ProgramCourseMapping.objects.create(program=program, course=course)
+      clos = [CourseLearningObjective.objects.create(course=course, designation=designation, description=f"CLO {designation}", created_by=user) for designation in range(1, 5)]
+      PLOCLOMapping.objects.bulk_create([PLOCLOMapping(plo=plo, clo=clo) for clo in clos for plo in rng.sample(plos, 2)])
+      for section_index in range(sections_per_course):
+         section = Section.objects.create(course=course, section_number=f"{section_index + 1}", semester=semester, crn=f"{course_index}{section_index}", instructor=user)
+         sections.append((section, [clo.clo_id for clo in clos]))
+
+   emails = [f"student{index}@desu.edu" for index in range(students)]
+   Student.objects.bulk_create([Student(email=email, first_name="First", last_name="Last") for email in emails[:students // 2]])
+   return user, sections, emails
+
+
+def gradebook_scores(rng, emails, tasks):
+   return [[rng.randint(0, 10) for _ in range(tasks)] for _ in emails]
+
+
+class Command(BaseCommand):
+   """
+   Times gradebook uploads end to end (request parsing, validation, writes and the rollup refresh / data version bump that
+   run on commit) against a synthetic program built in a throwaway test database, and reports score rows per second,
+   queries per upload and the peak Python memory of one upload.
+   Paths:
+      json: EvaluationInstrumentListCreate.post(), the gradebook the frontend sends when an instrument is created
+      file: EvaluationInstrumentGradebookImport.post(), a CSV export uploaded into an existing instrument
+   Usage: python manage.py benchmark_ingestion [--path json] [--students 500] [--tasks 20] [--runs 5] [--on-disk] [--json]
+   """
+   help = "Benchmarks gradebook ingestion (rows per second, queries, peak memory) on synthetic data"
+
+   def add_arguments(self, parser):
+      parser.add_argument("--path", choices=["json", "file"], default="json", help="Which upload endpoint to benchmark")
+      parser.add_argument("--courses", type=int, default=4, help="Courses in the synthetic program (4 CLOs each)")
+      parser.add_argument("--sections", type=int, default=3, help="Sections per course, uploads go to a different section each run")
+      parser.add_argument("--students", type=int, default=500, help="Students per gradebook, half of them already exist")
+      parser.add_argument("--tasks", type=int, default=20, help="Tasks per gradebook")
+      parser.add_argument("--runs", type=int, default=5, help="Timed uploads after one warm-up upload, the median is reported")
+      parser.add_argument("--on-disk", action="store_true", help="Use a temporary SQLite file instead of an in-memory database")
+      parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+   def handle(self, *args, **options):
+      if connection.vendor == "sqlite" and options["on_disk"]:
+         handle, path = tempfile.mkstemp(suffix=".sqlite3")
+         os.close(handle)
+         connection.settings_dict["TEST"]["NAME"] = path
+      old_name = connection.settings_dict["NAME"]
+      connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)  # Never touches the real database
+      try:
+         with override_settings(DEBUG=False):  # No SQL log, it would count towards the memory peak
+            results = self.benchmark(options)
+      finally:
+         connection.creation.destroy_test_db(old_name, verbosity=0)
+
+      if options["json"]:
+         self.stdout.write(json.dumps(results, indent=3))
+         return
+      self.stdout.write(f"Path:                     {results['path']} ({results['database']})")
+      self.stdout.write(f"Gradebook:                {results['students']} students x {results['tasks']} tasks = {results['rows']} score rows")
+      self.stdout.write(f"Upload:                   {results['seconds'] * 1000:.1f} ms (median of {results['runs']}, min {results['min_seconds'] * 1000:.1f} ms)")
+      self.stdout.write(f"Throughput:               {results['rows_per_second']:,.0f} rows/s")
+      self.stdout.write(f"Queries per upload:       {results['queries']}")
+      self.stdout.write(f"Peak Python memory:       {results['peak_memory_mb']:.1f} MB")
+
+   def benchmark(self, options):
+      rng = random.Random(7)
+      user, sections, emails = build_dataset(options["courses"], max(1, options["sections"]), options["students"])
+      upload = self.post_gradebook if options["path"] == "json" else self.import_gradebook_file
+      samples = []
+      for run in range(max(1, options["runs"]) + 2):  # Warm-up, timed runs, then one run under tracemalloc
+         section, clo_ids = sections[run % len(sections)]
+         scores = gradebook_scores(rng, emails, options["tasks"])
+         traced = run == options["runs"] + 1
+         samples.append(self.measure(lambda: upload(user, section, clo_ids, emails, scores), traced))
+
+      timed = samples[1:-1]
+      seconds = statistics.median(sample["seconds"] for sample in timed)
+      rows = options["students"] * options["tasks"]
+      return {
+         "path": options["path"],
+         "database": f"{connection.vendor}, {'on disk' if options['on_disk'] else 'in memory'}",
+         "students": options["students"],
+         "tasks": options["tasks"],
+         "rows": rows,
+         "runs": len(timed),
+         "seconds": seconds,
+         "min_seconds": min(sample["seconds"] for sample in timed),
+         "rows_per_second": rows / seconds if seconds else 0,
+         "queries": statistics.median(sample["queries"] for sample in timed),
+         "peak_memory_mb": samples[-1]["peak_memory"] / (1024 * 1024),
+      }
+
+   def measure(self, upload, traced):
+      """
+      Returns the duration, query count and (when traced) the peak Python memory of one upload.
+      """
+      counter = _QueryCounter()
+      if traced:
+         tracemalloc.start()
+      try:
+         with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            response = upload()
+            seconds = time.perf_counter() - started
+         peak_memory = tracemalloc.get_traced_memory()[1] if traced else 0
+      finally:
+         if traced:
+            tracemalloc.stop()
+      if response.status_code not in (200, 201):
+         raise CommandError(f"Upload failed with {response.status_code}: {response.data}")
+      return {"seconds": seconds, "queries": counter.count, "peak_memory": peak_memory}
+
+   def post_gradebook(self, user, section, clo_ids, emails, scores):
+      tasks = len(scores[0])
+      payload = {
+         "instrumentInfo": {"section": section.pk, "name": "Final", "description": "desc", "evaluation_type": EvaluationType.objects.get().pk},
+         "tasks": [{"task_number": str(number), "task_text": f"Task {number}"} for number in range(1, tasks + 1)],
+         "cloMappings": [{"task_number": str(number), "cloIds": [clo_ids[number % len(clo_ids)]]} for number in range(1, tasks + 1)],
+         "students": [
+            {
+               "username": email,
+               "firstName": "New",
+               "lastName": "Student",
+               "tasks": [{"taskId": number, "manualScore": score, "possiblePoints": 10} for number, score in enumerate(student_scores, start=1)],
+            }
+            for email, student_scores in zip(emails, scores)
+         ],
+      }
+      request = APIRequestFactory().post("/api/evaluation-instruments/", payload, format="json")
+      force_authenticate(request, user=user)
+      return EvaluationInstrumentListCreate.as_view()(request).render()
+
+   def import_gradebook_file(self, user, section, clo_ids, emails, scores):
+      tasks = len(scores[0])
+      instrument = EvaluationInstrument.objects.create(section=section, evaluation_type=EvaluationType.objects.get(), name="Final", description="desc")
+      EmbeddedTask.objects.bulk_create([EmbeddedTask(evaluation_instrument=instrument, task_number=number, task_text=f"Task {number}") for number in range(1, tasks + 1)])
+      lines = [
+         ",".join(["Email", "First Name", "Last Name"] + [f"Task {number}" for number in range(1, tasks + 1)]),
+         ",".join(["Points Possible", "", ""] + ["10"] * tasks),
+      ]
+      lines += [",".join([email, "New", "Student"] + [str(score) for score in student_scores]) for email, student_scores in zip(emails, scores)]
+      upload = SimpleUploadedFile("gradebook.csv", "\n".join(lines).encode(), content_type="text/csv")
+      request = APIRequestFactory().post(f"/api/evaluation-instruments/{instrument.pk}/gradebook/", {"file": upload}, format="multipart")
+      force_authenticate(request, user=user)
+      return EvaluationInstrumentGradebookImport.as_view()(request, pk=instrument.pk).render()
@@ -0,0 +1,156 @@
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.models import *
+from api.views import CoursePerformance, StudentTaskMappingListCreate
+from .benchmark_ingestion import Command as IngestionBenchmark, build_dataset, gradebook_scores
+
+
+class Command(BaseCommand):
+   """
+   Runs parallel readers (gradebook pages and course performance numbers) while one writer uploads gradebooks, against a
+   temporary on-disk SQLite database, once with SQLite's defaults and once with the tuning profile (see api/sqlite_tuning.py).
+   Reports reader throughput and latency, "database is locked" errors and the writer's rows per second for both.
+   Usage: python manage.py benchmark_sqlite_concurrency [--readers 4] [--uploads 3] [--students 500] [--tasks 20] [--profile both] [--json]
+   """
+   help = "Benchmarks SQLite lock contention (parallel readers, one gradebook writer) with and without the tuning profile"
+
+   def add_arguments(self, parser):
+      parser.add_argument("--readers", type=int, default=4, help="Reader threads")
+      parser.add_argument("--uploads", type=int, default=3, help="Gradebooks the writer uploads, readers run until it is done")
+      parser.add_argument("--courses", type=int, default=4, help="Courses in the synthetic program (4 CLOs each)")
+      parser.add_argument("--students", type=int, default=500, help="Students per gradebook")
+      parser.add_argument("--tasks", type=int, default=20, help="Tasks per gradebook")
+      parser.add_argument("--profile", choices=["both", "default", "tuned"], default="both", help="Which SQLite settings to measure")
+      parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+   def handle(self, *args, **options):
+      if connection.vendor != "sqlite":
+         raise CommandError("This benchmark measures SQLite locking, the configured database is " + connection.vendor)
+      profiles = ["default", "tuned"] if options["profile"] == "both" else [options["profile"]]
+      results = [self.run_profile(profile, options) for profile in profiles]
+
+      if options["json"]:
+         self.stdout.write(json.dumps(results, indent=3))
+         return
+      for result in results:
+         self.stdout.write(f"Profile:                  {result['profile']} (journal_mode={result['journal_mode']})")
+         self.stdout.write(f"Reader requests:          {result['reads']} in {result['seconds']:.2f} s = {result['reads_per_second']:,.1f}/s ({result['readers']} threads)")
+         self.stdout.write(f"Reader latency:           p50 {result['read_p50_ms']:.1f} ms, p95 {result['read_p95_ms']:.1f} ms, max {result['read_max_ms']:.1f} ms")
+         self.stdout.write(f"Locked errors:            {result['locked_reads']} reads, {result['locked_writes']} writes")
+         self.stdout.write(f"Writer:                   {result['rows']} score rows at {result['rows_per_second']:,.0f} rows/s")
+         self.stdout.write("")
+
+   def run_profile(self, profile, options):
+      """
+      Builds a fresh on-disk database (journal_mode lives in the file) and measures one profile against it.
+      """
+      handle, path = tempfile.mkstemp(suffix=".sqlite3")
+      os.close(handle)
+      os.remove(path)
+      connection.settings_dict["TEST"]["NAME"] = path
+      old_name = connection.settings_dict["NAME"]
+      try:
+         with override_settings(SQLITE_TUNING=profile == "tuned", DEBUG=False, METRICS_CACHE_TIMEOUT=0):  # Readers always hit the database
+            connection.close()  # The next connection is opened with this profile's pragmas
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+               result = self.benchmark(options)
+               with connection.cursor() as cursor:
+                  cursor.execute("PRAGMA journal_mode")
+                  result["journal_mode"] = cursor.fetchone()[0]
+            finally:
+               connection.creation.destroy_test_db(old_name, verbosity=0)
+      finally:
+         for leftover in (path, path + "-wal", path + "-shm"):
+            if os.path.exists(leftover):
+               os.remove(leftover)
+      return {"profile": profile, **result}
+
+   def benchmark(self, options):
+      rng = random.Random(7)
+      user, sections, emails = build_dataset(options["courses"], 1, options["students"])
+      course_ids = list(Course.objects.values_list("pk", flat=True))
+      uploads = [(sections[run % len(sections)], gradebook_scores(rng, emails, options["tasks"])) for run in range(max(1, options["uploads"]))]
+
+      done = threading.Event()
+      latencies, locked, writer_seconds, failures = [], {"reads": 0, "writes": 0}, [], []
+      lock = threading.Lock()
+
+      def read(reader):
+         reader_rng = random.Random(reader)
+         factory = APIRequestFactory()
+         try:
+            while not done.is_set():
+               if reader_rng.random() < 0.5:
+                  request, view, kwargs = factory.get("/api/student-task-mappings/", {"page_size": 100}), StudentTaskMappingListCreate.as_view(), {}
+               else:
+                  request, view, kwargs = factory.get("/api/courses/performance/"), CoursePerformance.as_view(), {"pk": reader_rng.choice(course_ids)}
+               force_authenticate(request, user=user)
+               started = time.perf_counter()
+               try:
+                  view(request, **kwargs).render()
+               except OperationalError:  # database is locked
+                  with lock:
+                     locked["reads"] += 1
+                  continue
+               with lock:
+                  latencies.append(time.perf_counter() - started)
+         finally:
+            connection.close()
+
+      def write():
+         writer, started = IngestionBenchmark(), time.perf_counter()
+         try:
+            for (section, clo_ids), scores in uploads:
+               try:
+                  response = writer.post_gradebook(user, section, clo_ids, emails, scores)
+               except OperationalError:
+                  locked["writes"] += 1
+                  continue
+               if response.status_code != 201:
+                  failures.append(f"Upload failed with {response.status_code}: {response.data}")
+                  return
+         finally:
+            writer_seconds.append(time.perf_counter() - started)
+            done.set()
+            connection.close()
+
+      connection.close()  # Every thread opens its own connection to the file
+      threads = [threading.Thread(target=read, args=(reader,)) for reader in range(max(1, options["readers"]))]
+      writer = threading.Thread(target=write)
+      started = time.perf_counter()
+      for thread in threads + [writer]:
+         thread.start()
+      for thread in [writer] + threads:
+         thread.join()
+      seconds = time.perf_counter() - started
+      if failures:
+         raise CommandError(failures[0])
+
+      rows = StudentTaskMapping.objects.count()
+      latencies.sort()
+      percentile = lambda share: latencies[min(len(latencies) - 1, int(len(latencies) * share))] * 1000 if latencies else 0
+      return {
+         "readers": len(threads),
+         "seconds": seconds,
+         "reads": len(latencies),
+         "reads_per_second": len(latencies) / seconds if seconds else 0,
+         "read_p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+         "read_p95_ms": percentile(0.95),
+         "read_max_ms": latencies[-1] * 1000 if latencies else 0,
+         "locked_reads": locked["reads"],
+         "locked_writes": locked["writes"],
+         "rows": rows,
+         "rows_per_second": rows / writer_seconds[0] if writer_seconds[0] else 0,
+      }
@@ -0,0 +1,72 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Heavy libraries that only the report endpoints need, none of them should be loaded by importing the URL config
+REPORT_LIBRARIES = ["matplotlib", "matplotlib.pyplot", "seaborn", "reportlab", "reportlab.platypus", "PyPDF2"]
+
+# Runs in a fresh interpreter, so nothing imported by this management command skews the numbers
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+import api.urls
+urls_done = time.perf_counter()
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+   "setup_seconds": setup_done - start,
+   "urls_seconds": urls_done - setup_done,
+   "peak_rss_mb": peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024),  # Bytes on macOS, KB on Linux
+   "report_libraries": [name for name in %r if name in sys.modules],
+}))
+""" % (REPORT_LIBRARIES,)
+
+
+class Command(BaseCommand):
+   """
+   Measures how long a fresh worker process takes to get ready to serve requests (django.setup() + importing api.urls),
+   how much memory it holds at that point and which report-only libraries got pulled in along the way.
+   Usage: python manage.py benchmark_startup [--runs 5] [--json]
+   """
+   help = "Measures the import time and RSS of a fresh process loading api.urls"
+
+   def add_arguments(self, parser):
+      parser.add_argument("--runs", type=int, default=5, help="Number of fresh processes to measure, the median is reported")
+      parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+
+   def handle(self, *args, **options):
+      environment = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get("DJANGO_SETTINGS_MODULE", "backend.settings"))
+      samples = []
+      for _ in range(max(1, options["runs"])):
+         probe = subprocess.run([sys.executable, "-c", PROBE], cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True)
+         if probe.returncode:
+            raise CommandError(f"Startup probe failed:\n{probe.stderr}")
+         samples.append(json.loads(probe.stdout.strip().splitlines()[-1]))
+
+      results = {
+         "runs": len(samples),
+         "setup_seconds": statistics.median(sample["setup_seconds"] for sample in samples),
+         "urls_seconds": statistics.median(sample["urls_seconds"] for sample in samples),
+         "peak_rss_mb": statistics.median(sample["peak_rss_mb"] for sample in samples),
+         "report_libraries": samples[-1]["report_libraries"],
+      }
+      if options["json"]:
+         self.stdout.write(json.dumps(results, indent=3))
+         return
+
+      self.stdout.write(f"Runs:                     {results['runs']}")
+      self.stdout.write(f"django.setup():           {results['setup_seconds'] * 1000:.1f} ms (median)")
+      self.stdout.write(f"import api.urls:          {results['urls_seconds'] * 1000:.1f} ms (median)")
+      self.stdout.write(f"Peak RSS:                 {results['peak_rss_mb']:.1f} MB (median)")
+      if results["report_libraries"]:
+         self.stdout.write(self.style.WARNING(f"Report libraries loaded:  {', '.join(results['report_libraries'])}"))
+      else:
+         self.stdout.write(self.style.SUCCESS("Report libraries loaded:  none"))
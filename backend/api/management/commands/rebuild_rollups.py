@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.rollups import rebuild_rollups, verify_rollups
+
+
+class Command(BaseCommand):
+   """
+   Rebuilds the outcome rollup tables (TaskRollup, SectionCLORollup, SectionPLORollup) from scratch
+   and verifies them against a recomputation straight from the gradebook.
+   Usage: python manage.py rebuild_rollups [--verify-only] [--tolerance 1e-6]
+   """
+   help = "Rebuilds the outcome rollup tables from the gradebook and verifies them against a full recomputation"
+   
+   def add_arguments(self, parser):
+      parser.add_argument("--verify-only", action="store_true", help="Only compare the current rollups to a recomputation, do not rebuild them")
+      parser.add_argument("--tolerance", type=float, default=1e-6, help="Largest allowed difference between a rollup average and the recomputed one")
+   
+   def handle(self, *args, **options):
+      if not options["verify_only"]:
+         counts = rebuild_rollups()
+         self.stdout.write(", ".join(f"{name}: {count}" for name, count in counts.items()))
+      
+      mismatches = verify_rollups(tolerance=options["tolerance"])
+      for mismatch in mismatches:
+         self.stderr.write(mismatch)
+      if mismatches:
+         raise CommandError(f"{len(mismatches)} rollup value(s) do not match the gradebook")
+      self.stdout.write(self.style.SUCCESS("Rollups match the gradebook"))
@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+
+from api.ingestion_jobs import run_queued_ingestion_jobs
+
+
+class Command(BaseCommand):
+   """
+   Runs the ingestion jobs that are still queued (e.g. the ones left behind when the server was restarted), after failing the
+   jobs whose worker died mid-import (running for longer than settings.INGESTION_JOB_STALE_SECONDS).
+   With --loop it keeps polling, which turns it into a standalone ingestion worker.
+   Usage: python manage.py run_ingestion_jobs [--loop] [--interval 5]
+   """
+   help = "Runs queued gradebook ingestion jobs, optionally polling for new ones"
+   
+   def add_arguments(self, parser):
+      parser.add_argument("--loop", action="store_true", help="Keep polling for queued jobs instead of exiting once the queue is empty")
+      parser.add_argument("--interval", type=float, default=5, help="Seconds to wait between polls when --loop is given")
+   
+   def handle(self, *args, **options):
+      while True:
+         ran = run_queued_ingestion_jobs()
+         if ran:
+            self.stdout.write(f"Ran {ran} ingestion job(s)")
+         if not options["loop"]:
+            break
+         time.sleep(options["interval"])
@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+
+from api.report_jobs import run_queued_report_jobs
+
+
+class Command(BaseCommand):
+   """
+   Runs the report jobs that are still queued (e.g. the ones left behind when the server was restarted), after putting jobs
+   whose worker died back in the queue (running for longer than settings.REPORT_JOB_STALE_SECONDS).
+   With --loop it keeps polling, which turns it into a standalone report worker.
+   Usage: python manage.py run_report_jobs [--loop] [--interval 5]
+   """
+   help = "Runs queued report jobs, optionally polling for new ones"
+   
+   def add_arguments(self, parser):
+      parser.add_argument("--loop", action="store_true", help="Keep polling for queued jobs instead of exiting once the queue is empty")
+      parser.add_argument("--interval", type=float, default=5, help="Seconds to wait between polls when --loop is given")
+   
+   def handle(self, *args, **options):
+      while True:
+         ran = run_queued_report_jobs()
+         if ran:
+            self.stdout.write(f"Ran {ran} report job(s)")
+         if not options["loop"]:
+            break
+         time.sleep(options["interval"])
@@ -0,0 +1,183 @@
+# API App metrics.py
+
+import functools
+import logging
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Avg, F, Sum
+
+from .models import * # Import models
+from .aggregation import OutcomeAggregator, NORMALIZED, RATIO # Shared task -> CLO -> PLO averaging
+from . import rollups # Materialized task/section outcome sums, kept current on gradebook writes
+from .report_cache import current_data_version # Moves forward on every committed write to the data the metrics read
+
+
+# NOTE:
+# - This is the metrics service layer: every performance endpoint (views/) and every PDF report (views/report_pdfs.py) gets its
+#   task, CLO, PLO and student grade numbers from here, so there is one implementation of each metric
+#     JSON endpoints (section, course, evaluation instrument performance) read the rollup tables (see rollups.py)
+#     Reports build an OutcomeAggregator over the report's scope (see aggregation.py) and ask it for every breakdown they need
+# - Every public function goes through @metric, which is the single instrumentation and caching point:
+#     with the "api.metrics" logger at DEBUG, each call logs its duration and the number of queries it ran
+#     cached metrics are memoized in Django's cache for settings.METRICS_CACHE_TIMEOUT seconds (0 turns caching off), keyed by the
+#     metric, its arguments and the data version (see report_cache.py), so any committed write to the gradebook or mappings
+#     makes every cached value unreachable
+# - The rollups are refreshed before the data version moves forward (both run when the write commits, and the version bump
+#   drains any pending rollup refresh first), so a value cached under a data version is never older than that version.
+#   Code writing through bulk paths must schedule both (see schedule_refresh() in bulk.py)
+
+logger = logging.getLogger(__name__)
+
+
+class _QueryCounter:
+   """
+   Database execute wrapper that counts the queries run through it.
+   """
+   def __init__(self):
+      self.count = 0
+
+   def __call__(self, execute, sql, params, many, context):
+      self.count += 1
+      return execute(sql, params, many, context)
+
+
+def metric(cached=False):
+   """
+   Purpose: Decorator that instruments a metric and optionally caches its result.
+   Args:
+      cached (bool): Memoize the result by arguments and data version, only for metrics whose arguments are plain IDs
+   """
+   def decorator(function):
+      @functools.wraps(function)
+      def wrapper(*args, **kwargs):
+         key = None
+         if cached and settings.METRICS_CACHE_TIMEOUT > 0:
+            key = f"metrics:{function.__name__}:{current_data_version()}:{args!r}:{sorted(kwargs.items())!r}"
+            result = cache.get(key)
+            if result is not None:
+               logger.debug("%s%r served from cache", function.__name__, args)
+               return result
+
+         if logger.isEnabledFor(logging.DEBUG):
+            counter = _QueryCounter()
+            started = time.perf_counter()
+            with connection.execute_wrapper(counter):
+               result = function(*args, **kwargs)
+            logger.debug("%s%r took %.1f ms and %d queries", function.__name__, args, (time.perf_counter() - started) * 1000, counter.count)
+         else:
+            result = function(*args, **kwargs)
+
+         if key is not None:
+            cache.set(key, result, settings.METRICS_CACHE_TIMEOUT)
+         return result
+      return wrapper
+   return decorator
+
+
+# START - Endpoint Metrics
+@metric(cached=True)
+def section_performance(section_id):
+   """
+   Returns the section's CLO and PLO averages, with task averages taken as average score / average total possible score.
+   """
+   clo_performance, plo_performance = rollups.section_performance(section_id, mode=RATIO)
+   return {"section_id": section_id, "clo_performance": clo_performance, "plo_performance": plo_performance}
+
+
+@metric(cached=True)
+def course_performance(course_id):
+   """
+   Returns the course's CLO averages (the mean of each CLO's per-section averages) and the PLO averages derived from them.
+   """
+   clo_performance = rollups.course_clo_performance(course_id)
+   return {"clo_performance": clo_performance, "plo_performance": rollups.plo_performance(clo_performance)}
+
+
+@metric(cached=True)
+def instrument_performance(instrument_id):
+   """
+   Returns the evaluation instrument's task, CLO and PLO averages and its overall average score.
+   """
+   task_performance, clo_performance = rollups.instrument_performance(instrument_id)
+   return {
+      "evaluation_instrument_id": instrument_id,
+      "tasks": task_performance,
+      "clo_performance": clo_performance,
+      "plo_performance": rollups.plo_performance(clo_performance),
+      "overall_average_score": sum(task_performance.values()) / len(task_performance) if task_performance else 0,  # The average of all the task average scores
+   }
+# STOP - Endpoint Metrics
+
+
+# START - Report Metrics
+@metric()
+def outcome_aggregator(sections=None, courses=None, instruments=None):
+   """
+   Returns an OutcomeAggregator loaded with everything a report needs for the given scope.
+   """
+   return OutcomeAggregator(sections=sections, courses=courses, instruments=instruments)
+
+
+@metric()
+def section_report_performance(aggregator, section):
+   """
+   Returns a section report's CLO and PLO averages. Every CLO of the section's course is reported, CLOs with no tasks mapped to them get -1.
+   """
+   section_clo_performance = aggregator.section_clo_performance(section.section_id, mode=RATIO)
+   clo_performance = {
+      clo_id: section_clo_performance.get(clo_id, -1)  # -1 means no tasks are mapped to this CLO
+      for clo_id in CourseLearningObjective.objects.filter(course=section.course_id).values_list("clo_id", flat=True)
+   }
+   plo_performance = aggregator.plo_performance(clo_performance)
+   return {"section_id": section.section_id, "clo_performance": clo_performance, "plo_performance": plo_performance}
+
+
+@metric()
+def average_student_grade(sections):
+   """
+   Returns the average of every student's overall grade (total score / total possible score across all the sections' tasks) in percent, 0 without grades.
+   """
+   # Each student's totals are summed by the database, one row per student
+   student_totals = (
+      StudentTaskMapping.objects.filter(task__evaluation_instrument__section__in=sections)
+      .order_by()
+      .values("student")
+      .annotate(total_score=Sum("score"), total_possible=Sum("total_possible_score"))
+      .filter(total_possible__gt=0)
+      .values_list("total_score", "total_possible")
+   )
+   student_averages = [(total_score / total_possible) * 100 for total_score, total_possible in student_totals]  # Convert to percentage
+   return sum(student_averages) / len(student_averages) if student_averages else 0
+
+
+@metric()
+def student_average_grades_by_section(sections):
+   """
+   Returns {section_id: [grade, ...]}, every student's average normalized grade (the mean of score / total possible score over
+   their tasks) in each section, in percent. Rows with a total possible score of 0 are skipped, sections without grades are left out.
+   The averages are computed by the database, one row per student and section, so only the final grades are read back.
+   """
+   grades = defaultdict(list)
+   student_averages = (
+      StudentTaskMapping.objects.filter(task__evaluation_instrument__section__in=sections)
+      .exclude(total_possible_score=0)  # Avoid division by zero
+      .order_by()
+      .values("task__evaluation_instrument__section", "student")
+      .annotate(average=Avg(F("score") / F("total_possible_score")))
+      .values_list("task__evaluation_instrument__section", "average")
+   )
+   for section_id, average in student_averages:
+      grades[section_id].append(average * 100)
+   return dict(grades)
+
+
+@metric()
+def student_average_grades(section):
+   """
+   Returns every student's average normalized grade in a section, in percent (see student_average_grades_by_section()).
+   """
+   return student_average_grades_by_section([section]).get(getattr(section, "pk", section), [])
+# STOP - Report Metrics
@@ -1,4 +1,5 @@
 from django.db import models
+import uuid
 from django.conf import settings  # Use this to refer to the custom User model
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone # For verifying time validity
@@ -196,6 +197,9 @@ class ProgramCourseMapping(models.Model):
       constraints = [
          models.UniqueConstraint(fields=['program', 'course'], name='unique_program_course')
       ]
+      indexes = [
+         models.Index(fields=['course', 'program'], name='program_course_by_course_idx'),  # The unique constraint serves lookups by program, this one the programs of a course
+      ]
    
    def __str__(self):
       return f"ID: {self.program_course_mapping_id} | Program: {self.program} | Course: {self.course}"
@@ -231,6 +235,9 @@ class Section(models.Model):
       constraints = [
          models.UniqueConstraint(fields=['course', 'section_number'], name='unique_course_section')
       ]
+      indexes = [
+         models.Index(fields=['course', 'semester'], name='section_course_semester_idx'),  # Reports pick a course's sections by semester
+      ]
    
    def __str__(self):
       return f"Section {self.section_id} - {self.course.name} - {self.section_number} - ({self.semester})"
@@ -254,6 +261,11 @@ class EvaluationInstrument(models.Model):
    name = models.CharField(max_length=255)
    description = models.TextField(max_length=1000, null=True, blank=True)
    
+   class Meta:
+      indexes = [
+         models.Index(fields=['section', 'evaluation_type'], name='instrument_section_type_idx'),  # A section's instruments, grouped by evaluation type in the reports
+      ]
+   
    def __str__(self):
       return f"{self.name} | {self.evaluation_type} | {self.description[:20]}"
 
@@ -265,6 +277,11 @@ class EmbeddedTask(models.Model):
    task_number = models.PositiveIntegerField()  # The task number (optional)
    task_text = models.TextField(max_length=2000, null=True, blank=True) # If your eval. instrument's text is longer than 500 words, that's on you!
    
+   class Meta:
+      indexes = [
+         models.Index(fields=['evaluation_instrument', 'task_number'], name='task_instrument_number_idx'),  # An instrument's tasks, and gradebook columns matched by task number
+      ]
+   
    def __str__(self):
       return f"Q{self.task_number} - from Eval. Instrument: {self.evaluation_instrument.name} | Description: {self.task_text[:20]}"
 
@@ -291,6 +308,9 @@ class TaskCLOMapping(models.Model):
       constraints = [
          models.UniqueConstraint(fields=['task', 'clo'], name='unique_task_clo')
       ]
+      indexes = [
+         models.Index(fields=['clo', 'task'], name='task_clo_by_clo_idx'),  # The unique constraint serves lookups by task, this one the tasks of a CLO
+      ]
    
    def __str__(self):
       return f"ID: {self.task_clo_mapping_id} | Task: {self.task} | CLO: {self.clo}"
@@ -306,6 +326,9 @@ class PLOCLOMapping(models.Model):
       constraints = [
          models.UniqueConstraint(fields=['plo', 'clo'], name='unique_plo_clo')
       ]
+      indexes = [
+         models.Index(fields=['clo', 'plo'], name='plo_clo_by_clo_idx'),  # The unique constraint serves lookups by PLO, this one the PLOs of a CLO
+      ]
    
    def __str__(self):
       return f"ID: {self.plo_clo_mapping_id} | PLO: {self.plo} | CLO: {self.clo}"
@@ -333,6 +356,153 @@ class StudentTaskMapping(models.Model):  # This is basically just a gradebook di
       constraints = [
          models.UniqueConstraint(fields=['student', 'task'], name='unique_student_task')
       ]
+      indexes = [
+         # Covering index of the gradebook's hot path: every task average, rollup and per-student grade reads only these
+         # columns of a set of tasks, so they are answered from the index without touching the table
+         models.Index(fields=['task', 'score', 'total_possible_score', 'student'], name='stm_task_scores_idx'),
+      ]
+   
+   def __str__(self):
+      return f"Student: {self.student.first_name} {self.student.last_name} | Score: {(self.score / self.total_possible_score)} | Task: {self.task}"
+
+
+# Report Job
+class ReportJob(models.Model):  # A performance report PDF that is generated in the background (see report_jobs.py)
+   REPORT_TYPE_CHOICES = [
+      ('program', 'Program'),
+      ('course', 'Course'),
+      ('section', 'Section'),
+   ]
+   STATUS_CHOICES = [ # In the order a job goes through them
+      ('queued', 'Queued'),
+      ('running', 'Running'),
+      ('succeeded', 'Succeeded'),
+      ('failed', 'Failed'),
+   ]
+   report_job_id = models.BigAutoField(primary_key=True)
+   report_type = models.CharField(max_length=10, choices=REPORT_TYPE_CHOICES)
+   object_id = models.PositiveBigIntegerField()  # The ID of the program, course or section the report is for
+   parameters = models.JSONField(default=dict, blank=True)  # The report's query parameters, {name: [value, ...]} just like the GET request's query string
+   status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+   error = models.TextField(null=True, blank=True)  # Why the job failed, if it did
+   result_path = models.CharField(max_length=500, null=True, blank=True)  # Where the finished PDF is stored
+   requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+   created_at = models.DateTimeField(auto_now_add=True)
+   started_at = models.DateTimeField(null=True, blank=True)
+   finished_at = models.DateTimeField(null=True, blank=True)
+   
+   def __str__(self):
+      return f"Report Job {self.report_job_id} | {self.report_type} {self.object_id} | {self.status}"
+
+
+# Ingestion Job
+class IngestionJob(models.Model):  # A gradebook import that runs in the background (see ingestion_jobs.py)
+   SOURCE_CHOICES = [
+      ('gradebook', 'Gradebook'),  # The JSON gradebook of a new evaluation instrument (EvaluationInstrumentListCreate)
+      ('file', 'Gradebook File'),  # A CSV/XLSX gradebook uploaded into an existing evaluation instrument (EvaluationInstrumentGradebookImport)
+   ]
+   STATUS_CHOICES = ReportJob.STATUS_CHOICES
+   ingestion_job_id = models.BigAutoField(primary_key=True)
+   source = models.CharField(max_length=10, choices=SOURCE_CHOICES)
+   evaluation_instrument = models.ForeignKey(EvaluationInstrument, on_delete=models.SET_NULL, null=True, blank=True)  # The instrument imported into, set once it exists for 'gradebook' jobs
+   payload = models.JSONField(default=dict, blank=True)  # The request body for 'gradebook' jobs, {"mode": ..., "file_name": ...} for 'file' jobs
+   upload_path = models.CharField(max_length=500, null=True, blank=True)  # Where the uploaded file of a 'file' job is kept until the job has run
+   status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+   rows_total = models.PositiveIntegerField(null=True, blank=True)  # Student rows to import, unknown for files (they are read as a stream)
+   rows_validated = models.PositiveIntegerField(default=0)
+   rows_written = models.PositiveIntegerField(default=0)
+   result = models.JSONField(null=True, blank=True)  # The final counts (and skipped rows of a file), the same body the synchronous request returns
+   error = models.TextField(null=True, blank=True)  # Why the job failed, if it did
+   requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+   created_at = models.DateTimeField(auto_now_add=True)
+   started_at = models.DateTimeField(null=True, blank=True)
+   finished_at = models.DateTimeField(null=True, blank=True)
+   
+   def __str__(self):
+      return f"Ingestion Job {self.ingestion_job_id} | {self.source} | {self.status}"
+
+
+# Data Version
+class DataVersion(models.Model):  # A counter that is bumped whenever data the reports are built from changes, used to key the report cache (see report_cache.py)
+   name = models.CharField(max_length=50, primary_key=True)  # What the counter versions, e.g. 'reports'
+   generation = models.UUIDField(default=uuid.uuid4, editable=False)  # Random per row, so a wiped and refilled database never reuses old version numbers
+   version = models.PositiveBigIntegerField(default=0)
+   
+   def __str__(self):
+      return f"{self.name}: {self.version}"
+
+
+# NOTE: The models below are materialized rollups of the gradebook, they are never written to by the API directly.
+# They are kept current by api/rollups.py (through the signals in api/signals.py) and can be rebuilt with: python manage.py rebuild_rollups
+
+# Task Rollup
+class TaskRollup(models.Model):  # Per-task sums of the gradebook, enough to produce both of the task averages used by the performance views
+   task = models.OneToOneField(EmbeddedTask, on_delete=models.CASCADE, primary_key=True)
+   row_count = models.PositiveIntegerField(default=0)  # Number of StudentTaskMapping rows for the task
+   score_sum = models.FloatField(default=0)  # Sum of the scores
+   total_sum = models.FloatField(default=0)  # Sum of the total possible scores
+   normalized_sum = models.FloatField(default=0)  # Sum of every (score / total_possible_score) * 100, rows with a total of 0 are skipped
+   normalized_count = models.PositiveIntegerField(default=0)  # Number of rows that went into normalized_sum
+   
+   @property
+   def normalized_average(self):
+      return self.normalized_sum / self.normalized_count if self.normalized_count else 0
+   
+   @property
+   def ratio_average(self):
+      return self.score_sum / self.total_sum * 100 if self.row_count and self.total_sum else 0
+   
+   def __str__(self):
+      return f"Task: {self.task_id} | Rows: {self.row_count} | Normalized Avg.: {self.normalized_average}"
+
+
+# Section CLO Rollup
+class SectionCLORollup(models.Model):  # Per-section, per-CLO sums of the task averages of the tasks mapped to the CLO
+   section_clo_rollup_id = models.BigAutoField(primary_key=True)
+   section = models.ForeignKey(Section, on_delete=models.CASCADE)
+   clo = models.ForeignKey(CourseLearningObjective, on_delete=models.CASCADE)
+   task_count = models.PositiveIntegerField(default=0)  # Number of the section's tasks mapped to the CLO
+   normalized_sum = models.FloatField(default=0)  # Sum of those tasks' normalized averages
+   ratio_sum = models.FloatField(default=0)  # Sum of those tasks' ratio averages
+   
+   class Meta:
+      constraints = [
+         models.UniqueConstraint(fields=['section', 'clo'], name='unique_section_clo_rollup')
+      ]
+   
+   @property
+   def normalized_average(self):
+      return self.normalized_sum / self.task_count if self.task_count else 0
+   
+   @property
+   def ratio_average(self):
+      return self.ratio_sum / self.task_count if self.task_count else 0
+   
+   def __str__(self):
+      return f"Section: {self.section_id} | CLO: {self.clo_id} | Tasks: {self.task_count}"
+
+
+# Section PLO Rollup
+class SectionPLORollup(models.Model):  # Per-section, per-PLO sums of the section's CLO averages of the CLOs mapped to the PLO
+   section_plo_rollup_id = models.BigAutoField(primary_key=True)
+   section = models.ForeignKey(Section, on_delete=models.CASCADE)
+   plo = models.ForeignKey(ProgramLearningObjective, on_delete=models.CASCADE)
+   clo_count = models.PositiveIntegerField(default=0)  # Number of the section's assessed CLOs mapped to the PLO
+   normalized_sum = models.FloatField(default=0)  # Sum of those CLOs' normalized averages
+   ratio_sum = models.FloatField(default=0)  # Sum of those CLOs' ratio averages
+   
+   class Meta:
+      constraints = [
+         models.UniqueConstraint(fields=['section', 'plo'], name='unique_section_plo_rollup')
+      ]
+   
+   @property
+   def normalized_average(self):
+      return self.normalized_sum / self.clo_count if self.clo_count else 0
+   
+   @property
+   def ratio_average(self):
+      return self.ratio_sum / self.clo_count if self.clo_count else 0
    
    def __str__(self):
-      return f"Student: {self.student.first_name} {self.student.last_name} | Score: {(self.score / self.total_possible_score)} | Task: {self.task}"
\ No newline at end of file
+      return f"Section: {self.section_id} | PLO: {self.plo_id} | CLOs: {self.clo_count}"
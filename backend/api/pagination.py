@@ -0,0 +1,48 @@
+# API App pagination.py
+
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+# NOTE:
+# - Keyset (cursor) pagination for the list endpoints: a page is "the next page_size rows after the last primary key seen",
+#   so every page costs one indexed range scan no matter how deep into the table it is (no OFFSET, no COUNT(*))
+# - Pages are opt-in so the frontend, which reads the full lists, keeps working: a request gets pages once it sends
+#   ?page_size=<n> or follows a cursor (?cursor=...). Views that set always_paginate = True (tables that grow without
+#   bound, like the gradebook) are always paged, API_PAGE_SIZE rows at a time unless page_size says otherwise
+# - Paged responses look like {"next": <url or null>, "previous": <url or null>, "results": [...]}
+# - Rows are ordered by the model's primary key (email for students), a view can set keyset_ordering (e.g. "-pk") to change that
+
+
+class KeysetPagination(CursorPagination):
+   page_size_query_param = "page_size"
+
+   def __init__(self):
+      self.page_size = settings.API_PAGE_SIZE
+      self.max_page_size = settings.API_MAX_PAGE_SIZE
+
+   def get_ordering(self, request, queryset, view):
+      return (getattr(view, "keyset_ordering", None) or queryset.model._meta.pk.name,)  # Always unique, the cursor needs that
+
+   def paginate_queryset(self, queryset, request, view=None):
+      wants_pages = self.cursor_query_param in request.query_params or self.page_size_query_param in request.query_params
+      if not (wants_pages or getattr(view, "always_paginate", False)):
+         return None  # The whole list, like before pagination existed
+      return super().paginate_queryset(queryset, request, view)
+
+
+def paginated_response(view, queryset, serializer_class):
+   """
+   Purpose: Returns a list endpoint's response, one keyset page of the queryset or the whole of it (see KeysetPagination).
+   Args:
+      view (GenericAPIView): The list view, its paginator decides whether the request gets pages
+      queryset (QuerySet): Every row the endpoint lists
+      serializer_class (Serializer): Serializes the rows, its query plan is applied to the queryset
+   """
+   if hasattr(serializer_class, "setup_eager_loading"):
+      queryset = serializer_class.setup_eager_loading(queryset)  # The serializer's query plan (see EagerLoadingMixin)
+   page = view.paginate_queryset(queryset)
+   if page is None:
+      return Response(serializer_class(queryset, many=True).data)
+   return view.get_paginated_response(serializer_class(page, many=True).data)
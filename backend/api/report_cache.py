@@ -0,0 +1,230 @@
+# API App report_cache.py
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from io import BytesIO
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import * # Import models
+from .rollups import flush_rollup_refresh # Pending rollup refreshes run before the version moves forward
+
+
+# NOTE:
+# - Finished report PDFs are kept on disk so that asking for the same report again streams the stored file instead of rebuilding it
+# - Files are content addressed: the name is a hash of the report type, the program/course/section ID, the normalized request
+#   parameters (selected semester IDs, excluded sections) and the current data version
+# - The data version (the 'reports' DataVersion row) is bumped once per committed transaction that writes to any model in
+#   REPORT_SOURCE_MODELS (see signals.py), so a changed gradebook or mapping never serves an old PDF, the old entries simply stop being hit
+# - Code that writes with bulk_create() / QuerySet.update() (no signals) must call bump_data_version() itself
+# - The store is bounded by settings.REPORT_CACHE_MAX_BYTES, least recently used files (by mtime, touched on every hit) are evicted first
+# - Within an HTTP request the data version is read once and reused (it is asked for by every cached metric, see metrics.py),
+#   outside of requests (report jobs, commands) every call reads it. Not kept in Django's cache: the default cache is local to
+#   each process, so a bump in the web server would never reach the report worker processes
+
+DATA_VERSION_NAME = "reports"
+
+REPORT_SOURCE_MODELS = [ # Every model a report reads from (users and student names never show up in a report)
+   AccreditationOrganization,
+   AccreditationVersion,
+   ProgramLearningObjective,
+   Program,
+   Course,
+   ProgramCourseMapping,
+   Semester,
+   Section,
+   EvaluationType,
+   EvaluationInstrument,
+   EmbeddedTask,
+   CourseLearningObjective,
+   TaskCLOMapping,
+   PLOCLOMapping,
+   StudentTaskMapping,
+]
+
+_pending = threading.local()  # Whether a version bump is waiting for the current transaction to commit
+_request = threading.local()  # The data version read during the current request, if the thread is serving one
+
+
+# START - Data Version
+def current_data_version():
+   """
+   Returns the current data version as "<generation>:<version>".
+   """
+   data_version = getattr(_request, "data_version", None)
+   if data_version is not None:
+      return data_version
+
+   row = DataVersion.objects.filter(name=DATA_VERSION_NAME).values_list("generation", "version").first()
+   if row is None:  # Nothing was ever written
+      created = DataVersion.objects.get_or_create(name=DATA_VERSION_NAME)[0]
+      row = (created.generation, created.version)
+   data_version = f"{row[0]}:{row[1]}"
+   if getattr(_request, "active", False):
+      _request.data_version = data_version
+   return data_version
+
+
+def start_request_data_version(**kwargs):
+   """
+   Purpose: request_started receiver, the first current_data_version() call of the request reads the version for the rest of it.
+   """
+   _request.active, _request.data_version = True, None
+
+
+def finish_request_data_version(**kwargs):
+   """
+   Purpose: request_finished receiver, stops reusing the request's data version.
+   """
+   _request.active, _request.data_version = False, None
+
+
+def bump_data_version():
+   """
+   Purpose: Invalidates every cached report by moving the data version forward.
+   """
+   _request.data_version = None  # The request that wrote reads the new version from here on
+   if not DataVersion.objects.filter(name=DATA_VERSION_NAME).update(version=F("version") + 1):
+      DataVersion.objects.get_or_create(name=DATA_VERSION_NAME)  # First write ever, any new generation is a fresh version
+
+
+def schedule_data_version_bump():
+   """
+   Purpose: Bumps the data version once the current transaction commits (right away in autocommit mode), once per transaction.
+   """
+   _pending.bump = True
+   transaction.on_commit(_flush_data_version_bump)  # The first callback to run does the bump, the others find nothing to do
+
+
+def _flush_data_version_bump():
+   if getattr(_pending, "bump", False):
+      _pending.bump = False
+      flush_rollup_refresh()  # Whichever was scheduled first, never publish a new version over rollups that are not refreshed yet
+      bump_data_version()
+# STOP - Data Version
+
+
+# START - Cache Store
+def _normalized_parameters(query_params):
+   """
+   Turns the report's query parameters into a stable form: semester entries (JSON like {"semester_id": 3}) and section IDs
+   become integers, and every parameter's values are sorted, so equivalent requests share a cache entry.
+   """
+   normalized = {}
+   for name in sorted(query_params.keys()):
+      values = []
+      for value in query_params.getlist(name):
+         try:
+            parsed = json.loads(value)
+            value = int(parsed["semester_id"]) if isinstance(parsed, dict) else int(parsed)
+         except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            pass  # Kept as is, the report itself rejects bad values
+         values.append(value)
+      normalized[name] = sorted(set(values), key=str)
+   return normalized
+
+
+def cache_key(report_type, object_id, query_params, data_version):
+   payload = json.dumps(
+      {
+         "report_type": report_type,
+         "object_id": int(object_id),
+         "parameters": _normalized_parameters(query_params),
+         "data_version": data_version,
+      },
+      sort_keys=True,
+   )
+   return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_path(key):
+   return os.path.join(settings.REPORT_CACHE_DIR, f"{key}.pdf")
+
+
+def lookup(key):
+   """
+   Returns the path of the cached PDF for the key (marking it as recently used), None on a miss.
+   """
+   path = _cache_path(key)
+   try:
+      os.utime(path)  # Touch it, eviction goes by mtime
+   except FileNotFoundError:
+      return None
+   return path
+
+
+def store(key, pdf_bytes):
+   """
+   Writes a freshly built PDF into the cache and evicts old entries if the cache grew past its limit.
+   Returns the cached file's path.
+   """
+   os.makedirs(settings.REPORT_CACHE_DIR, exist_ok=True)
+   # Write under a unique temporary name first so readers never see a half written file and concurrent builds never collide
+   handle, temp_path = tempfile.mkstemp(dir=settings.REPORT_CACHE_DIR, suffix=".tmp")
+   try:
+      with os.fdopen(handle, "wb") as temp_file:
+         temp_file.write(pdf_bytes)
+      path = _cache_path(key)
+      os.replace(temp_path, path)
+   except OSError:
+      os.remove(temp_path)
+      raise
+   evict(keep=path)
+   return path
+
+
+def evict(keep=None, max_bytes=None):
+   """
+   Purpose: Deletes the least recently used cached reports until the cache fits in max_bytes (settings.REPORT_CACHE_MAX_BYTES by default).
+   Args:
+      keep (str): A path that is never evicted (the entry that was just stored)
+   """
+   max_bytes = settings.REPORT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+   entries = []
+   with os.scandir(settings.REPORT_CACHE_DIR) as scan:
+      for entry in scan:
+         if entry.name.endswith(".pdf"):
+            try:
+               stat = entry.stat()
+            except FileNotFoundError:  # Evicted by another worker
+               continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+   total = sum(size for _, size, _ in entries)
+   for _, size, path in sorted(entries):  # Oldest first
+      if total <= max_bytes:
+         break
+      if path == keep:
+         continue
+      try:
+         os.remove(path)  # Readers that already opened the file keep streaming it
+      except FileNotFoundError:
+         pass
+      total -= size
+
+
+def open_or_build(report_type, object_id, query_params, build):
+   """
+   Purpose: Returns the report's PDF as a binary file object (the cached file when possible, an in-memory buffer otherwise).
+   Args:
+      report_type (str): 'program', 'course' or 'section'
+      object_id (int): The ID of the program, course or section
+      query_params (QueryDict): The report's parameters
+      build (callable): Builds the report and returns the PDF's bytes, called on a cache miss
+   """
+   if settings.REPORT_CACHE_MAX_BYTES <= 0:  # Cache turned off
+      return BytesIO(build())
+   key = cache_key(report_type, object_id, query_params, current_data_version())
+   path = lookup(key)
+   if path:
+      try:
+         return open(path, "rb")
+      except FileNotFoundError:  # Evicted by another worker in between
+         pass
+   pdf_bytes = build()
+   store(key, pdf_bytes)
+   return BytesIO(pdf_bytes)  # Serve what was just built rather than reading it back from disk
+# STOP - Cache Store
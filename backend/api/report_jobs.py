@@ -0,0 +1,166 @@
+# API App report_jobs.py
+
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+
+from .models import * # Import models
+from . import report_worker # Entry points of the worker processes
+from . import report_cache # On-disk cache of finished report PDFs
+
+
+# NOTE:
+# - Report PDFs take long enough to build (metrics, matplotlib charts, ReportLab) that large programs run past the proxy timeout,
+#   so they can be requested as jobs instead: POST report-jobs/ -> poll report-jobs/<pk>/ -> GET report-jobs/<pk>/download/
+# - The ReportJob table is the queue, no external broker is needed. Jobs are handed to a local worker pool once the row is committed,
+#   and a worker only runs a job after atomically moving it from 'queued' to 'running', so a job can never run twice
+# - Jobs that were still queued when the server stopped can be picked up with: python manage.py run_report_jobs
+# - A job whose worker died mid-build stays 'running', run_report_jobs puts it back in the queue once it has been running
+#   for longer than settings.REPORT_JOB_STALE_SECONDS (reports are read-only, so building one again is safe)
+# - The pool is picked with settings.REPORT_JOB_EXECUTOR / REPORT_JOB_WORKERS:
+#     process: spawned worker processes (fresh interpreters, so no forked DB connections or matplotlib state are shared)
+#     thread:  worker threads inside the web server process
+#     inline:  the job runs right away in the calling thread (tests, debugging)
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _report_view(report_type):
+   """
+   Returns a fresh instance of the view that builds the given type of report.
+   """
+   from .views import report_pdfs # Imported here so the reporting libraries are only loaded once a job runs
+   views = {
+      "program": report_pdfs.ProgramPerformanceReport,
+      "course": report_pdfs.CoursePerformanceReport,
+      "section": report_pdfs.SectionPerformanceReport,
+   }
+   return views[report_type]()
+
+
+def get_executor():
+   """
+   Returns the shared worker pool, creating it on first use.
+   """
+   global _executor
+   with _executor_lock:
+      if _executor is None:
+         workers = max(1, settings.REPORT_JOB_WORKERS)
+         if settings.REPORT_JOB_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=report_worker.setup)
+         else:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-job")
+      return _executor
+
+
+def enqueue_report_job(job):
+   """
+   Purpose: Hands a queued job to the worker pool once the transaction that created it commits.
+   """
+   if settings.REPORT_JOB_EXECUTOR == "inline":
+      transaction.on_commit(lambda: run_report_job(job.pk))
+   else:
+      transaction.on_commit(lambda: _submit(job.pk))
+
+
+def _submit(job_id):
+   global _executor
+   task = report_worker.run if settings.REPORT_JOB_EXECUTOR == "process" else run_report_job
+   try:
+      try:
+         get_executor().submit(task, job_id)
+      except BrokenExecutor:  # A worker died (e.g. killed for memory), start a fresh pool and try once more
+         with _executor_lock:
+            _executor = None
+         get_executor().submit(task, job_id)
+   except Exception:  # The job stays queued, run_report_jobs will pick it up
+      logger.exception("Could not hand report job %s to the worker pool", job_id)
+
+
+def result_path_for(job_id):
+   return os.path.join(settings.REPORT_JOB_DIR, f"report_job_{job_id}.pdf")
+
+
+def run_report_job(job_id):
+   """
+   Purpose: Builds the PDF of a queued report job and records the outcome on the job.
+   Returns:
+      bool: False if the job was not queued (already claimed by another worker or missing), True otherwise
+   """
+   try:
+      # Claim the job, only one worker can move it out of 'queued'
+      claimed = ReportJob.objects.filter(pk=job_id, status="queued").update(status="running", started_at=timezone.now())
+      if not claimed:
+         return False
+
+      job = ReportJob.objects.get(pk=job_id)
+      query_params = QueryDict(mutable=True)
+      for name, values in job.parameters.items():
+         query_params.setlist(name, values)
+
+      try:
+         pdf_file = report_cache.open_or_build(
+            job.report_type,
+            job.object_id,
+            query_params,
+            lambda: _report_view(job.report_type).build_report(job.object_id, query_params),
+         )
+         os.makedirs(settings.REPORT_JOB_DIR, exist_ok=True)
+         result_path = result_path_for(job_id)
+         with pdf_file, open(result_path, "wb") as result_file:
+            shutil.copyfileobj(pdf_file, result_file)  # Keep our own copy, cache entries can be evicted before the download
+      except APIException as e:  # NotFound, ParseError, ValidationError... raised by the report for bad input
+         ReportJob.objects.filter(pk=job_id).update(status="failed", error=str(e.detail), finished_at=timezone.now())
+         return True
+      except DjangoValidationError as e:  # Some reports raise Django's ValidationError for bad input
+         ReportJob.objects.filter(pk=job_id).update(status="failed", error=" ".join(e.messages), finished_at=timezone.now())
+         return True
+      except Exception as e:
+         logger.exception("Report job %s failed", job_id)
+         ReportJob.objects.filter(pk=job_id).update(status="failed", error=f"Report generation failed: {e}", finished_at=timezone.now())
+         return True
+
+      ReportJob.objects.filter(pk=job_id).update(status="succeeded", result_path=result_path, finished_at=timezone.now())
+      return True
+   finally:
+      if settings.REPORT_JOB_EXECUTOR == "thread":
+         connection.close()  # Worker threads each hold their own connection, do not leak them
+
+
+def requeue_stale_report_jobs():
+   """
+   Purpose: Puts jobs back in the queue that have been 'running' for longer than settings.REPORT_JOB_STALE_SECONDS.
+   Returns:
+      int: The number of jobs that were re-queued
+   """
+   cutoff = timezone.now() - timedelta(seconds=settings.REPORT_JOB_STALE_SECONDS)
+   requeued = ReportJob.objects.filter(status="running", started_at__lt=cutoff).update(status="queued", started_at=None)
+   if requeued:
+      logger.warning("Re-queued %s report job(s) left running for over %s seconds", requeued, settings.REPORT_JOB_STALE_SECONDS)
+   return requeued
+
+
+def run_queued_report_jobs():
+   """
+   Purpose: Re-queues stale jobs, then runs every job that is still queued, oldest first, in the calling process.
+   Returns:
+      int: The number of jobs that were run
+   """
+   requeue_stale_report_jobs()
+   ran = 0
+   for job_id in ReportJob.objects.filter(status="queued").order_by("created_at").values_list("pk", flat=True):
+      ran += run_report_job(job_id)
+   return ran
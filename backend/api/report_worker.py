@@ -0,0 +1,22 @@
+# API App report_worker.py
+
+# NOTE:
+# - Entry points of the spawned report worker processes (see report_jobs.py)
+# - A spawned worker starts as a bare interpreter and imports this module to find them, so nothing Django related
+#   (models, views...) may be imported at the top of this file: Django has to be set up first
+
+
+def setup():
+   """
+   Initializer of every worker process.
+   """
+   import django
+   django.setup()
+
+
+def run(job_id):
+   """
+   Runs one report job inside a worker process.
+   """
+   from .report_jobs import run_report_job
+   return run_report_job(job_id)
@@ -0,0 +1,297 @@
+# API App rollups.py
+
+import threading
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count, Sum, Case, When, F, FloatField
+
+from .models import * # Import models
+from .aggregation import OutcomeAggregator, NORMALIZED, RATIO # Used to verify the rollups against a full recomputation
+
+
+# NOTE:
+# - The rollup tables (TaskRollup, SectionCLORollup, SectionPLORollup) hold the sums the performance views need so that
+#   they can answer from a few indexed rows instead of re-scanning the whole gradebook on every request
+# - They are refreshed incrementally: only the tasks whose gradebook rows changed, and only the sections those tasks
+#   (or the changed Task-CLO / PLO-CLO mappings) belong to, are recomputed
+# - The signals in signals.py schedule refreshes whenever StudentTaskMapping, TaskCLOMapping or PLOCLOMapping rows are
+#   created, updated or deleted. The refresh runs once the surrounding transaction commits, so a cascade delete of
+#   thousands of rows only recomputes each affected task and section once
+# - bulk_create(), QuerySet.update() and QuerySet.delete() on the fast path do NOT send signals, code using them must call
+#   schedule_rollup_refresh() (or refresh_rollups()) itself
+# - Moving an existing task to another evaluation instrument is not tracked, run: python manage.py rebuild_rollups
+
+CHUNK_SIZE = 500  # Max IDs per IN (...) clause, keeps us well below SQLite's variable limit
+
+TRACKED_FIELDS = {  # The foreign keys that decide which rollups a row feeds into
+   StudentTaskMapping: "task_id",
+   TaskCLOMapping: "task_id",
+   PLOCLOMapping: "clo_id",
+}
+
+_pending = threading.local()  # Task and section IDs waiting for the current transaction to commit
+
+
+def _chunks(ids):
+   ids = list(ids)
+   for start in range(0, len(ids), CHUNK_SIZE):
+      yield ids[start:start + CHUNK_SIZE]
+
+
+# START - Writing Rollups
+def schedule_rollup_refresh(task_ids=(), section_ids=()):
+   """
+   Purpose: Queues the rollups of the given tasks and sections to be refreshed once the current transaction commits (right away in autocommit mode).
+   Args:
+      task_ids (iterable): Tasks whose gradebook rows changed
+      section_ids (iterable): Sections whose Task-CLO or PLO-CLO mappings changed
+   """
+   if not hasattr(_pending, "task_ids"):
+      _pending.task_ids = set()
+      _pending.section_ids = set()
+   _pending.task_ids.update(task_ids)
+   _pending.section_ids.update(section_ids)
+   transaction.on_commit(flush_rollup_refresh)  # Every callback drains the whole queue, the extra ones find it empty
+
+
+def schedule_mapping_refresh(model, owner_ids):
+   """
+   Purpose: Queues the refresh of every rollup that rows of a tracked model (see TRACKED_FIELDS) feed into.
+   Args:
+      model (Model): StudentTaskMapping, TaskCLOMapping or PLOCLOMapping
+      owner_ids (iterable): Values of the model's tracked foreign key on the rows that changed (old and new values for updates)
+   """
+   owner_ids = set(owner_ids) - {None}
+   if not owner_ids:
+      return
+   if model is StudentTaskMapping:
+      schedule_rollup_refresh(task_ids=owner_ids)
+   elif model is TaskCLOMapping:
+      # Looked up now since the task may be deleted along with the mapping before the refresh runs
+      for chunk in _chunks(owner_ids):
+         schedule_rollup_refresh(section_ids=EmbeddedTask.objects.filter(pk__in=chunk).values_list("evaluation_instrument__section_id", flat=True))
+   elif model is PLOCLOMapping:
+      # Only the sections that have assessed the CLO have PLO rollups that depend on this mapping
+      for chunk in _chunks(owner_ids):
+         schedule_rollup_refresh(section_ids=SectionCLORollup.objects.filter(clo__in=chunk).values_list("section_id", flat=True))
+
+
+def flush_rollup_refresh():
+   """
+   Purpose: Refreshes everything queued by schedule_rollup_refresh().
+   """
+   task_ids, section_ids = getattr(_pending, "task_ids", set()), getattr(_pending, "section_ids", set())
+   _pending.task_ids, _pending.section_ids = set(), set()
+   if task_ids or section_ids:
+      refresh_rollups(task_ids, section_ids)
+
+
+def refresh_rollups(task_ids=(), section_ids=()):
+   """
+   Purpose: Recomputes the task rollups of the given tasks, then the CLO/PLO rollups of the given sections and of the sections those tasks belong to.
+   """
+   section_ids = set(section_ids)
+   for chunk in _chunks(set(task_ids)):
+      refresh_task_rollups(chunk)
+      section_ids.update(
+         EmbeddedTask.objects.filter(pk__in=chunk).values_list("evaluation_instrument__section_id", flat=True)
+      )
+   for chunk in _chunks(section_ids):
+      refresh_section_rollups(chunk)
+
+
+def refresh_task_rollups(task_ids):
+   """
+   Purpose: Recomputes the TaskRollup rows of the given tasks with one grouped query over their gradebook rows.
+   """
+   task_stats = StudentTaskMapping.objects.filter(task__in=task_ids).values("task").annotate(
+      row_count=Count("pk"),
+      score_sum=Sum("score"),
+      total_sum=Sum("total_possible_score"),
+      normalized_sum=Sum(Case(
+         When(total_possible_score__gt=0, then=F("score") / F("total_possible_score") * 100),  # Rows with no possible points are skipped
+         output_field=FloatField()
+      )),
+      normalized_count=Count(Case(When(total_possible_score__gt=0, then=1))),
+   )
+   with transaction.atomic():
+      TaskRollup.objects.filter(task__in=task_ids).delete()
+      TaskRollup.objects.bulk_create([
+         TaskRollup(
+            task_id=row["task"],
+            row_count=row["row_count"],
+            score_sum=row["score_sum"] or 0,
+            total_sum=row["total_sum"] or 0,
+            normalized_sum=row["normalized_sum"] or 0,
+            normalized_count=row["normalized_count"],
+         )
+         for row in task_stats
+      ])
+
+
+def refresh_section_rollups(section_ids):
+   """
+   Purpose: Recomputes the SectionCLORollup and SectionPLORollup rows of the given sections from their task rollups.
+   """
+   # The two task averages of every task in the sections (tasks without gradebook rows average 0)
+   task_averages = {
+      rollup.task_id: (rollup.normalized_average, rollup.ratio_average)
+      for rollup in TaskRollup.objects.filter(task__evaluation_instrument__section__in=section_ids)
+   }
+
+   # START - Section CLO Sums
+   section_clos = {}  # {(section_id, clo_id): [task_count, normalized_sum, ratio_sum]}
+   task_clo_mappings = TaskCLOMapping.objects.filter(task__evaluation_instrument__section__in=section_ids).order_by("task_id", "pk")
+   for task_id, clo_id, section_id in task_clo_mappings.values_list("task_id", "clo_id", "task__evaluation_instrument__section_id"):
+      normalized, ratio = task_averages.get(task_id, (0, 0))
+      sums = section_clos.setdefault((section_id, clo_id), [0, 0.0, 0.0])
+      sums[0] += 1
+      sums[1] += normalized
+      sums[2] += ratio
+   # STOP  - Section CLO Sums
+
+   # START - Section PLO Sums
+   clo_plos = defaultdict(list)  # {clo_id: [plo_id, ...]}
+   for clo_id, plo_id in PLOCLOMapping.objects.filter(clo__in={clo_id for _, clo_id in section_clos}).values_list("clo_id", "plo_id"):
+      clo_plos[clo_id].append(plo_id)
+   section_plos = {}  # {(section_id, plo_id): [clo_count, normalized_sum, ratio_sum]}
+   for (section_id, clo_id), (task_count, normalized_sum, ratio_sum) in section_clos.items():
+      for plo_id in clo_plos.get(clo_id, []):
+         sums = section_plos.setdefault((section_id, plo_id), [0, 0.0, 0.0])
+         sums[0] += 1
+         sums[1] += normalized_sum / task_count
+         sums[2] += ratio_sum / task_count
+   # STOP  - Section PLO Sums
+
+   with transaction.atomic():
+      SectionCLORollup.objects.filter(section__in=section_ids).delete()
+      SectionPLORollup.objects.filter(section__in=section_ids).delete()
+      SectionCLORollup.objects.bulk_create([
+         SectionCLORollup(section_id=section_id, clo_id=clo_id, task_count=task_count, normalized_sum=normalized_sum, ratio_sum=ratio_sum)
+         for (section_id, clo_id), (task_count, normalized_sum, ratio_sum) in section_clos.items()
+      ])
+      SectionPLORollup.objects.bulk_create([
+         SectionPLORollup(section_id=section_id, plo_id=plo_id, clo_count=clo_count, normalized_sum=normalized_sum, ratio_sum=ratio_sum)
+         for (section_id, plo_id), (clo_count, normalized_sum, ratio_sum) in section_plos.items()
+      ])
+
+
+def rebuild_rollups():
+   """
+   Purpose: Throws away every rollup row and rebuilds all of them from the gradebook.
+   Returns:
+      dict: The number of rows in each rollup table afterwards
+   """
+   with transaction.atomic():
+      TaskRollup.objects.all().delete()
+      SectionCLORollup.objects.all().delete()
+      SectionPLORollup.objects.all().delete()
+      refresh_rollups(
+         task_ids=EmbeddedTask.objects.values_list("pk", flat=True),
+         section_ids=Section.objects.values_list("pk", flat=True),
+      )
+   return {
+      "task_rollups": TaskRollup.objects.count(),
+      "section_clo_rollups": SectionCLORollup.objects.count(),
+      "section_plo_rollups": SectionPLORollup.objects.count(),
+   }
+# STOP  - Writing Rollups
+
+
+# START - Reading Rollups
+def section_performance(section_id, mode=RATIO):
+   """
+   Returns ({clo_id: average}, {plo_id: average}) for a single section, read from its rollup rows.
+   """
+   clo_performance = {
+      rollup.clo_id: getattr(rollup, f"{mode}_average")
+      for rollup in SectionCLORollup.objects.filter(section=section_id).order_by("pk")
+   }
+   plo_performance = {
+      rollup.plo_id: getattr(rollup, f"{mode}_average")
+      for rollup in SectionPLORollup.objects.filter(section=section_id).order_by("pk")
+   }
+   return clo_performance, plo_performance
+
+
+def course_clo_performance(course_id, mode=NORMALIZED):
+   """
+   Returns {clo_id: average} for a course, where each CLO's average is the mean of its per-section averages.
+   """
+   all_clo_scores = defaultdict(list)
+   for rollup in SectionCLORollup.objects.filter(section__course=course_id).order_by("section_id", "pk"):
+      all_clo_scores[rollup.clo_id].append(getattr(rollup, f"{mode}_average"))
+   return {clo_id: sum(scores) / len(scores) for clo_id, scores in all_clo_scores.items()}
+
+
+def instrument_performance(instrument_id, mode=NORMALIZED):
+   """
+   Returns ({task_id: average}, {clo_id: average}) for a single evaluation instrument, read from its tasks' rollup rows.
+   """
+   task_ids = list(EmbeddedTask.objects.filter(evaluation_instrument=instrument_id).order_by("pk").values_list("pk", flat=True))
+   rollups = TaskRollup.objects.in_bulk(task_ids)
+   task_performance = {
+      task_id: getattr(rollups[task_id], f"{mode}_average") if task_id in rollups else 0
+      for task_id in task_ids
+   }
+   clo_scores = defaultdict(list)
+   for task_id, clo_id in TaskCLOMapping.objects.filter(task__in=task_ids).order_by("task_id", "pk").values_list("task_id", "clo_id"):
+      clo_scores[clo_id].append(task_performance[task_id])
+   clo_performance = {clo_id: sum(scores) / len(scores) for clo_id, scores in clo_scores.items()}
+   return task_performance, clo_performance
+
+
+def plo_performance(clo_performance):
+   """
+   Returns {plo_id: average} where each PLO's average is the mean of the given CLO averages mapped to it.
+   """
+   plo_scores = defaultdict(list)
+   for clo_id, plo_id in PLOCLOMapping.objects.filter(clo__in=list(clo_performance.keys())).order_by("clo_id", "pk").values_list("clo_id", "plo_id"):
+      plo_scores[plo_id].append(clo_performance[clo_id])
+   return {plo_id: sum(scores) / len(scores) for plo_id, scores in plo_scores.items()}
+# STOP  - Reading Rollups
+
+
+def verify_rollups(tolerance=1e-6):
+   """
+   Purpose: Recomputes every task, section CLO and section PLO average straight from the gradebook and compares them to the rollups.
+   Returns:
+      list: A description of every mismatch (empty when the rollups are current)
+   """
+   aggregator = OutcomeAggregator()
+   mismatches = []
+
+   def compare(label, expected, actual):
+      for key in set(expected) | set(actual):
+         if key not in expected or key not in actual or abs(expected[key] - actual[key]) > tolerance:
+            mismatches.append(f"{label} {key}: expected {expected.get(key)}, rollup has {actual.get(key)}")
+
+   rollups = TaskRollup.objects.in_bulk()
+   for mode in (NORMALIZED, RATIO):
+      compare(
+         f"Task ({mode})",
+         {task_id: average for task_id, average in aggregator.task_performance(mode=mode).items() if task_id in rollups or average != 0},
+         {task_id: getattr(rollup, f"{mode}_average") for task_id, rollup in rollups.items()},
+      )
+
+   section_clo_rollups = defaultdict(list)
+   for rollup in SectionCLORollup.objects.all():
+      section_clo_rollups[rollup.section_id].append(rollup)
+   section_plo_rollups = defaultdict(list)
+   for rollup in SectionPLORollup.objects.all():
+      section_plo_rollups[rollup.section_id].append(rollup)
+
+   for section_id in set(aggregator.section_courses) | set(section_clo_rollups) | set(section_plo_rollups):
+      for mode in (NORMALIZED, RATIO):
+         expected_clos = aggregator.section_clo_performance(section_id, mode)
+         compare(
+            f"Section {section_id} CLO ({mode})",
+            expected_clos,
+            {rollup.clo_id: getattr(rollup, f"{mode}_average") for rollup in section_clo_rollups[section_id]},
+         )
+         compare(
+            f"Section {section_id} PLO ({mode})",
+            aggregator.plo_performance(expected_clos),
+            {rollup.plo_id: getattr(rollup, f"{mode}_average") for rollup in section_plo_rollups[section_id]},
+         )
+   return mismatches
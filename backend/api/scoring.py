@@ -0,0 +1,85 @@
+# API App scoring.py
+
+import numpy as np
+
+
+# NOTE:
+# - This is the vectorized scoring kernel behind the OutcomeAggregator (see aggregation.py)
+# - Nothing in here touches the database, everything works on flat NumPy arrays of integer indices:
+#     gradebook rows are given as (task index, score, total possible score)
+#     a mapping table (Task -> CLO, CLO -> PLO) is given as two parallel index arrays, which together form a sparse incidence matrix
+# - Averages are reduced with np.bincount (np.unique + np.searchsorted for sparse keys and mapping tables), so the cost is a
+#   handful of C loops over the rows instead of interpreted Python loops
+# - Grouped results are returned in order of first appearance, which matches the order the old dictionary based loops produced
+
+
+def task_means(task_index, scores, totals, n_tasks):
+   """
+   Purpose: Computes every task's average from the raw gradebook rows in one pass.
+   Args:
+      task_index (np.ndarray): Task index (0..n_tasks-1) of every gradebook row
+      scores (np.ndarray): Score of every gradebook row
+      totals (np.ndarray): Total possible score of every gradebook row
+      n_tasks (int): Number of tasks
+   Returns:
+      tuple: (normalized, ratio) float arrays of length n_tasks, 0 where a task has no usable scores
+         normalized: the average of every row's (score / total) * 100, rows with a total of 0 are skipped
+         ratio: (average score / average total) * 100
+   """
+   row_counts = np.bincount(task_index, minlength=n_tasks)
+   score_sums = np.bincount(task_index, weights=scores, minlength=n_tasks)
+   total_sums = np.bincount(task_index, weights=totals, minlength=n_tasks)
+
+   ratio = np.zeros(n_tasks)
+   has_total = (row_counts > 0) & (total_sums != 0)
+   ratio[has_total] = score_sums[has_total] / total_sums[has_total] * 100  # The row counts cancel out of avg(score) / avg(total)
+
+   valid = totals > 0  # Rows with no possible points are skipped
+   normalized_sums = np.bincount(task_index[valid], weights=scores[valid] / totals[valid] * 100, minlength=n_tasks)
+   normalized_counts = np.bincount(task_index[valid], minlength=n_tasks)
+   normalized = np.zeros(n_tasks)
+   has_rows = normalized_counts > 0
+   normalized[has_rows] = normalized_sums[has_rows] / normalized_counts[has_rows]
+
+   return normalized, ratio
+
+
+def grouped_means(group_keys, values):
+   """
+   Purpose: Averages values by group key, i.e. one sparse incidence matrix-vector product followed by a division by the row degrees.
+   Args:
+      group_keys (np.ndarray): Integer group key of every value (keys may be sparse, e.g. section_id * n_clos + clo_index)
+      values (np.ndarray): Values to average
+   Returns:
+      tuple: (keys, means) for every key that received at least one value, in order of first appearance
+   """
+   if len(group_keys) == 0:
+      return np.empty(0, dtype=np.int64), np.empty(0)
+   keys, first_seen, inverse = np.unique(group_keys, return_index=True, return_inverse=True)
+   means = np.bincount(inverse, weights=values) / np.bincount(inverse)
+   order = np.argsort(first_seen, kind="stable")
+   return keys[order], means[order]
+
+
+def propagate_means(values, value_sources, edge_sources, edge_targets):
+   """
+   Purpose: Averages values into targets through a mapping table (e.g. task averages into CLOs, CLO averages into PLOs).
+   Every value is copied along every mapping row that starts at its source, then the copies are averaged per target.
+   Args:
+      values (np.ndarray): Values to propagate
+      value_sources (np.ndarray): Source index of every value (a source may appear more than once)
+      edge_sources (np.ndarray): Source index of every mapping row
+      edge_targets (np.ndarray): Target key of every mapping row
+   Returns:
+      tuple: (targets, means) as returned by grouped_means
+   """
+   order = np.argsort(edge_sources, kind="stable")  # Group the mapping rows by source so each source's rows are contiguous
+   sorted_sources = edge_sources[order]
+   sorted_targets = edge_targets[order]
+   starts = np.searchsorted(sorted_sources, value_sources, side="left")
+   counts = np.searchsorted(sorted_sources, value_sources, side="right") - starts
+
+   # Gather the mapping rows of every value: value i contributes to sorted_targets[starts[i] : starts[i] + counts[i]]
+   offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+   targets = sorted_targets[np.repeat(starts, counts) + offsets]
+   return grouped_means(targets, np.repeat(values, counts))
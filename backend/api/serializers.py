@@ -1,5 +1,8 @@
+from collections.abc import Mapping
 from rest_framework import serializers # Import the REST framework serializer
+from rest_framework.fields import empty
 from .models import * # Import models
+from .bulk import BATCH_SIZE # IDs per IN (...) clause
 from django.core.exceptions import ValidationError
 from django.utils.dateparse import parse_date
 from datetime import datetime
@@ -15,6 +18,82 @@ from datetime import datetime
 # rather than the views layer.
 
 
+# START - Batch FK Validation
+# A plain PrimaryKeyRelatedField runs one queryset.get() per field per item, so validating a list of N items with F foreign keys
+# costs N x F queries. Serializers whose FKs use BulkPrimaryKeyRelatedField and whose Meta sets list_serializer_class = BulkListSerializer
+# resolve every ID of the batch up front with one pk__in query per FK field, and each item reads its objects from that lookup.
+# Single object writes (many=False) behave exactly like PrimaryKeyRelatedField.
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+   def _batch_objects(self):
+      """
+      Returns {pk: object} resolved by the enclosing BulkListSerializer for this field, None outside of a batch.
+      """
+      list_serializer = getattr(self.parent, "parent", None)
+      return getattr(list_serializer, "_related_objects", {}).get(self.field_name)
+
+   def to_internal_value(self, data):
+      objects = self._batch_objects()
+      if objects is None or self.pk_field is not None:
+         return super().to_internal_value(data)
+      try:
+         pk = self.get_queryset().model._meta.pk.to_python(data)
+      except ValidationError:
+         return super().to_internal_value(data)  # Reports the bad value the usual way
+      if pk not in objects:
+         self.fail("does_not_exist", pk_value=data)
+      return objects[pk]
+
+
+class BulkListSerializer(serializers.ListSerializer):
+   def to_internal_value(self, data):
+      self._related_objects = {}
+      if isinstance(data, list):  # Anything else is rejected by ListSerializer
+         for name, field in self.child.fields.items():
+            if isinstance(field, BulkPrimaryKeyRelatedField) and not field.read_only and field.pk_field is None:
+               self._related_objects[name] = self._resolve(field, data)
+      try:
+         return super().to_internal_value(data)
+      finally:
+         self._related_objects = {}
+
+   def _resolve(self, field, items):
+      """
+      Returns {pk: object} for every ID the batch sends in the given field that exists in the field's queryset.
+      """
+      queryset = field.get_queryset()
+      pks = set()
+      for item in items:
+         value = field.get_value(item) if isinstance(item, Mapping) else empty
+         try:
+            if value is not empty and value is not None:
+               pks.add(queryset.model._meta.pk.to_python(value))
+         except (ValidationError, TypeError):  # Bad values are reported per item by the field
+            continue
+      pks, objects = list(pks), {}
+      for start in range(0, len(pks), BATCH_SIZE):
+         objects.update((obj.pk, obj) for obj in queryset.filter(pk__in=pks[start:start + BATCH_SIZE]))
+      return objects
+# STOP - Batch FK Validation
+
+
+# START - Query Plans
+# Serializers that nest related objects (the *_details fields) declare next to their fields what has to be loaded with a row
+# to serialize it: select_related_fields / prefetch_related_fields, as full paths from the serializer's model. List views
+# pass their queryset through setup_eager_loading(), so a list costs the same few queries whether it has 5 rows or 5,000.
+class EagerLoadingMixin:
+   select_related_fields = ()
+   prefetch_related_fields = ()
+
+   @classmethod
+   def setup_eager_loading(cls, queryset):
+      if cls.select_related_fields:
+         queryset = queryset.select_related(*cls.select_related_fields)
+      if cls.prefetch_related_fields:
+         queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+      return queryset
+# STOP - Query Plans
+
+
 # UserRole Serializer
 class UserRoleSerializer(serializers.ModelSerializer):
    class Meta:
@@ -24,7 +103,9 @@ class UserRoleSerializer(serializers.ModelSerializer):
 
 
 # User Serializer
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["role"]  # Query plan, see EagerLoadingMixin
+   
    role = UserRoleSerializer(read_only=True)  # Include role data in the serialized response
    role_id = serializers.PrimaryKeyRelatedField(queryset=UserRole.objects.all(), write_only=True)  # For creating/updating a user, use the role ID
    
@@ -65,10 +146,11 @@ class UserSerializer(serializers.ModelSerializer):
 
 # Log Serializer
 class LogSerializer(serializers.ModelSerializer):
-   user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())  # Explicit FK validation
+   user = BulkPrimaryKeyRelatedField(queryset=User.objects.all())  # Explicit FK validation
    
    class Meta:
       model = Log
+      list_serializer_class = BulkListSerializer
       fields = ['log_id', 'user', 'action', 'timestamp', 'description']
 
 
@@ -81,21 +163,25 @@ class AccreditationOrganizationSerializer(serializers.ModelSerializer):
 
 
 # Accreditation Version Serializer
-class AccreditationVersionSerializer(serializers.ModelSerializer):
-   a_organization = serializers.PrimaryKeyRelatedField(queryset=AccreditationOrganization.objects.all())
+class AccreditationVersionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["a_organization"]  # Query plan, see EagerLoadingMixin
+   
+   a_organization = BulkPrimaryKeyRelatedField(queryset=AccreditationOrganization.objects.all())
    a_organization_details = AccreditationOrganizationSerializer(source='a_organization', read_only=True)
    
    class Meta:
       model = AccreditationVersion
+      list_serializer_class = BulkListSerializer
       fields = ['a_version_id', 'a_organization',  'a_organization_details', 'year']
 
 
 # Program Learning Objective Serializer
 class ProgramLearningObjectiveSerializer(serializers.ModelSerializer):
-   a_version = serializers.PrimaryKeyRelatedField(queryset=AccreditationVersion.objects.all())  # Explicit FK validation
+   a_version = BulkPrimaryKeyRelatedField(queryset=AccreditationVersion.objects.all())  # Explicit FK validation
    
    class Meta:
       model = ProgramLearningObjective
+      list_serializer_class = BulkListSerializer
       fields = ['plo_id', 'a_version', 'designation', 'description']
 
 
@@ -108,12 +194,15 @@ class ProgramSerializer(serializers.ModelSerializer):
 
 
 # Course Serializer
-class CourseSerializer(serializers.ModelSerializer):
-   a_version = serializers.PrimaryKeyRelatedField(queryset=AccreditationVersion.objects.all(), write_only=True)
+class CourseSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["a_version__a_organization"]  # Query plan, see EagerLoadingMixin
+   
+   a_version = BulkPrimaryKeyRelatedField(queryset=AccreditationVersion.objects.all(), write_only=True)
    a_version_details = AccreditationVersionSerializer(source='a_version', read_only=True) # Nested, read-only serializer
    
    class Meta:
       model = Course
+      list_serializer_class = BulkListSerializer
       fields = ['course_id', 'a_version', 'a_version_details', 'course_number', 'name', 'description', 'date_added', 'date_removed']
       depth = 1  # This will automatically expand foreign keys
    
@@ -165,11 +254,12 @@ class CourseSerializer(serializers.ModelSerializer):
 # Program Course Mapping Serializer
 class ProgramCourseMappingSerializer(serializers.ModelSerializer):
    # Mapping models require double FK validation (at minimum)
-   program = serializers.PrimaryKeyRelatedField(queryset=Program.objects.all())  # Explicit FK validation
-   course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())  # Explicit FK validation
+   program = BulkPrimaryKeyRelatedField(queryset=Program.objects.all())  # Explicit FK validation
+   course = BulkPrimaryKeyRelatedField(queryset=Course.objects.all())  # Explicit FK validation
    
    class Meta:
       model = ProgramCourseMapping
+      list_serializer_class = BulkListSerializer
       fields = ['program_course_mapping_id', 'program', 'course']
 
 
@@ -182,10 +272,12 @@ class SemesterSerializer(serializers.ModelSerializer):
 
 
 # Section Serializer
-class SectionSerializer(serializers.ModelSerializer):
-   course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())
-   semester = serializers.PrimaryKeyRelatedField(queryset=Semester.objects.all())
-   instructor = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+class SectionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["course__a_version__a_organization", "semester", "instructor__role"]  # Query plan, see EagerLoadingMixin
+   
+   course = BulkPrimaryKeyRelatedField(queryset=Course.objects.all())
+   semester = BulkPrimaryKeyRelatedField(queryset=Semester.objects.all())
+   instructor = BulkPrimaryKeyRelatedField(queryset=User.objects.all())
    
    course_details = CourseSerializer(source='course', read_only=True)
    semester_details = SemesterSerializer(source='semester', read_only=True)
@@ -193,6 +285,7 @@ class SectionSerializer(serializers.ModelSerializer):
    
    class Meta:
       model = Section
+      list_serializer_class = BulkListSerializer
       fields = ['section_id', 'course', 'section_number', 'semester', 'crn', 'instructor', 'course_details', 'semester_details', 'instructor_details']
 
 
@@ -204,59 +297,68 @@ class EvaluationTypeSerializer(serializers.ModelSerializer):
 
 
 # Evaluation Instrument Serializer
-class EvaluationInstrumentSerializer(serializers.ModelSerializer):
-   section = serializers.PrimaryKeyRelatedField(queryset=Section.objects.all())  # Explicit FK validation
-   evaluation_type = serializers.PrimaryKeyRelatedField(queryset=EvaluationType.objects.all())  # Explicit FK validation
+class EvaluationInstrumentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["section__course__a_version__a_organization", "section__semester", "section__instructor__role", "evaluation_type"]  # Query plan, see EagerLoadingMixin
+   
+   section = BulkPrimaryKeyRelatedField(queryset=Section.objects.all())  # Explicit FK validation
+   evaluation_type = BulkPrimaryKeyRelatedField(queryset=EvaluationType.objects.all())  # Explicit FK validation
    
    section_details = SectionSerializer(source='section', read_only=True)
    evaluation_type_details = EvaluationTypeSerializer(source='evaluation_type', read_only=True)
    
    class Meta:
       model = EvaluationInstrument
+      list_serializer_class = BulkListSerializer
       fields = ['evaluation_instrument_id', 'section', 'section_details', 'evaluation_type', 'evaluation_type_details', 'name', 'description']
 
 
 # Embedded Task Serializer
 class EmbeddedTaskSerializer(serializers.ModelSerializer):
-   evaluation_instrument = serializers.PrimaryKeyRelatedField(queryset=EvaluationInstrument.objects.all())  # Explicit FK validation
+   evaluation_instrument = BulkPrimaryKeyRelatedField(queryset=EvaluationInstrument.objects.all())  # Explicit FK validation
    
    class Meta:
       model = EmbeddedTask
+      list_serializer_class = BulkListSerializer
       fields = ['embedded_task_id', 'evaluation_instrument', 'task_number', 'task_text']
 
 
 # Course Learning Objective Serializer
-class CourseLearningObjectiveSerializer(serializers.ModelSerializer):
-   course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())
-   created_by = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+class CourseLearningObjectiveSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+   select_related_fields = ["course__a_version__a_organization", "created_by__role"]  # Query plan, see EagerLoadingMixin
+   
+   course = BulkPrimaryKeyRelatedField(queryset=Course.objects.all())
+   created_by = BulkPrimaryKeyRelatedField(queryset=User.objects.all())
    
    course_details = CourseSerializer(source='course', read_only=True)
    created_by_details = UserSerializer(source='created_by', read_only=True)
    
    class Meta:
       model = CourseLearningObjective
+      list_serializer_class = BulkListSerializer
       fields = ['clo_id', 'course', 'designation', 'description', 'created_by', 'course_details', 'created_by_details']
 
 
 # Task CLO Mapping Serializer
 class TaskCLOMappingSerializer(serializers.ModelSerializer):
    # Mapping model requires both FK to be validated
-   task = serializers.PrimaryKeyRelatedField(queryset=EmbeddedTask.objects.all())  # Explicit FK validation
-   clo = serializers.PrimaryKeyRelatedField(queryset=CourseLearningObjective.objects.all())  # Explicit FK validation
+   task = BulkPrimaryKeyRelatedField(queryset=EmbeddedTask.objects.all())  # Explicit FK validation
+   clo = BulkPrimaryKeyRelatedField(queryset=CourseLearningObjective.objects.all())  # Explicit FK validation
    
    class Meta:
       model = TaskCLOMapping
+      list_serializer_class = BulkListSerializer
       fields = ['task_clo_mapping_id', 'task', 'clo']
 
 
 # PLO CLO Mapping Serializer
 class PLOCLOMappingSerializer(serializers.ModelSerializer):
    # Mapping model requires both FK to be validated
-   plo = serializers.PrimaryKeyRelatedField(queryset=ProgramLearningObjective.objects.all())  # Explicit FK validation
-   clo = serializers.PrimaryKeyRelatedField(queryset=CourseLearningObjective.objects.all())  # Explicit FK validation
+   plo = BulkPrimaryKeyRelatedField(queryset=ProgramLearningObjective.objects.all())  # Explicit FK validation
+   clo = BulkPrimaryKeyRelatedField(queryset=CourseLearningObjective.objects.all())  # Explicit FK validation
    
    class Meta:
       model = PLOCLOMapping
+      list_serializer_class = BulkListSerializer
       fields = ['plo_clo_mapping_id', 'plo', 'clo']
 
 
@@ -270,9 +372,29 @@ class StudentSerializer(serializers.ModelSerializer):
 # Student Task Mapping Serializer
 class StudentTaskMappingSerializer(serializers.ModelSerializer):
    # Mapping model requires both FK to be validated
-   task = serializers.PrimaryKeyRelatedField(queryset=EmbeddedTask.objects.all())  # Explicit FK validation
-   student = serializers.PrimaryKeyRelatedField(queryset=Student.objects.all())  # Explicit FK validation
+   task = BulkPrimaryKeyRelatedField(queryset=EmbeddedTask.objects.all())  # Explicit FK validation
+   student = BulkPrimaryKeyRelatedField(queryset=Student.objects.all())  # Explicit FK validation
    
    class Meta:
       model = StudentTaskMapping
-      fields = ['task_clo_mapping_id', 'student', 'task']
+      list_serializer_class = BulkListSerializer
+      fields = ['student_task_mapping_id', 'student', 'task', 'score', 'total_possible_score']
+
+
+# Report Job Serializer
+class ReportJobSerializer(serializers.ModelSerializer):
+   report_type = serializers.ChoiceField(choices=ReportJob.REPORT_TYPE_CHOICES)
+   parameters = serializers.DictField(child=serializers.ListField(child=serializers.CharField()), required=False)
+   
+   class Meta:
+      model = ReportJob
+      fields = ['report_job_id', 'report_type', 'object_id', 'parameters', 'status', 'error', 'requested_by', 'created_at', 'started_at', 'finished_at']
+      read_only_fields = ['status', 'error', 'requested_by', 'created_at', 'started_at', 'finished_at']
+
+
+# Ingestion Job Serializer
+class IngestionJobSerializer(serializers.ModelSerializer):
+   class Meta:
+      model = IngestionJob
+      fields = ['ingestion_job_id', 'source', 'evaluation_instrument', 'status', 'rows_total', 'rows_validated', 'rows_written', 'result', 'error', 'requested_by', 'created_at', 'started_at', 'finished_at']
+      read_only_fields = fields  # Jobs are created by the upload endpoints, never through this serializer
@@ -0,0 +1,57 @@
+# API App signals.py
+
+from django.core.signals import request_started, request_finished
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import * # Import models
+from .rollups import TRACKED_FIELDS, schedule_mapping_refresh # Keeps the outcome rollup tables current
+from .report_cache import REPORT_SOURCE_MODELS, schedule_data_version_bump, start_request_data_version, finish_request_data_version # Invalidates cached reports
+
+
+# NOTE:
+# - These receivers keep the rollup tables (see rollups.py) current whenever a gradebook row or a mapping row changes
+# - Updates can move a row to another task/CLO, so the previous foreign keys are remembered in pre_save and both the
+#   old and the new owner get refreshed
+# - Any write to a model the reports read from also moves the report cache's data version forward (see report_cache.py),
+#   and each request reads that version once
+# - Registered in ApiConfig.ready() (apps.py)
+
+
+def _owner_ids(instance):
+   """
+   Returns the current and (for updates) previous value of the instance's tracked foreign key.
+   """
+   field = TRACKED_FIELDS[type(instance)]
+   return {getattr(instance, field), getattr(instance, "_rollup_previous_owner_id", None)} - {None}
+
+
+@receiver(pre_save, sender=StudentTaskMapping)
+@receiver(pre_save, sender=TaskCLOMapping)
+@receiver(pre_save, sender=PLOCLOMapping)
+def remember_previous_owner(sender, instance, **kwargs):
+   if instance.pk is not None:
+      instance._rollup_previous_owner_id = sender.objects.filter(pk=instance.pk).values_list(TRACKED_FIELDS[sender], flat=True).first()
+
+
+@receiver(post_save, sender=StudentTaskMapping)
+@receiver(post_delete, sender=StudentTaskMapping)
+@receiver(post_save, sender=TaskCLOMapping)
+@receiver(post_delete, sender=TaskCLOMapping)
+@receiver(post_save, sender=PLOCLOMapping)
+@receiver(post_delete, sender=PLOCLOMapping)
+def mapping_changed(sender, instance, **kwargs):
+   schedule_mapping_refresh(sender, _owner_ids(instance))
+
+
+def report_data_changed(sender, instance, **kwargs):
+   schedule_data_version_bump()
+
+
+for model in REPORT_SOURCE_MODELS:
+   post_save.connect(report_data_changed, sender=model, dispatch_uid=f"report_data_saved_{model.__name__}")
+   post_delete.connect(report_data_changed, sender=model, dispatch_uid=f"report_data_deleted_{model.__name__}")
+
+
+request_started.connect(start_request_data_version, dispatch_uid="start_request_data_version")
+request_finished.connect(finish_request_data_version, dispatch_uid="finish_request_data_version")
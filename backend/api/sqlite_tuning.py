@@ -0,0 +1,25 @@
+# API App sqlite_tuning.py
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# NOTE:
+# - Smaller deployments keep the default SQLite database, this applies settings.SQLITE_PRAGMAS to every new SQLite connection
+#   (WAL journaling, synchronous=NORMAL, busy timeout, page cache, memory mapping, in-memory temp store)
+# - WAL is what matters most: without it a gradebook import locks readers out of the whole file while it commits, with it
+#   readers see the last committed data and only writers wait on each other (for up to busy_timeout)
+# - journal_mode=WAL is stored in the database file, the other pragmas only last as long as the connection
+# - Turned off with SQLITE_TUNING = False (env SQLITE_TUNING=false), PostgreSQL connections are never touched
+# - Measure the difference with: python manage.py benchmark_sqlite_concurrency
+# - Registered in ApiConfig.ready() (apps.py)
+
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+   if connection.vendor != "sqlite" or not settings.SQLITE_TUNING:
+      return
+   with connection.cursor() as cursor:
+      for pragma, value in settings.SQLITE_PRAGMAS.items():
+         cursor.execute(f"PRAGMA {pragma} = {value}")
@@ -16,6 +16,7 @@ django.setup()
 
 # Import models
 from api.models import *
+from api.serializers import EvaluationInstrumentSerializer
 
 # Import apps
 from django.apps import apps
@@ -814,6 +815,1151 @@ def test_student_model():
 
 
 
+# START - Scoring Kernel Tests
+import numpy as np
+from django.test import SimpleTestCase
+from api import scoring
+
+
+def reference_task_means(task_index, scores, totals, n_tasks):
+   """
+   The per-row loops the views used before the NumPy kernel, kept as the reference.
+   """
+   normalized, ratio = [0.0] * n_tasks, [0.0] * n_tasks
+   for task in range(n_tasks):
+      rows = [(score, total) for index, score, total in zip(task_index, scores, totals) if index == task]
+      usable = [score / total * 100 for score, total in rows if total > 0]
+      if usable:
+         normalized[task] = sum(usable) / len(usable)
+      if rows and sum(total for _, total in rows) != 0:
+         ratio[task] = (sum(score for score, _ in rows) / len(rows)) / (sum(total for _, total in rows) / len(rows)) * 100
+   return normalized, ratio
+
+
+def reference_propagate_means(values, value_sources, edge_sources, edge_targets):
+   copies = {}  # {target: [value, ...]} in order of first appearance
+   for value, source in zip(values, value_sources):
+      for edge_source, target in zip(edge_sources, edge_targets):
+         if edge_source == source:
+            copies.setdefault(target, []).append(value)
+   return list(copies), [sum(copied) / len(copied) for copied in copies.values()]
+
+
+class ScoringKernelTests(SimpleTestCase):
+   """
+   Compares the vectorized kernel (see scoring.py) with plain Python loops, edge cases included.
+   """
+   def assertMeans(self, actual, expected):
+      keys, means = actual
+      self.assertEqual(keys.tolist(), list(expected[0]))
+      np.testing.assert_allclose(means, expected[1])
+   
+   def test_task_means_match_the_reference(self):
+      rng = np.random.default_rng(7)
+      task_index = rng.integers(0, 6, 200)
+      scores = rng.integers(0, 21, 200).astype(float)
+      totals = rng.choice([0.0, 10.0, 20.0], 200)
+      task_index[task_index == 4] = 3  # Task 4 has no rows at all
+      totals[task_index == 5] = 0  # Every row of task 5 has no possible points
+      
+      normalized, ratio = scoring.task_means(task_index, scores, totals, 6)
+      expected_normalized, expected_ratio = reference_task_means(task_index, scores, totals, 6)
+      np.testing.assert_allclose(normalized, expected_normalized)
+      np.testing.assert_allclose(ratio, expected_ratio)
+      self.assertEqual((normalized[4], ratio[4], normalized[5], ratio[5]), (0, 0, 0, 0))
+   
+   def test_empty_input(self):
+      empty_index, empty_values = np.empty(0, dtype=np.int64), np.empty(0)
+      normalized, ratio = scoring.task_means(empty_index, empty_values, empty_values, 3)
+      self.assertEqual((normalized.tolist(), ratio.tolist()), ([0, 0, 0], [0, 0, 0]))
+      self.assertMeans(scoring.grouped_means(empty_index, empty_values), ([], []))
+      self.assertMeans(scoring.propagate_means(empty_values, empty_index, np.array([0, 1]), np.array([5, 6])), ([], []))
+      self.assertMeans(scoring.propagate_means(np.array([50.0]), np.array([0]), empty_index, empty_index), ([], []))
+   
+   def test_grouped_means_keep_first_appearance_order(self):
+      keys = np.array([30, 10, 30, 20, 10])
+      values = np.array([1.0, 2.0, 3.0, 4.0, 6.0])
+      self.assertMeans(scoring.grouped_means(keys, values), ([30, 10, 20], [2.0, 4.0, 4.0]))  # Groups without values get no entry
+   
+   def test_propagate_means_match_the_reference(self):
+      values = np.array([80.0, 60.0, 40.0, 90.0])
+      value_sources = np.array([0, 1, 2, 1])  # Source 1 has two values
+      edge_sources = np.array([1, 0, 1, 0, 1])  # Source 0 -> 7 is listed twice, source 2 maps to nothing
+      edge_targets = np.array([8, 7, 9, 7, 7])
+      self.assertMeans(
+         scoring.propagate_means(values, value_sources, edge_sources, edge_targets),
+         reference_propagate_means(values, value_sources, edge_sources, edge_targets),
+      )
+      rng = np.random.default_rng(7)
+      values, value_sources = rng.uniform(0, 100, 50), rng.integers(0, 12, 50)
+      edge_sources, edge_targets = rng.integers(0, 15, 40), rng.integers(100, 106, 40)
+      self.assertMeans(
+         scoring.propagate_means(values, value_sources, edge_sources, edge_targets),
+         reference_propagate_means(values, value_sources, edge_sources, edge_targets),
+      )
+# STOP - Scoring Kernel Tests
+
+
+
+# START - Test Dataset
+# NOTE:
+# - seed_regression_dataset() builds the small seeded program the database tests below (and the regression tests) run against
+import random
+from api.rollups import rebuild_rollups
+
+
+def seed_regression_dataset():
+   """
+   Purpose: Creates a deterministic program with two accreditation versions, three courses, six sections and a random (but seeded) gradebook.
+   Includes tasks with no CLO mappings, CLOs with no tasks and gradebook rows with a total possible score of 0.
+   Returns:
+      User: The superuser that owns the dataset
+   """
+   rng = random.Random(7)
+   role = UserRole.objects.create(role_name="root")
+   user = User.objects.create_user("D00000001", "root@desu.edu", password=None, role=role, first_name="Root", last_name="User", is_superuser=True)
+   organization = AccreditationOrganization.objects.create(name="ABET", description="Accreditation Board")
+   versions = [AccreditationVersion.objects.create(a_organization=organization, year=year) for year in (2024, 2025)]
+   version_plos = {
+      versions[0]: [ProgramLearningObjective.objects.create(a_version=versions[0], designation=letter, description=f"PLO {letter}") for letter in "abcd"],
+      versions[1]: [ProgramLearningObjective.objects.create(a_version=versions[1], designation=letter, description=f"PLO {letter}") for letter in "ab"],
+   }
+   program = Program.objects.create(designation="CSCI", description="Computer Science")
+   semesters = [Semester.objects.create(designation=designation) for designation in (202401, 202402)]
+   evaluation_types = [EvaluationType.objects.create(type_name=name, description="desc") for name in ("Exam", "HW")]
+   students = [Student.objects.create(email=f"student{index}@desu.edu", first_name="First", last_name="Last") for index in range(8)]
+   
+   for course_index, version in enumerate([versions[0], versions[0], versions[1]]):
+      course = Course.objects.create(a_version=version, course_number=100 + course_index, name=f"Course {course_index}", description="desc")
+      ProgramCourseMapping.objects.create(program=program, course=course)
+      clos = [CourseLearningObjective.objects.create(course=course, designation=designation, description=f"CLO {designation}", created_by=user) for designation in range(1, 4)]
+      for clo in clos:
+         for plo in rng.sample(version_plos[version], 2):
+            PLOCLOMapping.objects.create(plo=plo, clo=clo)
+      for semester_index, semester in enumerate(semesters):
+         section = Section.objects.create(course=course, section_number=f"{semester_index + 1}", semester=semester, crn=f"{course_index}{semester_index}", instructor=user)
+         for evaluation_type in evaluation_types:
+            instrument = EvaluationInstrument.objects.create(section=section, evaluation_type=evaluation_type, name=evaluation_type.type_name, description="desc")
+            for task_number in range(1, 5):
+               task = EmbeddedTask.objects.create(evaluation_instrument=instrument, task_number=task_number, task_text="task")
+               for clo in rng.sample(clos, rng.randint(0, 2)):
+                  TaskCLOMapping.objects.create(task=task, clo=clo)
+               for student in rng.sample(students, 6):
+                  total_possible_score = rng.choice([10, 20, 0]) if task_number == 4 else rng.choice([10, 20])
+                  StudentTaskMapping.objects.create(student=student, task=task, score=rng.randint(0, 20), total_possible_score=total_possible_score)
+   
+   rebuild_rollups()  # The test transaction never commits, so the on-commit refreshes never run
+   return user
+# STOP - Test Dataset
+
+
+
+# START - Rollup Signal Tests
+from django.test import TestCase
+from api.rollups import verify_rollups
+
+
+class RollupSignalTests(TestCase):
+   """
+   Checks that the single-row signal handlers (see signals.py) keep the rollups equal to a full recomputation through creates,
+   updates, moves to another task/CLO and deletes, every write committed on its own.
+   """
+   @classmethod
+   def setUpTestData(cls):
+      seed_regression_dataset()
+   
+   def write(self, label, change):
+      with self.captureOnCommitCallbacks(execute=True):
+         change()
+      self.assertEqual(verify_rollups(), [], label)
+   
+   def free_task(self, model, other, exclude_section=None):
+      """
+      Returns a task of another section than exclude_section that has no model row for other (a student or a CLO).
+      """
+      field = "student" if model is StudentTaskMapping else "clo"
+      tasks = EmbeddedTask.objects.exclude(**{f"{model.__name__.lower()}__{field}": other}).exclude(evaluation_instrument__section=exclude_section)
+      return tasks.order_by("pk").first()
+   
+   def test_student_task_mapping_writes(self):
+      student = Student.objects.get(email="student0@desu.edu")
+      grade = StudentTaskMapping(student=student, task=self.free_task(StudentTaskMapping, student), score=7, total_possible_score=10)
+      self.write("create", grade.save)
+      grade.score = 2
+      self.write("update", grade.save)
+      grade.task = self.free_task(StudentTaskMapping, student, exclude_section=grade.task.evaluation_instrument.section_id)
+      self.write("move", grade.save)  # The previous task (in another section) must be refreshed too
+      self.write("delete", grade.delete)
+   
+   def test_task_clo_mapping_writes(self):
+      clo = CourseLearningObjective.objects.get(pk=1)
+      mapping = TaskCLOMapping(task=self.free_task(TaskCLOMapping, clo), clo=clo)
+      self.write("create", mapping.save)
+      mapping.clo = CourseLearningObjective.objects.exclude(pk=clo.pk).exclude(taskclomapping__task=mapping.task).first()
+      self.write("update", mapping.save)
+      mapping.task = self.free_task(TaskCLOMapping, mapping.clo, exclude_section=mapping.task.evaluation_instrument.section_id)
+      self.write("move", mapping.save)
+      self.write("delete", mapping.delete)
+      
+      last_mappings = list(TaskCLOMapping.objects.filter(task__evaluation_instrument__section=1))
+      for mapping in last_mappings:
+         self.write(f"delete {mapping.pk} of section 1", mapping.delete)
+      self.assertFalse(SectionCLORollup.objects.filter(section=1).exists())
+   
+   def test_plo_clo_mapping_writes(self):
+      clo = CourseLearningObjective.objects.get(pk=1)
+      plo = ProgramLearningObjective.objects.filter(a_version=clo.course.a_version).exclude(ploclomapping__clo=clo).first()
+      mapping = PLOCLOMapping(plo=plo, clo=clo)
+      self.write("create", mapping.save)
+      mapping.plo = ProgramLearningObjective.objects.filter(a_version=clo.course.a_version).exclude(ploclomapping__clo=clo).first()
+      self.write("update", mapping.save)
+      mapping.clo = CourseLearningObjective.objects.exclude(course=clo.course).exclude(ploclomapping__plo=mapping.plo).first()
+      self.write("move", mapping.save)  # CLO 1's sections lose the PLO, the new CLO's sections gain it
+      self.write("delete", mapping.delete)
+      
+      for mapping in list(PLOCLOMapping.objects.filter(clo=clo)):
+         self.write(f"delete {mapping.pk} of CLO 1", mapping.delete)
+# STOP - Rollup Signal Tests
+
+
+
+# START - Report Job Tests
+import tempfile
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from api.report_jobs import run_queued_report_jobs, run_report_job
+
+
+@override_settings(REPORT_CACHE_MAX_BYTES=0, CHART_RENDER_WORKERS=0, REPORT_JOB_EXECUTOR="inline")
+class ReportJobTests(TestCase):
+   """
+   Covers the background report queue (see report_jobs.py) with the inline executor: enqueue, poll, download and failures.
+   """
+   @classmethod
+   def setUpTestData(cls):
+      cls.user = seed_regression_dataset()
+   
+   def setUp(self):
+      self.client = APIClient()
+      self.client.force_authenticate(self.user)
+      job_dir = tempfile.TemporaryDirectory()
+      self.addCleanup(job_dir.cleanup)
+      self.enterContext(self.settings(REPORT_JOB_DIR=job_dir.name))
+   
+   def enqueue(self, report_type, object_id, parameters=None, execute=True):
+      with self.captureOnCommitCallbacks(execute=execute):
+         response = self.client.post("/api/report-jobs/", {"report_type": report_type, "object_id": object_id, "parameters": parameters or {}}, format="json")
+      return response
+   
+   def test_job_runs_and_downloads(self):
+      response = self.enqueue("section", 1)
+      self.assertEqual((response.status_code, response.json()["status"]), (202, "queued"))
+      job_id = response.json()["report_job_id"]
+      
+      job = self.client.get(f"/api/report-jobs/{job_id}/").json()
+      self.assertEqual((job["status"], job["error"]), ("succeeded", None))
+      download = self.client.get(f"/api/report-jobs/{job_id}/download/")
+      self.assertEqual(download.status_code, 200)
+      self.assertIn('filename="Section_Performance.pdf"', download["Content-Disposition"])
+      self.assertTrue(b"".join(download.streaming_content).startswith(b"%PDF"))
+      self.assertEqual([job["report_job_id"] for job in self.client.get("/api/report-jobs/").json()], [job_id])
+   
+   def test_bad_parameters_fail_the_job(self):
+      response = self.enqueue("program", 1, {"selectedProgramSemesters": ["not json"]})
+      job = ReportJob.objects.get(pk=response.json()["report_job_id"])
+      self.assertEqual(job.status, "failed")
+      self.assertIn("Invalid semester format in selectedProgramSemesters", job.error)
+      self.assertIsNotNone(job.finished_at)
+      download = self.client.get(f"/api/report-jobs/{job.pk}/download/")
+      self.assertEqual((download.status_code, download.json()["error"]), (409, job.error))
+   
+   def test_missing_objects(self):
+      for report_type in ("program", "course", "section"):
+         response = self.enqueue(report_type, 999)
+         self.assertEqual(response.status_code, 404, report_type)
+      self.assertFalse(ReportJob.objects.exists())
+   
+   def test_download_before_finish_and_after_cleanup(self):
+      job_id = self.enqueue("section", 1, execute=False).json()["report_job_id"]  # The hand-off to the pool is captured but never run, the job stays queued
+      self.assertEqual(self.client.get(f"/api/report-jobs/{job_id}/download/").status_code, 409)
+      
+      self.assertTrue(run_report_job(job_id))
+      self.assertFalse(run_report_job(job_id))  # Already claimed, a job never runs twice
+      self.assertEqual(ReportJob.objects.get(pk=job_id).status, "succeeded")
+      
+      os.remove(ReportJob.objects.get(pk=job_id).result_path)
+      self.assertEqual(self.client.get(f"/api/report-jobs/{job_id}/download/").status_code, 410)
+   
+   @override_settings(REPORT_JOB_STALE_SECONDS=600)
+   def test_stale_running_job_is_requeued(self):
+      stale_id = self.enqueue("section", 1, execute=False).json()["report_job_id"]
+      busy_id = self.enqueue("section", 1, execute=False).json()["report_job_id"]
+      ReportJob.objects.filter(pk=stale_id).update(status="running", started_at=timezone.now() - timedelta(seconds=601))  # Its worker died
+      ReportJob.objects.filter(pk=busy_id).update(status="running", started_at=timezone.now() - timedelta(seconds=60))  # Still being built
+      
+      self.assertEqual(run_queued_report_jobs(), 1)
+      self.assertEqual(ReportJob.objects.get(pk=stale_id).status, "succeeded")
+      self.assertEqual(ReportJob.objects.get(pk=busy_id).status, "running")
+# STOP - Report Job Tests
+
+
+
+# START - Report Cache Tests
+import json
+import tempfile
+from unittest import mock
+from django.test import TestCase
+from django.http import QueryDict
+from api import report_cache
+
+
+class ReportCacheTests(TestCase):
+   """
+   Covers the on-disk report cache (see report_cache.py): hits, key normalization, invalidation by data version and LRU eviction.
+   """
+   @classmethod
+   def setUpTestData(cls):
+      seed_regression_dataset()
+   
+   def setUp(self):
+      cache_dir = tempfile.TemporaryDirectory()
+      self.addCleanup(cache_dir.cleanup)
+      self.cache_dir = cache_dir.name
+      self.enterContext(self.settings(REPORT_CACHE_DIR=self.cache_dir, REPORT_CACHE_MAX_BYTES=10 * 1024 * 1024))
+   
+   def key(self, query_string, data_version="1:1"):
+      return report_cache.cache_key("course", 1, QueryDict(query_string), data_version)
+   
+   def test_second_request_is_served_from_disk(self):
+      build = mock.Mock(return_value=b"%PDF-1.4 report")
+      with report_cache.open_or_build("course", 1, QueryDict(), build) as first:
+         self.assertEqual(first.read(), b"%PDF-1.4 report")
+      with report_cache.open_or_build("course", 1, QueryDict(), build) as second:
+         self.assertEqual(second.read(), b"%PDF-1.4 report")
+         self.assertTrue(second.name.startswith(self.cache_dir))  # The stored file, not a rebuilt buffer
+      build.assert_called_once()
+   
+   def test_equivalent_parameters_share_a_key(self):
+      semester_1, semester_2 = json.dumps({"semester_id": 1}), json.dumps({"semester_id": 2})
+      self.assertEqual(
+         self.key(f"selectedCourseSemesters={semester_1}&selectedCourseSemesters={semester_2}&excludedSection=3&excludedSection=1"),
+         self.key(f"excludedSection=1&excludedSection=3&selectedCourseSemesters={semester_2}&selectedCourseSemesters={semester_1}"),
+      )
+      self.assertNotEqual(self.key(f"selectedCourseSemesters={semester_1}"), self.key(f"selectedCourseSemesters={semester_2}"))
+   
+   def test_writes_change_the_key(self):
+      versions = [report_cache.current_data_version()]
+      with self.captureOnCommitCallbacks(execute=True):
+         grade = StudentTaskMapping.objects.first()
+         grade.score += 1
+         grade.save()
+      versions.append(report_cache.current_data_version())
+      with self.captureOnCommitCallbacks(execute=True):
+         TaskCLOMapping.objects.create(task=EmbeddedTask.objects.last(), clo=CourseLearningObjective.objects.last())
+      versions.append(report_cache.current_data_version())
+      self.assertEqual(len(set(versions)), 3)
+      self.assertEqual(len({self.key("", version) for version in versions}), 3)
+   
+   def test_data_version_is_read_once_per_request(self):
+      report_cache.current_data_version()  # Creates the row, as the first write would
+      report_cache.start_request_data_version()
+      self.addCleanup(report_cache.finish_request_data_version)
+      with self.assertNumQueries(1):  # A plain read, no get_or_create
+         version = report_cache.current_data_version()
+         self.assertEqual(report_cache.current_data_version(), version)
+      with self.captureOnCommitCallbacks(execute=True):
+         grade = StudentTaskMapping.objects.first()
+         grade.score += 1
+         grade.save()
+      self.assertNotEqual(report_cache.current_data_version(), version)  # The request's own write is seen
+      
+      report_cache.finish_request_data_version()
+      with self.assertNumQueries(2):  # Outside of a request every call reads
+         report_cache.current_data_version()
+         report_cache.current_data_version()
+   
+   def test_least_recently_used_entries_are_evicted(self):
+      paths = []
+      for age, name in enumerate("abc"):
+         paths.append(report_cache.store(name, b"x" * 100))
+         os.utime(paths[-1], (1000 + age, 1000 + age))  # a is the oldest
+      report_cache.lookup("a")  # A hit makes a the most recently used
+      
+      with self.settings(REPORT_CACHE_MAX_BYTES=250):
+         report_cache.evict()
+         self.assertEqual(sorted(os.listdir(self.cache_dir)), ["a.pdf", "c.pdf"])  # b was used least recently
+         
+         kept = report_cache.store("d", b"x" * 300)  # Bigger than the whole cache, still kept
+      self.assertEqual(os.listdir(self.cache_dir), ["d.pdf"])
+      self.assertEqual(kept, os.path.join(self.cache_dir, "d.pdf"))
+# STOP - Report Cache Tests
+
+
+
+# START - Chart Pool Tests
+from unittest import mock
+from concurrent.futures import BrokenExecutor
+from django.test import SimpleTestCase, override_settings
+from api import charts
+
+
+class ChartPoolTests(SimpleTestCase):
+   """
+   Covers the chart rendering pool (see charts.py): drawing in a worker process and falling back to the calling process.
+   """
+   data = {"a": 75.0, "b": 40.0}
+   
+   def setUp(self):
+      charts._pool = None
+      self.addCleanup(self.shutdown_pool)
+   
+   def shutdown_pool(self):
+      if charts._pool is not None:
+         charts._pool.shutdown()
+      charts._pool = None
+   
+   @override_settings(CHART_RENDER_WORKERS=1)
+   def test_render_in_worker_process(self):
+      future = charts.render(charts.bar_chart, self.data, "PLO Performance", "PLOs", "Average Score")
+      self.assertIsNotNone(charts._pool)
+      self.assertTrue(future.result(timeout=120).startswith(b"\x89PNG"))
+   
+   @override_settings(CHART_RENDER_WORKERS=1)
+   def test_broken_pool_draws_in_process(self):
+      broken_pool = mock.Mock()
+      broken_pool.submit.side_effect = BrokenExecutor("A worker died")
+      charts._pool = broken_pool
+      future = charts.render(charts.bar_chart, self.data, "PLO Performance", "PLOs", "Average Score")
+      broken_pool.submit.assert_called_once()
+      self.assertTrue(future.done())  # Drawn right here, not handed to a worker
+      self.assertTrue(future.result().startswith(b"\x89PNG"))
+      self.assertIsNone(charts._pool)  # The broken pool is dropped, the next chart starts a fresh one
+# STOP - Chart Pool Tests
+
+
+
+# START - Lazy Report Import Tests
+import json
+import subprocess
+import sys
+from django.conf import settings
+from django.test import SimpleTestCase
+from api.management.commands.benchmark_startup import PROBE
+
+
+class LazyReportImportTests(SimpleTestCase):
+   """
+   Checks that loading the URL config leaves the report libraries unloaded (see lazy_report_view() in views/reports.py).
+   """
+   def test_urls_do_not_import_report_libraries(self):
+      environment = dict(os.environ, DJANGO_SETTINGS_MODULE="backend.settings")
+      probe = subprocess.run([sys.executable, "-c", PROBE], cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True, timeout=120)
+      self.assertEqual(probe.returncode, 0, probe.stderr)
+      self.assertEqual(json.loads(probe.stdout.strip().splitlines()[-1])["report_libraries"], [])  # matplotlib, seaborn, reportlab...
+# STOP - Lazy Report Import Tests
+
+
+
+# START - Endpoint Regression Tests
+# NOTE:
+# - Run with: python manage.py test api
+# - These pin the output of every endpoint on a small seeded dataset, so refactors of the views and of the metrics layer
+#   (see metrics.py) can be checked against the numbers the endpoints produced before
+# - Bulky outputs are pinned as a SHA-256 digest of their canonical JSON (floats rounded to 6 places, volatile timestamp
+#   fields dropped), report PDFs are pinned by the text of every paragraph and table cell in their story
+import hashlib
+import json
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+VOLATILE_FIELDS = {"date_created", "timestamp", "date_added", "created_at", "started_at", "finished_at", "last_login"}
+
+
+def canonical(data):
+   """
+   Returns the data with floats rounded and volatile fields dropped, ready to be compared or digested.
+   """
+   if isinstance(data, dict):
+      return {str(key): canonical(value) for key, value in data.items() if key not in VOLATILE_FIELDS}
+   if isinstance(data, list):
+      return [canonical(value) for value in data]
+   if isinstance(data, float):
+      return round(data, 6)
+   return data
+
+
+def digest(data):
+   return hashlib.sha256(json.dumps(canonical(data), sort_keys=True).encode()).hexdigest()
+
+
+@override_settings(REPORT_CACHE_MAX_BYTES=0, CHART_RENDER_WORKERS=0, REPORT_JOB_EXECUTOR="inline")
+class EndpointRegressionTests(TestCase):
+   """
+   Pins the output of every endpoint on the seeded dataset.
+   """
+   @classmethod
+   def setUpTestData(cls):
+      cls.user = seed_regression_dataset()
+   
+   def setUp(self):
+      self.client = APIClient()
+      self.client.force_authenticate(self.user)
+   
+   def get_json(self, url):
+      response = self.client.get(url)
+      self.assertEqual(response.status_code, 200, url)
+      return response.json()
+   
+   def report_texts(self, url):
+      """
+      Returns (status code, sorted texts of the PDF's story) for a report endpoint.
+      """
+      from reportlab.platypus import SimpleDocTemplate, Paragraph, Table
+      texts = []
+      
+      def collect(flowables):
+         for flowable in flowables:
+            if isinstance(flowable, Paragraph):
+               texts.append(flowable.getPlainText())
+            elif isinstance(flowable, Table):
+               for row in flowable._cellvalues:
+                  for cell in row:
+                     if isinstance(cell, (list, tuple)):
+                        collect(cell)
+                     elif isinstance(cell, Paragraph):
+                        texts.append(cell.getPlainText())
+                     elif isinstance(cell, str):
+                        texts.append(cell)
+      
+      build = SimpleDocTemplate.build
+      def capture(document, flowables, *args, **kwargs):
+         collect(flowables)
+         return build(document, flowables, *args, **kwargs)
+      
+      with mock.patch.object(SimpleDocTemplate, "build", capture):
+         response = self.client.get(url)
+         if getattr(response, "streaming", False):
+            self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"), url)
+      return response.status_code, sorted(texts)
+   
+   def test_performance_endpoints(self):
+      course_performance = {course_id: self.get_json(f"/api/courses/{course_id}/performance/") for course_id in Course.objects.values_list("pk", flat=True)}
+      section_performance = {section_id: self.get_json(f"/api/sections/{section_id}/performance/") for section_id in Section.objects.values_list("pk", flat=True)}
+      instrument_performance = {instrument_id: self.get_json(f"/api/evaluation-instruments/{instrument_id}/performance/") for instrument_id in EvaluationInstrument.objects.values_list("pk", flat=True)}
+      
+      # Spot checks, readable when they fail
+      self.assertEqual(canonical(course_performance[1]), PINNED_COURSE_1_PERFORMANCE)
+      self.assertEqual(canonical(section_performance[1]), PINNED_SECTION_1_PERFORMANCE)
+      
+      self.assertEqual(digest(course_performance), PINNED_DIGESTS["course_performance"])
+      self.assertEqual(digest(section_performance), PINNED_DIGESTS["section_performance"])
+      self.assertEqual(digest(instrument_performance), PINNED_DIGESTS["instrument_performance"])
+   
+   def test_missing_objects(self):
+      self.assertEqual(self.client.get("/api/courses/999/performance/").status_code, 404)
+      self.assertEqual(self.client.get("/api/sections/999/performance/").status_code, 404)
+      self.assertEqual(self.client.get("/api/evaluation-instruments/999/performance/").status_code, 404)
+      self.assertEqual(self.client.get("/api/sections/999/performancereport/").status_code, 404)
+   
+   def test_crud_endpoints(self):
+      outputs = {}
+      self.client.raise_request_exception = False  # Some views answer with a 500, the status codes are pinned as well
+      for url in [f"/api/{route}/{suffix}" for route in CRUD_ROUTES for suffix in ("", "1/")] + ["/api/courses/1/sections/", "/api/users/"]:
+         response = self.client.get(url)
+         outputs[url] = [response.status_code, response.json() if response.status_code == 200 else None]
+      self.assertEqual(digest(outputs), PINNED_DIGESTS["crud"])
+   
+   def test_reports(self):
+      semester_1 = json.dumps({"semester_id": 1})
+      semester_2 = json.dumps({"semester_id": 2})
+      reports = {
+         "program": self.report_texts("/api/programs/1/performancereport/"),
+         "program_semester_2": self.report_texts(f"/api/programs/1/performancereport/?selectedProgramSemesters={semester_2}"),
+         "course": self.report_texts("/api/courses/1/performancereport/"),
+         "course_semester_1": self.report_texts(f"/api/courses/1/performancereport/?selectedCourseSemesters={semester_1}"),
+         "section": self.report_texts("/api/sections/1/performancereport/"),
+      }
+      for name, (status_code, texts) in reports.items():
+         self.assertEqual(status_code, 200, name)
+      self.assertEqual(digest(reports), PINNED_DIGESTS["reports"])
+
+   def test_keyset_pagination(self):
+      self.assertIsInstance(self.get_json("/api/students/"), list)  # Unpaged unless asked, the frontend reads whole lists
+      page = self.get_json("/api/students/?page_size=3")
+      self.assertEqual([student["email"] for student in page["results"]], sorted(Student.objects.values_list("email", flat=True))[:3])
+      self.assertIsNone(page["previous"])
+      
+      url, seen = "/api/student-task-mappings/?page_size=25", []
+      while url:
+         with self.assertNumQueries(1):  # One range scan per page, however deep
+            page = self.client.get(url).json()
+         seen += [row["student_task_mapping_id"] for row in page["results"]]
+         url = page["next"]
+      self.assertEqual(seen, list(StudentTaskMapping.objects.order_by("pk").values_list("pk", flat=True)))
+      self.assertEqual(len(self.get_json("/api/student-task-mappings/")["results"]), min(100, len(seen)))  # Always paged
+      self.assertEqual(self.client.get("/api/student-task-mappings/?cursor=bogus").status_code, 404)
+   
+   def test_list_query_counts(self):
+      routes = ["sections", "evaluation-instruments", "course-learning-objectives", "courses", "accreditation-versions", "users"]
+      
+      def query_counts():
+         counts = {}
+         for route in routes:
+            with CaptureQueriesContext(connection) as queries:
+               self.get_json(f"/api/{route}/")
+            counts[route] = len(queries)
+         return counts
+      
+      before = query_counts()
+      # Many more rows, each with its own related objects to nest
+      role = UserRole.objects.create(role_name="Admin")
+      for index in range(20):
+         instructor = User.objects.create_user(f"D1{index:07d}", f"instructor{index}@desu.edu", password=None, role=role, first_name="I", last_name="N")
+         course = Course.objects.create(a_version_id=index % 2 + 1, course_number=500 + index, name=f"Course {index}", description="desc")
+         section = Section.objects.create(course=course, section_number="1", semester_id=index % 2 + 1, crn=f"9{index}", instructor=instructor)
+         EvaluationInstrument.objects.create(section=section, evaluation_type_id=index % 2 + 1, name="Exam", description="desc")
+         CourseLearningObjective.objects.create(course=course, designation=1, description="CLO", created_by=instructor)
+      AccreditationVersion.objects.create(a_organization=AccreditationOrganization.objects.create(name="Other", description="desc"), year=2026)
+      
+      self.assertEqual(query_counts(), before)
+      self.assertEqual(before, dict.fromkeys(routes, 1) | {"users": 2})  # users/ looks up the admin roles first
+   
+   @override_settings(METRICS_CACHE_TIMEOUT=300)
+   def test_cached_metrics_follow_writes(self):
+      cache.clear()
+      before = self.get_json("/api/sections/1/performance/")
+      self.assertEqual(self.get_json("/api/sections/1/performance/"), before)  # Served from the cache
+
+      # A committed gradebook write must never leave an old value behind
+      grade = StudentTaskMapping.objects.filter(task__evaluation_instrument__section=1).first()
+      grade.score = 0
+      with self.captureOnCommitCallbacks(execute=True):
+         grade.save()
+      after = self.get_json("/api/sections/1/performance/")
+      self.assertNotEqual(after, before)
+
+      cache.clear()
+      self.assertEqual(self.get_json("/api/sections/1/performance/"), after)
+   
+   def test_program_plo_accumulation_order(self):
+      # Reports round to 2 places, so the program PLO averages must add up in the same order the per-course loops did
+      # (courses in section order, then CLOs by ID), down to the last bit, or a score on a .xx5 boundary flips
+      from api.aggregation import OutcomeAggregator
+      # A course whose CLOs are first reached by its tasks in reverse ID order, with averages whose float sum depends on the order
+      course = Course.objects.create(a_version_id=1, course_number=499, name="Order", description="desc")
+      plo = ProgramLearningObjective.objects.create(a_version_id=1, designation="z", description="PLO z")
+      clos = [CourseLearningObjective.objects.create(course=course, designation=designation, description="desc", created_by=self.user) for designation in (1, 2, 3)]
+      section = Section.objects.create(course=course, section_number="1", semester=Section.objects.first().semester, crn="49901", instructor=self.user)
+      instrument = EvaluationInstrument.objects.create(section=section, evaluation_type_id=1, name="Quiz", description="desc")
+      student = Student.objects.first()
+      for task_number, (clo, score) in enumerate([(clos[2], 4), (clos[0], 1), (clos[1], 1)], start=1):
+         PLOCLOMapping.objects.create(plo=plo, clo=clo)
+         task = EmbeddedTask.objects.create(evaluation_instrument=instrument, task_number=task_number, task_text="task")
+         TaskCLOMapping.objects.create(task=task, clo=clo)
+         StudentTaskMapping.objects.create(student=student, task=task, score=score, total_possible_score=7)
+      
+      section_ids = list(Section.objects.order_by("pk").values_list("pk", flat=True))
+      aggregator = OutcomeAggregator(sections=section_ids)
+      plo_scores = defaultdict(list)
+      for course_id in dict.fromkeys(Section.objects.order_by("pk").values_list("course_id", flat=True)):
+         clo_performance = aggregator.course_clo_performance(aggregator.section_ids_for([course_id]))
+         for clo_id, plo_id in PLOCLOMapping.objects.filter(clo__in=clo_performance.keys()).order_by("clo_id", "pk").values_list("clo_id", "plo_id"):
+            plo_scores[plo_id].append(clo_performance[clo_id])
+      expected = {plo_id: sum(scores) / len(scores) for plo_id, scores in plo_scores.items()}
+      self.assertEqual(aggregator.program_plo_performance(section_ids), expected)  # Exact, no rounding
+
+
+CRUD_ROUTES = [
+   "logs", "accreditation-organizations", "accreditation-versions", "program-learning-objectives", "programs", "courses",
+   "program-course-mappings", "semesters", "sections", "evaluation-types", "evaluation-instruments", "embedded-tasks",
+   "course-learning-objectives", "task-clo-mappings", "plo-clo-mappings", "students", "student-task-mappings",
+]
+PINNED_COURSE_1_PERFORMANCE = {
+   "clo_performance": {"1": 78.916667, "2": 59.088889, "3": 74.444444},
+   "plo_performance": {"3": 69.002778, "1": 76.680556, "4": 66.766667},
+}
+PINNED_SECTION_1_PERFORMANCE = {
+   "section_id": 1,
+   "clo_performance": {"1": 58.148148, "2": 58.444444, "3": 68.75},
+   "plo_performance": {"3": 58.296296, "1": 63.449074, "4": 63.597222},
+}
+PINNED_DIGESTS = {
+   "crud": "07743ce8bec2e343d5ee18176d557f3eb0455ab71ab79a29c24ef233cbf7fd02",  # student-task-mappings/ lists grades (200, first page) since the keyset pagination change, it answered 500 before
+   "course_performance": "40a730e1a80ccb5d3c381d23392f081e0313a14b449f3ac3d3fe8526f1a60ec1",
+   "section_performance": "d8b69ec68a5d0fdefed4a54bdae3b741224ac12613f98443dbb9733ef7db6f75",
+   "instrument_performance": "bfe9395b591344355b075aa2435b17c71e970437c0894b38ee36347e0e7f595c",
+   "reports": "307930cc81b874ae4ed24426d7323b9618f1575e7a783c3ef246f174ab9ee346",  # program_semester_2 PLO scores read 69.62%, as before the aggregation engine
+}
+# STOP - Endpoint Regression Tests
+
+
+
+# START - Ingestion Tests
+from datetime import timedelta
+from django.utils import timezone
+from api.ingestion_jobs import run_queued_ingestion_jobs
+from api.rollups import verify_rollups
+
+
+def gradebook_payload(section_id, clo_ids, student_count, task_count):
+   """
+   Returns an EvaluationInstrumentListCreate.post() body in the shape the frontend sends it.
+   """
+   return {
+      "instrumentInfo": {"section": section_id, "name": "Final", "description": "desc", "evaluation_type": 1},
+      "tasks": [{"task_number": str(number), "task_text": f"Task {number}"} for number in range(1, task_count + 1)],
+      "cloMappings": [{"task_number": str(number), "cloIds": [clo_ids[number % len(clo_ids)]]} for number in range(1, task_count + 1)],
+      "students": [
+         {
+            "username": f"student{index}@desu.edu",  # The first 8 exist already
+            "firstName": "New",
+            "lastName": "Student",
+            "tasks": [{"taskId": number, "manualScore": (index + number) % 11, "possiblePoints": 10} for number in range(1, task_count + 1)],
+         }
+         for index in range(student_count)
+      ],
+   }
+
+
+@override_settings(REPORT_CACHE_MAX_BYTES=0, METRICS_CACHE_TIMEOUT=0)
+class GradebookIngestionTests(TestCase):
+   """
+   Covers the batched write path behind EvaluationInstrumentListCreate.post() (see ingestion.py).
+   """
+   @classmethod
+   def setUpTestData(cls):
+      cls.user = seed_regression_dataset()
+      cls.section = Section.objects.get(pk=1)
+      cls.clo_ids = list(CourseLearningObjective.objects.filter(course=cls.section.course).values_list("clo_id", flat=True))
+   
+   def setUp(self):
+      self.client = APIClient()
+      self.client.force_authenticate(self.user)
+   
+   def post_gradebook(self, payload):
+      with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+         response = self.client.post("/api/evaluation-instruments/", payload, format="json")
+      return response, len(queries)
+   
+   def test_gradebook_is_written_in_bulk(self):
+      response, small_queries = self.post_gradebook(gradebook_payload(self.section.pk, self.clo_ids, student_count=10, task_count=3))
+      self.assertEqual(response.status_code, 201, response.content)
+      response, large_queries = self.post_gradebook(gradebook_payload(self.section.pk, self.clo_ids, student_count=40, task_count=12))
+      self.assertEqual(response.status_code, 201, response.content)
+      
+      instrument = EvaluationInstrument.objects.get(pk=response.json()["evaluation_instrument_id"])
+      self.assertEqual(EmbeddedTask.objects.filter(evaluation_instrument=instrument).count(), 12)
+      self.assertEqual(TaskCLOMapping.objects.filter(task__evaluation_instrument=instrument).count(), 12)
+      self.assertEqual(StudentTaskMapping.objects.filter(task__evaluation_instrument=instrument).count(), 40 * 12)
+      self.assertEqual(Student.objects.filter(first_name="New").count(), 40 - 8)  # Existing students are left untouched
+      self.assertEqual(verify_rollups(), [])  # bulk_create() sends no signals, the rollups must still be current
+      
+      # 16x the scores, the number of queries barely moves (the old path ran 3+ queries per score)
+      self.assertLess(large_queries - small_queries, 12)
+   
+   def test_bad_gradebook_saves_nothing(self):
+      payload = gradebook_payload(self.section.pk, self.clo_ids, student_count=3, task_count=2)
+      payload["cloMappings"][1]["cloIds"] = [999999]
+      instruments = EvaluationInstrument.objects.count()
+      
+      response, _ = self.post_gradebook(payload)
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(response.json(), {"error": "CLO with ID 999999 does not exist."})
+      self.assertEqual(EvaluationInstrument.objects.count(), instruments)
+      self.assertFalse(Student.objects.filter(email="student0@desu.edu", first_name="New").exists())
+   
+   def upload_gradebook(self, instrument_id, name, content, **data):
+      from django.core.files.uploadedfile import SimpleUploadedFile
+      with self.captureOnCommitCallbacks(execute=True):
+         return self.client.post(f"/api/evaluation-instruments/{instrument_id}/gradebook/", {"file": SimpleUploadedFile(name, content), **data}, format="multipart")
+   
+   @mock.patch("api.ingestion.IMPORT_CHUNK_ROWS", 2)
+   @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=64)  # Spooled to a temporary file, the way large uploads arrive
+   def test_gradebook_file_import(self):
+      instrument = EvaluationInstrument.objects.create(section=self.section, evaluation_type_id=1, name="Quiz", description="desc")
+      for task_number in (1, 2):
+         EmbeddedTask.objects.create(evaluation_instrument=instrument, task_number=task_number, task_text="task")
+      StudentTaskMapping.objects.create(student_id="student1@desu.edu", task=instrument.embeddedtask_set.first(), score=1, total_possible_score=5)
+      
+      gradebook = "\n".join([
+         "Email,First Name,Last Name,Section,Task 1,Task 2",
+         "Points Possible,,,,5,10",
+         "student0@desu.edu,A,B,01,4,9",
+         "student1@desu.edu,A,B,01,3,8",       # Already graded on this instrument
+         "new1@desu.edu,New,Student,01,5,",    # Task 2 left ungraded
+         ",No,Email,01,1,1",
+         "new2@desu.edu,New,Student,01,five,7",
+         "",
+         "new3@desu.edu,New,Student,01,2,3",
+         "new1@desu.edu,New,Student,01,5,5",   # Listed twice
+      ]).encode()
+      response = self.upload_gradebook(instrument.pk, "gradebook.csv", gradebook)
+      self.assertEqual(response.status_code, 200, response.content)
+      report = response.json()
+      self.assertEqual(
+         {key: report[key] for key in ("rows", "imported_rows", "students_created", "scores_created", "ignored_columns")},
+         {"rows": 7, "imported_rows": 3, "students_created": 2, "scores_created": 5, "ignored_columns": ["Section"]},
+      )
+      self.assertEqual([error["row"] for error in report["errors"]], [4, 6, 7, 10])
+      self.assertEqual(StudentTaskMapping.objects.get(student="new1@desu.edu").total_possible_score, 5)
+      self.assertEqual(verify_rollups(), [])
+   
+   def test_gradebook_reupload_upserts(self):
+      instrument = EvaluationInstrument.objects.create(section=self.section, evaluation_type_id=1, name="Quiz", description="desc")
+      for task_number in (1, 2):
+         EmbeddedTask.objects.create(evaluation_instrument=instrument, task_number=task_number, task_text="task")
+      original = b"Email,1,2\nPoints Possible,10,10\nstudent0@desu.edu,4,9\nstudent1@desu.edu,3,8\n"
+      corrected = b"Email,1,2\nPoints Possible,10,10\nstudent0@desu.edu,4,10\nstudent1@desu.edu,3,8\nstudent2@desu.edu,7,\n"
+      self.assertEqual(self.upload_gradebook(instrument.pk, "gradebook.csv", original).json()["scores_created"], 4)
+      
+      report = self.upload_gradebook(instrument.pk, "gradebook.csv", corrected).json()  # Plain re-upload: graded students are skipped
+      self.assertEqual((report["imported_rows"], len(report["errors"])), (1, 2))
+      report = self.upload_gradebook(instrument.pk, "gradebook.csv", corrected, mode="upsert").json()
+      self.assertEqual((report["scores_created"], report["scores_updated"], report["scores_unchanged"], report["errors"]), (0, 1, 4, []))  # student2 was imported by the plain re-upload
+      
+      self.assertEqual(StudentTaskMapping.objects.get(student="student0@desu.edu", task__evaluation_instrument=instrument, task__task_number=2).score, 10)
+      self.assertEqual(StudentTaskMapping.objects.filter(task__evaluation_instrument=instrument).count(), 5)
+      self.assertEqual(verify_rollups(), [])
+   
+   def test_unusable_gradebook_file(self):
+      response = self.upload_gradebook(1, "gradebook.csv", b"Email,Task 1,Task 9\nPoints Possible,5,5\n")
+      self.assertEqual(response.json(), {"error": "These columns do not match a task of the evaluation instrument: Task 9"})
+      response = self.upload_gradebook(1, "gradebook.csv", b"Email,Task 1\nstudent0@desu.edu,5\n")
+      self.assertEqual(response.status_code, 400)
+      response = self.upload_gradebook(1, "gradebook.pdf", b"%PDF")
+      self.assertEqual(response.status_code, 400)
+   
+   @mock.patch("api.ingestion.IMPORT_CHUNK_ROWS", 4)
+   def test_background_gradebook(self):
+      with self.settings(INGESTION_JOB_EXECUTOR="inline"), self.captureOnCommitCallbacks(execute=True):
+         response = self.client.post("/api/evaluation-instruments/?background=true", gradebook_payload(self.section.pk, self.clo_ids, student_count=10, task_count=3), format="json")
+      self.assertEqual((response.status_code, response.json()["status"], response.json()["rows_total"]), (202, "queued", 10))
+      
+      job = self.client.get(f"/api/ingestion-jobs/{response.json()['ingestion_job_id']}/").json()
+      self.assertEqual((job["status"], job["rows_validated"], job["rows_written"], job["error"]), ("succeeded", 10, 10, None))
+      self.assertEqual(job["result"], {"evaluation_instrument_id": job["evaluation_instrument"], "tasks_created": 3, "students_created": 2, "scores_created": 30})
+      self.assertEqual(StudentTaskMapping.objects.filter(task__evaluation_instrument=job["evaluation_instrument"]).count(), 30)
+      self.assertEqual(verify_rollups(), [])
+      
+      # Bad input fails the job with the synchronous request's message and writes nothing
+      payload = gradebook_payload(self.section.pk, self.clo_ids, student_count=3, task_count=2)
+      payload["cloMappings"][1]["cloIds"] = [999999]
+      instruments = EvaluationInstrument.objects.count()
+      with self.settings(INGESTION_JOB_EXECUTOR="inline"), self.captureOnCommitCallbacks(execute=True):
+         response = self.client.post("/api/evaluation-instruments/?background=true", payload, format="json")
+      job = IngestionJob.objects.get(pk=response.json()["ingestion_job_id"])
+      self.assertEqual((job.status, job.error, job.rows_written), ("failed", "CLO with ID 999999 does not exist.", 0))
+      self.assertEqual(EvaluationInstrument.objects.count(), instruments)
+   
+   def test_background_gradebook_file(self):
+      import tempfile
+      from django.core.files.uploadedfile import SimpleUploadedFile
+      instrument = EvaluationInstrument.objects.create(section=self.section, evaluation_type_id=1, name="Quiz", description="desc")
+      for task_number in (1, 2):
+         EmbeddedTask.objects.create(evaluation_instrument=instrument, task_number=task_number, task_text="task")
+      gradebook = b"Email,1,2\nPoints Possible,10,10\nstudent0@desu.edu,4,9\nstudent1@desu.edu,3,x\nstudent9@desu.edu,7,\n"
+      
+      with tempfile.TemporaryDirectory() as job_dir, self.settings(INGESTION_JOB_EXECUTOR="inline", INGESTION_JOB_DIR=job_dir), self.captureOnCommitCallbacks(execute=True):
+         response = self.client.post(f"/api/evaluation-instruments/{instrument.pk}/gradebook/?background=true", {"file": SimpleUploadedFile("gradebook.csv", gradebook)}, format="multipart")
+         self.assertEqual(response.status_code, 202)
+         self.assertEqual(len(os.listdir(job_dir)), 1)  # Kept until the job runs
+      self.assertEqual(os.listdir(job_dir) if os.path.exists(job_dir) else [], [])
+      
+      job = IngestionJob.objects.get(pk=response.json()["ingestion_job_id"])
+      self.assertEqual((job.status, job.source, job.rows_total, job.rows_validated, job.rows_written), ("succeeded", "file", None, 3, 2))
+      self.assertEqual((job.result["scores_created"], job.result["students_created"], len(job.result["errors"])), (3, 1, 1))
+      self.assertEqual(verify_rollups(), [])
+   
+   @override_settings(INGESTION_JOB_STALE_SECONDS=600)
+   def test_stale_ingestion_job_fails(self):
+      payload = {"instrumentInfo": {}, "cloMappings": [], "students": []}
+      stale = IngestionJob.objects.create(source="gradebook", payload=payload, requested_by=self.user, status="running", started_at=timezone.now() - timedelta(seconds=601), rows_written=40)
+      busy = IngestionJob.objects.create(source="gradebook", payload=payload, requested_by=self.user, status="running", started_at=timezone.now() - timedelta(seconds=60))
+      
+      self.assertEqual(run_queued_ingestion_jobs(), 0)
+      stale.refresh_from_db()
+      self.assertEqual((stale.status, stale.rows_written), ("failed", 40))  # Not run again, its committed chunks are kept
+      self.assertIn("stopped before finishing", stale.error)
+      self.assertIsNotNone(stale.finished_at)
+      self.assertEqual(IngestionJob.objects.get(pk=busy.pk).status, "running")
+   
+   def course_item(self, course_number, plo_ids, clo_count=3):
+      return {
+         "course": {"program": 1, "accreditationVersion": 1, "courseNumber": str(course_number), "courseName": f"Course {course_number}", "description": "desc"},
+         "clos": [{"designation": designation, "description": f"CLO {designation}", "created_by": self.user.pk} for designation in range(1, clo_count + 1)],
+         "plo_clo_mappings": [{"cloDesignation": designation, "plo": plo_id} for designation in range(1, clo_count + 1) for plo_id in plo_ids],
+      }
+   
+   def test_course_batch(self):
+      plo_ids = list(ProgramLearningObjective.objects.filter(a_version=1).values_list("pk", flat=True)[:2])
+      courses = Course.objects.count()
+      with self.assertNumQueries(10):  # Independent of the batch size: one query per FK model, one INSERT per table and the savepoint
+         response = self.client.post("/api/courses/", [self.course_item(number, plo_ids) for number in range(200, 230)], format="json")
+      self.assertEqual(response.status_code, 201, response.content)
+      results = response.json()["results"]
+      self.assertEqual(len(results), 30)
+      self.assertEqual(Course.objects.count(), courses + 30)
+      course = Course.objects.get(pk=results[0]["course_id"])
+      self.assertEqual(course.course_number, 200)
+      self.assertTrue(ProgramCourseMapping.objects.filter(program=1, course=course).exists())
+      self.assertEqual(PLOCLOMapping.objects.filter(clo__course=course).count(), 3 * 2)
+      self.assertEqual({str(designation): clo_id for designation, clo_id in course.courselearningobjective_set.values_list("designation", "clo_id")}, results[0]["clo_ids"])
+      
+      # A single course (the original request body) still answers with the course
+      response = self.client.post("/api/courses/", self.course_item(300, plo_ids), format="json")
+      self.assertEqual((response.status_code, response.json()["course_number"]), (201, 300))
+   
+   def test_bad_course_batch_saves_nothing(self):
+      bad = self.course_item(201, [999999])
+      bad["clos"][1]["designation"] = 42
+      batch = [self.course_item(200, []), bad]
+      courses = Course.objects.count()
+      response = self.client.post("/api/courses/", batch, format="json")
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(response.json()["results"][0], {"index": 0, "errors": []})
+      self.assertEqual(len(response.json()["results"][1]["errors"]), 3)  # CLO 2 out of range, its mapping and the unknown PLO
+      self.assertEqual(Course.objects.count(), courses)
+      
+      # A single course answers like it did before batches: the first missing field, then field-keyed serializer errors
+      response = self.client.post("/api/courses/", {"course": {"accreditationVersion": 1}}, format="json")
+      self.assertEqual(response.json(), {"error": "Missing program_id."})
+      item = self.course_item(202, [])
+      item["course"]["courseName"] = "x" * 500
+      response = self.client.post("/api/courses/", item, format="json")
+      self.assertEqual((response.status_code, list(response.json())), (400, ["name"]))
+      item = self.course_item(202, [])
+      item["clos"][0]["designation"] = 42
+      self.assertEqual(list(self.client.post("/api/courses/", item, format="json").json()), ["designation"])
+      response = self.client.post("/api/courses/", self.course_item(202, [999999]), format="json")
+      self.assertEqual(response.json(), {"error": "PLO 999999 does not exist."})
+# STOP - Ingestion Tests
+
+
+
+# START - Bulk Mapping Tests
+@override_settings(REPORT_CACHE_MAX_BYTES=0, METRICS_CACHE_TIMEOUT=0)
+class BulkMappingTests(TestCase):
+   """
+   Covers the <mapping-route>/bulk/ endpoints (see bulk.py).
+   """
+   @classmethod
+   def setUpTestData(cls):
+      cls.user = seed_regression_dataset()
+   
+   def setUp(self):
+      self.client = APIClient()
+      self.client.force_authenticate(self.user)
+   
+   def send(self, method, route, items, atomic=False):
+      with self.captureOnCommitCallbacks(execute=True):
+         return getattr(self.client, method)(f"/api/{route}/bulk/{'?atomic=true' if atomic else ''}", items, format="json")
+   
+   def test_create_reports_every_item(self):
+      unmapped = list(CourseLearningObjective.objects.exclude(ploclomapping__plo=1).filter(course__a_version=1).values_list("pk", flat=True))
+      existing = PLOCLOMapping.objects.first()
+      items = [{"plo": 1, "clo": clo_id} for clo_id in unmapped] + [
+         {"plo": existing.plo_id, "clo": existing.clo_id},  # Already mapped
+         {"plo": 999999, "clo": unmapped[0]},
+         {"plo": 1},
+         {"plo": 1, "clo": unmapped[0]},                    # Listed twice
+      ]
+      
+      response = self.send("post", "plo-clo-mappings", items, atomic=True)
+      self.assertEqual((response.status_code, response.json()["succeeded"]), (400, 0))
+      self.assertFalse(PLOCLOMapping.objects.filter(plo=1, clo__in=unmapped).exists())
+      
+      with self.captureOnCommitCallbacks() as callbacks, CaptureQueriesContext(connection) as queries:
+         response = self.client.post("/api/plo-clo-mappings/bulk/", items, format="json")
+      for callback in callbacks:  # The rollup refresh and version bump, counted apart
+         callback()
+      self.assertEqual(response.status_code, 200)
+      body = response.json()
+      self.assertEqual((body["succeeded"], body["failed"]), (len(unmapped), 4))
+      self.assertEqual([result["index"] for result in body["results"] if result.get("errors")], list(range(len(unmapped), len(items))))
+      self.assertEqual(body["results"][-3]["errors"], {"plo": ["ProgramLearningObjective 999999 does not exist."]})
+      self.assertEqual(PLOCLOMapping.objects.filter(plo=1, clo__in=unmapped).count(), len(unmapped))
+      self.assertEqual(len(queries), 7)  # One lookup per related table and one on the table, one INSERT, whatever the batch size
+      self.assertEqual(verify_rollups(), [])
+   
+   def test_update_and_delete(self):
+      grades = list(StudentTaskMapping.objects.filter(task__evaluation_instrument__section=1).order_by("pk")[:3])
+      other_task = EmbeddedTask.objects.filter(evaluation_instrument__section=2).exclude(studenttaskmapping__student=grades[0].student_id).first()
+      response = self.send("patch", "student-task-mappings", [
+         {"pk": grades[0].pk, "score": 1.5},
+         {"pk": grades[1].pk, "task": other_task.pk, "student": grades[0].student_id},
+         {"pk": grades[2].pk, "score": "many"},
+         {"pk": 999999, "score": 1},
+      ])
+      self.assertEqual(response.json()["succeeded"], 2)
+      self.assertEqual(list(response.json()["results"][2]["errors"]), ["score"])
+      self.assertEqual(StudentTaskMapping.objects.get(pk=grades[0].pk).score, 1.5)
+      self.assertEqual(StudentTaskMapping.objects.get(pk=grades[1].pk).task_id, other_task.pk)
+      self.assertEqual(verify_rollups(), [])  # Both the old and the new task were refreshed
+      
+      response = self.send("delete", "student-task-mappings", [grades[0].pk, grades[1].pk, grades[0].pk])
+      self.assertEqual((response.json()["succeeded"], response.json()["failed"]), (2, 1))
+      self.assertFalse(StudentTaskMapping.objects.filter(pk__in=[grades[0].pk, grades[1].pk]).exists())
+      self.assertEqual(verify_rollups(), [])
+   
+   def test_superuser_only_tables(self):
+      self.user.is_superuser = False
+      self.user.save()
+      self.assertEqual(self.send("post", "program-course-mappings", [{"program": 1, "course": 1}]).status_code, 403)
+      self.assertEqual(self.send("delete", "task-clo-mappings", [TaskCLOMapping.objects.first().pk]).status_code, 200)  # Open to every user, like its single object endpoint
+   
+   def test_many_serializer_resolves_fks_once(self):
+      sections = list(Section.objects.values_list("pk", flat=True))
+      items = [{"section": section_id, "evaluation_type": 1, "name": "Quiz", "description": "desc"} for section_id in sections] * 5
+      items += [dict(items[0], section=999999), dict(items[0], evaluation_type="x")]
+      
+      serializer = EvaluationInstrumentSerializer(data=items, many=True)
+      with self.assertNumQueries(2):  # One per FK field, not one per FK per item
+         self.assertFalse(serializer.is_valid())
+      single = EvaluationInstrumentSerializer(data=items[-2])
+      single.is_valid()
+      self.assertEqual(set(serializer.errors), {len(items) - 2, len(items) - 1})  # Only the bad items, by index
+      self.assertEqual(serializer.errors[len(items) - 2], single.errors)  # Same messages as the one-by-one path
+      self.assertEqual(list(serializer.errors[len(items) - 1]), ["evaluation_type"])
+# STOP - Bulk Mapping Tests
+
+
+
+# START - Query Plan Tests
+from collections import defaultdict
+from django.db.models import Sum
+from api import metrics
+
+
+class QueryPlanTests(TestCase):
+   """
+   Checks that the report and rollup queries are answered from the indexes declared in models.py (SQLite and PostgreSQL).
+   """
+   @classmethod
+   def setUpTestData(cls):
+      seed_regression_dataset()
+   
+   def plan(self, queryset):
+      if connection.vendor == "postgresql":
+         with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")  # The test tables are tiny, the planner would rather scan them
+      return queryset.explain()
+   
+   def assertUsesIndex(self, queryset, index_name, covering=False):
+      plan = self.plan(queryset)
+      self.assertIn(index_name, plan)
+      if connection.vendor == "sqlite":
+         self.assertNotRegex(plan, rf"SCAN {queryset.model._meta.db_table}\b(?! USING)", plan)  # No full table scan
+         if covering:
+            self.assertIn(f"USING COVERING INDEX {index_name}", plan)
+      elif connection.vendor == "postgresql" and covering:
+         self.assertIn("Index Only Scan", plan)
+   
+   def test_gradebook_reads_come_from_the_covering_index(self):
+      task_ids = list(EmbeddedTask.objects.filter(evaluation_instrument__section=1).values_list("pk", flat=True))
+      grades = StudentTaskMapping.objects.filter(task__in=task_ids)
+      self.assertUsesIndex(grades.values("task").annotate(Sum("score"), Sum("total_possible_score")), "stm_task_scores_idx", covering=True)  # Task rollups
+      self.assertUsesIndex(grades.values_list("task_id", "score", "total_possible_score"), "stm_task_scores_idx", covering=True)  # Report aggregator
+      self.assertUsesIndex(grades.values_list("student_id", "score", "total_possible_score"), "stm_task_scores_idx", covering=True)  # Student grades
+   
+   def test_report_scopes_and_mappings_use_indexes(self):
+      self.assertUsesIndex(Section.objects.filter(course=1, semester__in=[1, 2]), "section_course_semester_idx")
+      self.assertUsesIndex(EvaluationInstrument.objects.filter(section=1, evaluation_type=1), "instrument_section_type_idx")
+      self.assertUsesIndex(EmbeddedTask.objects.filter(evaluation_instrument=1, task_number=2), "task_instrument_number_idx")
+      self.assertUsesIndex(TaskCLOMapping.objects.filter(clo__in=[1, 2]).values_list("clo_id", "task_id"), "task_clo_by_clo_idx")
+      self.assertUsesIndex(PLOCLOMapping.objects.filter(clo__in=[1, 2]).values_list("clo_id", "plo_id"), "plo_clo_by_clo_idx")
+      self.assertUsesIndex(ProgramCourseMapping.objects.filter(course=1).values_list("program_id", flat=True), "program_course_by_course_idx")
+   
+   def test_student_grades_are_grouped_by_the_database(self):
+      sections = list(Section.objects.all())
+      expected = defaultdict(lambda: defaultdict(list))  # {section_id: {student: [score / total possible, ...]}}
+      for section_id, student, score, total_possible in StudentTaskMapping.objects.values_list("task__evaluation_instrument__section", "student", "score", "total_possible_score"):
+         if total_possible:
+            expected[section_id][student].append(score / total_possible)
+      with self.assertNumQueries(1):  # Every section's box, not one query per section
+         grades = metrics.student_average_grades_by_section(sections)
+      self.assertEqual(set(grades), set(expected))
+      self.assertTrue(expected)
+      for section_id, students in expected.items():
+         for grade, expected_grade in zip(sorted(grades[section_id]), sorted(sum(ratios) / len(ratios) * 100 for ratios in students.values()), strict=True):
+            self.assertAlmostEqual(grade, expected_grade)
+      with self.assertNumQueries(1):
+         metrics.average_student_grade(sections)
+# STOP - Query Plan Tests
+
+
+
+# START - Database Settings Tests
+from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from backend.database import database_config
+
+
+class DatabaseSettingsTests(SimpleTestCase):
+   """
+   Checks the DATABASES setting built from the environment (see backend/database.py).
+   """
+   base_dir = Path("/srv/outcomes")
+   postgres = {"DB_ENGINE": "postgresql", "DB_NAME": "outcomes", "DB_USER": "app", "DB_PASSWORD": "secret", "DB_HOST": "db", "DB_PORT": "6432"}
+   
+   def test_sqlite_defaults(self):
+      default = database_config({}, self.base_dir)["default"]
+      self.assertEqual(default, {"ENGINE": "django.db.backends.sqlite3", "NAME": self.base_dir / "db.sqlite3", "CONN_MAX_AGE": 0})
+      self.assertEqual(database_config({"DB_CONN_MAX_AGE": "30"}, self.base_dir)["default"]["CONN_MAX_AGE"], 30)
+   
+   def test_postgresql_persistent_connections(self):
+      default = database_config(self.postgres, self.base_dir)["default"]
+      self.assertEqual(default["ENGINE"], "django.db.backends.postgresql")
+      self.assertEqual((default["NAME"], default["USER"], default["PASSWORD"], default["HOST"], default["PORT"]), ("outcomes", "app", "secret", "db", "6432"))
+      self.assertEqual((default["CONN_MAX_AGE"], default["CONN_HEALTH_CHECKS"]), (60, True))
+      self.assertEqual(default["OPTIONS"], {"connect_timeout": 10})
+   
+   def test_postgresql_pool(self):
+      default = database_config({**self.postgres, "DB_POOL": "true", "DB_POOL_MAX_SIZE": "20", "DB_CONN_MAX_AGE": "60"}, self.base_dir)["default"]
+      self.assertEqual(default["CONN_MAX_AGE"], 0)  # Django refuses persistent connections on top of a pool
+      self.assertEqual(default["OPTIONS"]["pool"], {"min_size": 2, "max_size": 20, "timeout": 10})
+   
+   def test_unknown_engine(self):
+      with self.assertRaises(ImproperlyConfigured):
+         database_config({"DB_ENGINE": "mysql"}, self.base_dir)
+# STOP - Database Settings Tests
+
+
+
+# START - SQLite Tuning Tests
+import unittest
+from django.conf import settings
+from django.db import connections
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "SQLite only")
+class SQLiteTuningTests(TestCase):
+   """
+   Checks that new SQLite connections get settings.SQLITE_PRAGMAS, and SQLite's defaults with SQLITE_TUNING = False.
+   """
+   def pragmas(self):
+      fresh = connections.create_connection("default")  # connection_created is sent for every new connection
+      try:
+         with fresh.cursor() as cursor:
+            return {pragma: cursor.execute(f"PRAGMA {pragma}").fetchone()[0] for pragma in ("synchronous", "busy_timeout", "cache_size", "temp_store")}
+      finally:
+         fresh.close()
+   
+   def test_pragmas_applied_to_new_connections(self):
+      self.assertEqual(self.pragmas(), {"synchronous": 1, "busy_timeout": settings.SQLITE_PRAGMAS["busy_timeout"], "cache_size": settings.SQLITE_PRAGMAS["cache_size"], "temp_store": 2})
+   
+   @override_settings(SQLITE_TUNING=False)
+   def test_tuning_can_be_turned_off(self):
+      self.assertEqual(self.pragmas()["synchronous"], 2)  # FULL, SQLite's default
+# STOP - SQLite Tuning Tests
+
+
 if __name__ == "__main__": # Main execution
    #wipe_database()
    #populate_database()
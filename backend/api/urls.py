@@ -25,15 +25,16 @@ urlpatterns = [
       # Program routing
    path("programs/", ProgramListCreate.as_view(), name="program-list"),  # Route that returns all programs
    path("programs/<int:pk>/", ProgramDetail.as_view(), name="program-detail"),  # Retrieve, update, or delete a specific program
-   path("programs/<int:pk>/performancereport/", ProgramPerformanceReport.as_view(), name="course-performance"),  # Returns the PDF with all program performance for program performance reports
+   path("programs/<int:pk>/performancereport/", lazy_report_view("ProgramPerformanceReport"), name="course-performance"),  # Returns the PDF with all program performance for program performance reports
       # Courses routing
    path("courses/", CourseListCreate.as_view(), name="course-list"), # Route that returns all objects and can be used to create new instances
    path("courses/<int:pk>/", CourseDetail.as_view(), name="course-detail"),  # Retrieve, update, or delete
    path("courses/<int:course_id>/sections/", CourseSectionsList.as_view(), name="course-sections"),  # Retrieve all sections of a given course
    path("courses/<int:pk>/performance/", CoursePerformance.as_view(), name="course-short-performance"),  # Retrieve, update, or delete
-   path("courses/<int:pk>/performancereport/", CoursePerformanceReport.as_view(), name="course-performance"),  # Returns the PDF with all course performance for course performance reports
+   path("courses/<int:pk>/performancereport/", lazy_report_view("CoursePerformanceReport"), name="course-performance"),  # Returns the PDF with all course performance for course performance reports
       # ProgramCourseMapping routing
    path("program-course-mappings/", ProgramCourseMappingListCreate.as_view(), name="program-course-mapping-list"),  # Route that returns all program-course mappings
+   path("program-course-mappings/bulk/", ProgramCourseMappingBulk.as_view(), name="program-course-mapping-bulk"),  # Create (POST), partially update (PATCH) or delete (DELETE) many program-course mappings at once, ?atomic=true for all or nothing
    path("program-course-mappings/<int:pk>/", ProgramCourseMappingDetail.as_view(), name="program-course-mapping-detail"),  # Retrieve, update, or delete a specific program-course mapping      
       # Semesters routing
    path("semesters/", SemesterListCreate.as_view(), name="semester-list"), # Route that returns all objects and can be used to create new instances
@@ -42,7 +43,7 @@ urlpatterns = [
    path("sections/", SectionListCreate.as_view(), name="section-list"), # Route that returns all objects and can be used to create new instances
    path("sections/<int:pk>/", SectionDetail.as_view(), name="section-detail"),  # Retrieve, update, or delete
    path("sections/<int:pk>/performance/", SectionPerformance.as_view(), name="section-performance"),  # Retrieve, update, or delete
-   path("sections/<int:pk>/performancereport/", SectionPerformanceReport.as_view(), name="section-performance"),  # Retrieve, update, or delete
+   path("sections/<int:pk>/performancereport/", lazy_report_view("SectionPerformanceReport"), name="section-performance"),  # Retrieve, update, or delete
       # EvaluationType routing
    path("evaluation-types/", EvaluationTypeListCreate.as_view(), name="evaluation-type-list"),  # Route that returns all evaluation types
    path("evaluation-types/<int:pk>/", EvaluationTypeDetail.as_view(), name="evaluation-type-detail"),  # Retrieve, update, or delete a specific evaluation type
@@ -50,6 +51,9 @@ urlpatterns = [
    path("evaluation-instruments/", EvaluationInstrumentListCreate.as_view(), name="evaluation-instrument-list"),  # Route that returns all evaluation instruments
    path("evaluation-instruments/<int:pk>/", EvaluationInstrumentDetail.as_view(), name="evaluation-instrument-detail"),  # Retrieve, update, or delete a specific evaluation instrument
    path("evaluation-instruments/<int:pk>/performance/", EvaluationInstrumentPerformance.as_view(), name="evaluation-instrument-detail"),  # Get performance indicators for a given evaluation instrument
+   path("evaluation-instruments/<int:pk>/gradebook/", EvaluationInstrumentGradebookImport.as_view(), name="evaluation-instrument-gradebook-import"),  # Upload a CSV/XLSX gradebook (one row per student, one column per task) into an evaluation instrument
+   path("ingestion-jobs/", IngestionJobList.as_view(), name="ingestion-job-list"),  # List your background gradebook imports (uploads sent with ?background=true)
+   path("ingestion-jobs/<int:pk>/", IngestionJobDetail.as_view(), name="ingestion-job-detail"),  # Poll the progress, counts and errors of a background gradebook import
       # Embedded Task routing
    path("embedded-tasks/", EmbeddedTaskListCreate.as_view(), name="embedded-task-list"),  # Route that returns all embedded tasks
    path("embedded-tasks/<int:pk>/", EmbeddedTaskDetail.as_view(), name="embedded-task-detail"),  # Retrieve, update, or delete a specific embedded task
@@ -58,14 +62,21 @@ urlpatterns = [
    path("course-learning-objectives/<int:pk>/", CourseLearningObjectiveDetail.as_view(), name="course-learning-objective-detail"),  # Retrieve, update, or delete a specific course learning objective
       # Task CLO Mapping routing
    path("task-clo-mappings/", TaskCLOMappingListCreate.as_view(), name="task-clo-mapping-list"),  # Route that returns all task CLO mappings
+   path("task-clo-mappings/bulk/", TaskCLOMappingBulk.as_view(), name="task-clo-mapping-bulk"),  # Create (POST), partially update (PATCH) or delete (DELETE) many task CLO mappings at once, ?atomic=true for all or nothing
    path("task-clo-mappings/<int:pk>/", TaskCLOMappingDetail.as_view(), name="task-clo-mapping-detail"),  # Retrieve, update, or delete a specific task CLO mapping
       # PLO CLO Mapping routing
    path("plo-clo-mappings/", PLOCLOMappingListCreate.as_view(), name="plo-clo-mapping-list"),  # Route that returns all PLO CLO mappings
+   path("plo-clo-mappings/bulk/", PLOCLOMappingBulk.as_view(), name="plo-clo-mapping-bulk"),  # Create (POST), partially update (PATCH) or delete (DELETE) many PLO CLO mappings at once, ?atomic=true for all or nothing
    path("plo-clo-mappings/<int:pk>/", PLOCLOMappingDetail.as_view(), name="plo-clo-mapping-detail"),  # Retrieve, update, or delete a specific PLO CLO mapping
       # Student routing
    path("students/", StudentListCreate.as_view(), name="student-list"),  # Route that returns all students
    path("students/<int:pk>/", StudentDetail.as_view(), name="student-detail"),  # Retrieve, update, or delete a specific student
       # StudentTaskMapping routing
    path("student-task-mappings/", StudentTaskMappingListCreate.as_view(), name="student-task-mapping-list"),  # Route that returns all student-task mappings
+   path("student-task-mappings/bulk/", StudentTaskMappingBulk.as_view(), name="student-task-mapping-bulk"),  # Create (POST), partially update (PATCH) or delete (DELETE) many student-task mappings at once, ?atomic=true for all or nothing
    path("student-task-mappings/<int:pk>/", StudentTaskMappingDetail.as_view(), name="student-task-mapping-detail"),  # Retrieve, update, or delete a specific student-task mapping
+   
+   path("report-jobs/", ReportJobListCreate.as_view(), name="report-job-list"),  # Queue a program/course/section performance report to be built in the background, or list your report jobs
+   path("report-jobs/<int:pk>/", ReportJobDetail.as_view(), name="report-job-detail"),  # Poll the status of a report job
+   path("report-jobs/<int:pk>/download/", ReportJobDownload.as_view(), name="report-job-download"),  # Download the PDF of a finished report job
 ]
@@ -0,0 +1,24 @@
+# API App views/__init__.py
+
+# Views, one module per domain
+from .users import *
+from .accreditation import *
+from .programs import *
+from .courses import *
+from .sections import *
+from .evaluations import *
+from .mappings import *
+from .students import *
+from .reports import *
+
+
+# NOTE:
+# - urls.py keeps importing everything from "views", the modules above only group the views by the models they serve
+# - The performance views do not compute anything themselves, they ask the metrics service layer (metrics.py)
+# - report_pdfs.py (the PDF report views) is deliberately NOT imported here, it loads matplotlib, seaborn and ReportLab and is only
+#   imported the first time a report is requested (see lazy_report_view() in reports.py)
+
+
+# TODO:
+# - Rewrite every single <MODEL>Detail View's perform update function to verify input / existance of at least one valid field with better error handling to help with development
+# - Possibly change the lookup field for the ABET related views, as it may make more sense to use other attributes of the models other than their primary key (which is usually an auto-int handled by Django)
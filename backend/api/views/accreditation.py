@@ -0,0 +1,177 @@
+# API App views/accreditation.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+
+
+# NOTE:
+# - Views for accreditation organizations, their versions and program learning objectives
+
+
+
+# START - AccreditationOrganization
+class AccreditationOrganizationListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all Accreditation Organizations and creating a new Accreditation Organization.
+   """
+   serializer_class = AccreditationOrganizationSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      accreditation_organizations = AccreditationOrganization.objects.all()
+      return paginated_response(self, accreditation_organizations, AccreditationOrganizationSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Accreditation Organizations."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = AccreditationOrganizationSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class AccreditationOrganizationDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Accreditation Organization instance.
+   """
+   queryset = AccreditationOrganization.objects.all()  # Define queryset for the view
+   serializer_class = AccreditationOrganizationSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the log instance
+   
+   def get_queryset(self, request):
+      return AccreditationOrganization.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Accreditation Organizations."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Accreditation Organizations."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - AccreditationOrganization
+
+
+
+# START - AccreditationVersion
+class AccreditationVersionListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Accreditation Version.
+   """
+   serializer_class = AccreditationVersionSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      accreditation_versions = AccreditationVersion.objects.all()
+      return paginated_response(self, accreditation_versions, AccreditationVersionSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Accreditation Versions."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = AccreditationVersionSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class AccreditationVersionDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Accreditation Version instance.
+   """
+   queryset = AccreditationVersion.objects.all()  # Define queryset for the view
+   serializer_class = AccreditationVersionSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return AccreditationVersion.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Accreditation Versions."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Accreditation Versions."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - AccreditationVersion
+
+
+
+# START - ProgramLearningObjective (PLO)
+class ProgramLearningObjectiveListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Program Learning Objectives.
+   """
+   serializer_class = ProgramLearningObjectiveSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      program_learning_objectives = ProgramLearningObjective.objects.all()
+      return paginated_response(self, program_learning_objectives, ProgramLearningObjectiveSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Program Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = ProgramLearningObjectiveSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class ProgramLearningObjectiveDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Program Learning Objective instance.
+   """
+   queryset = ProgramLearningObjective.objects.all()  # Define queryset for the view
+   serializer_class = ProgramLearningObjectiveSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return ProgramLearningObjective.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Program Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Program Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - ProgramLearningObjective (PLO)
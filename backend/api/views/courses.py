@@ -0,0 +1,209 @@
+# API App views/courses.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+from .. import metrics # Task, CLO, PLO and grade metrics shared by every performance view
+from .. import ingestion # Batched course creation
+
+
+# NOTE:
+# - Views for courses, their performance and course learning objectives
+
+
+
+# START - Course
+def _single_course_errors(item, errors):
+   """
+   Purpose: Builds the 400 body of a single-course create in the shape the endpoint has always answered with: the first missing
+            field as {"error": ...}, then the course's and each CLO's serializer errors keyed by field. Anything else (unknown
+            program or PLO, bad CLO-PLO mappings) is reported as {"error": ...} with the batch validator's messages.
+   Args:
+      item (dict): The request body, {"course": {...}, "clos": [...], "plo_clo_mappings": [...]}
+      errors (list): The messages ingestion.create_courses() reported for it
+   """
+   missing = [error for error in errors if error.startswith("Missing ")]
+   if missing:
+      return {"error": missing[0]}
+   
+   course_data = item.get("course") or {}
+   course_serializer = CourseSerializer(data={
+      "a_version": course_data.get("accreditationVersion"),
+      "course_number": course_data.get("courseNumber"),
+      "name": course_data.get("courseName"),
+      "description": course_data.get("description"),
+   })
+   if not course_serializer.is_valid():
+      return course_serializer.errors
+   
+   for clo in item.get("clos") or []:
+      clo_serializer = CourseLearningObjectiveSerializer(data={"designation": clo.get("designation"), "description": clo.get("description"), "created_by": clo.get("created_by")})
+      clo_serializer.is_valid()
+      clo_errors = {field: messages for field, messages in clo_serializer.errors.items() if field != "course"}  # The course does not exist yet
+      if clo_errors:
+         return clo_errors
+   
+   return {"error": " ".join(errors)}
+
+
+class CourseListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Course instance.
+   """
+   serializer_class = CourseSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      courses = Course.objects.all()
+      return paginated_response(self, courses, CourseSerializer)
+   
+   def post(self, request):
+      """
+      Creates a course with its CLOs and PLO-CLO mappings: {"course": {...}, "clos": [...], "plo_clo_mappings": [...]}.
+      A list of those creates every course in one transaction (all or nothing) and answers with one result per course
+      (see ingestion.create_courses). A single course keeps its original error bodies (see _single_course_errors()).
+      """
+      # If needed, the code below will ensure that only super users can make a new course
+      # if not request.user.is_superuser:
+      #    return Response({"error": "Only superusers can create new Courses."}, status=status.HTTP_403_FORBIDDEN)
+      
+      data = request.data
+      is_batch = isinstance(data, list)
+      items = data if is_batch else [data]
+      if not items or not all(isinstance(item, dict) for item in items):
+         return Response({"error": "Expected a course or a list of courses."}, status=status.HTTP_400_BAD_REQUEST)
+      
+      try:
+         results, created = ingestion.create_courses(items)
+      except Exception as e:
+         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+      
+      if is_batch:
+         return Response({"results": results}, status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST)
+      if not created:
+         return Response(_single_course_errors(items[0], results[0]["errors"]), status=status.HTTP_400_BAD_REQUEST)
+      return Response(CourseSerializer(Course.objects.get(pk=results[0]["course_id"])).data, status=status.HTTP_201_CREATED)
+
+class CourseDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Course instance.
+   """
+   queryset = Course.objects.all()  # Define queryset for the view
+   serializer_class = CourseSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      return Course.objects.all()
+   
+   def perform_update(self, serializer):
+      """
+      This method is called when an update (PUT or PATCH) request is made.
+      It allows us to add custom behavior during the update.
+      """
+      serializer.save()
+   
+   def destroy(self, request, *args, **kwargs):
+      instance = self.get_object()
+      
+      if request.user.role.role_name not in ["Admin", "root"]:
+         return Response({"message": "Only Admin or root users can delete Courses."}, status=status.HTTP_403_FORBIDDEN)
+      
+      self.perform_destroy(instance)
+      return Response({"message": "Course deleted successfully."}, status=status.HTTP_200_OK)
+
+class CourseSectionsList(generics.ListAPIView):
+   """
+   Returns all section numbers for a given course
+   URL pattern: /courses/<course_id>/sections/
+   """
+   serializer_class = SectionSerializer
+   permission_classes = [IsAuthenticated]
+   
+   def get_queryset(self):
+      course_id = self.kwargs['course_id'] # Grab the course id from the url parameters
+      return Section.objects.filter(course=course_id) # Query all sections and then filter them to only include sections that are from the given course
+   
+   def list(self, request, *args, **kwargs):
+      queryset = self.get_queryset() # Define the query set using the function above
+      section_numbers = list(queryset.values_list('section_number', flat=True)) # Query all section numbers for the current course
+      return Response(section_numbers) # Return these section numbers as a list
+
+class CoursePerformance(generics.RetrieveAPIView):
+   queryset = Course.objects.all()
+   serializer_class = SectionSerializer
+   lookup_field = "pk"
+   
+   def get(self, *args, **kwargs):
+      course_id = self.kwargs.get("pk")
+      
+      # Fetch the course
+      try:
+         course = Course.objects.get(pk=course_id)
+      except Course.DoesNotExist:
+         raise NotFound(detail="Course not found")
+      
+      # Average the section CLO averages of every section related to the course
+      return Response(metrics.course_performance(course.course_id))
+# STOP - Course
+
+
+
+# START - CourseLearningObjective
+class CourseLearningObjectiveListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Course Learning Objective instance.
+   """
+   serializer_class = CourseLearningObjectiveSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      course_learning_objectives = CourseLearningObjective.objects.all()
+      return paginated_response(self, course_learning_objectives, CourseLearningObjectiveSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = CourseLearningObjectiveSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class CourseLearningObjectiveDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Embedded Task instance.
+   """
+   queryset = CourseLearningObjective.objects.all()  # Define queryset for the view
+   serializer_class = CourseLearningObjectiveSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return CourseLearningObjective.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - CourseLearningObjective
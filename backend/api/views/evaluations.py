@@ -0,0 +1,334 @@
+# API App views/evaluations.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.parsers import MultiPartParser
+from rest_framework import status, generics
+from django.db import transaction
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+from .. import metrics # Task, CLO, PLO and grade metrics shared by every performance view
+from .. import ingestion # Batched gradebook writes
+from .. import ingestion_jobs # Background gradebook imports
+
+
+# NOTE:
+# - Views for evaluation types, evaluation instruments (with their performance and gradebook imports), embedded tasks and
+#   background ingestion jobs
+
+
+
+# START - EvaluationType
+class EvaluationTypeListCreate(generics.ListCreateAPIView):
+   """
+   XAPI endpoint for listing all instances of and creating a new Evaluation Type instance.
+   """
+   serializer_class = EvaluationTypeSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      evaluation_types = EvaluationType.objects.all()
+      return paginated_response(self, evaluation_types, EvaluationTypeSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Evaluation Types."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = EvaluationTypeSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class EvaluationTypeDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Evaluation Types instance.
+   """
+   queryset = EvaluationType.objects.all()  # Define queryset for the view
+   serializer_class = EvaluationTypeSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return EvaluationType.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Evaluation Types."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Evaluation Types."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - AssignmentTemplate
+
+
+
+# START - EvaluationInstrument
+class EvaluationInstrumentListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Evaluation Instrument instance.
+   Creating one takes its whole gradebook, with ?background=true it is imported by a background job (see ingestion_jobs.py) and the job is returned instead.
+   """
+   serializer_class = EvaluationInstrumentSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      evaluation_instruments = EvaluationInstrument.objects.all()
+      return paginated_response(self, evaluation_instruments, EvaluationInstrumentSerializer)
+   
+   def post(self, request):
+      data = request.data
+      instrument_info = data.get('instrumentInfo')
+      clo_mappings = data.get('cloMappings')
+      students = data.get('students')
+      tasks = data.get('tasks')
+      
+      if not instrument_info or not clo_mappings or not students:
+         return Response({"error": "Missing required fields: instrumentInfo, cloMappings, or students."}, status=status.HTTP_400_BAD_REQUEST)
+      
+      if request.query_params.get("background") == "true":  # Import in a background job and return right away, poll ingestion-jobs/<pk>/
+         with transaction.atomic():
+            job = IngestionJob.objects.create(
+               source="gradebook",
+               payload={"instrumentInfo": instrument_info, "tasks": tasks, "cloMappings": clo_mappings, "students": students},
+               rows_total=len(students),
+               requested_by=request.user,
+            )
+            ingestion_jobs.enqueue_ingestion_job(job)  # Handed to the worker pool once this transaction commits
+         return Response(IngestionJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+      
+      try:
+         with transaction.atomic():  # Use transaction to ensure that nothing is saved if any part of the process fails
+               # Step 1: Create Evaluation Instrument
+               instrument_data = {
+                  "section" : instrument_info.get("section"),
+                  "name": instrument_info.get("name"),
+                  "description": instrument_info.get("description"),
+                  "evaluation_type": instrument_info.get("evaluation_type"),
+               }
+               instrument_serializer = EvaluationInstrumentSerializer(data=instrument_data)
+               if not instrument_serializer.is_valid():
+                  transaction.set_rollback(True)
+                  return Response(instrument_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+               instrument = instrument_serializer.save()
+               
+               # Steps 2 to 5: Create the tasks, map them to their CLOs, create the students that do not exist yet and write every score
+               # (a few bulk INSERTs, see ingestion.py)
+               ingestion.ingest_gradebook(instrument, tasks, clo_mappings, students)
+               
+               return Response(instrument_serializer.data, status=status.HTTP_201_CREATED)
+      
+      except ingestion.IngestionError as e:  # Raised inside the atomic block, so nothing was saved
+         return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+      except Exception as e:
+         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+class EvaluationInstrumentDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Evaluation Instrument instance.
+   """
+   queryset = EvaluationInstrument.objects.all()  # Define queryset for the view
+   serializer_class = EvaluationInstrumentSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      return EvaluationInstrument.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Evaluation Instruments."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def destroy(self, request, *args, **kwargs):
+      """
+      Handles DELETE requests with optional pre-deletion logic.
+      """
+      instance = self.get_object()
+      
+      # Custom logic before deletion (uncomment if needed)
+      # if not request.user.is_superuser:
+      #     return Response({"error": "Only superusers can delete Evaluation Instruments."}, status=status.HTTP_403_FORBIDDEN)
+      
+      instance.delete()
+      return Response(status=status.HTTP_204_NO_CONTENT)
+
+class EvaluationInstrumentPerformance(generics.RetrieveAPIView):
+   """
+   This view retrieves the performance of a specific Evaluation Instrument.
+   It calculates:
+   - Task performance (avg score per task)
+   - CLO performance (avg score per CLO)
+   - PLO performance (avg score per PLO)
+   """
+   queryset = EvaluationInstrument.objects.all()
+   serializer_class = EvaluationInstrumentSerializer
+   lookup_field = "pk"
+   
+   def get(self, request, *args, **kwargs):
+      instrument_id = self.kwargs.get("pk")
+      
+      # Validate Evaluation Instrument
+      try:
+         evaluation_instrument = EvaluationInstrument.objects.get(pk=instrument_id)
+      except EvaluationInstrument.DoesNotExist:
+         raise NotFound(detail="Evaluation Instrument not found")
+      
+      # Generate performance report
+      performance_data = self.generate_performance_report(evaluation_instrument)
+      
+      return Response(performance_data)
+   
+   def generate_performance_report(self, evaluation_instrument):
+      """
+      Generates the complete performance report.
+      Includes:
+      - Tasks performance
+      - CLO performance
+      - PLO performance
+      """
+      return metrics.instrument_performance(evaluation_instrument.evaluation_instrument_id)
+
+class EvaluationInstrumentGradebookImport(generics.GenericAPIView):
+   """
+   Imports a gradebook file (CSV or XLSX export, one row per student and one column per task) into an existing Evaluation Instrument.
+   The file is sent as multipart form data under "file" and read as a stream, students are committed in chunks and every
+   skipped row is listed in the response (see ingestion.import_gradebook_file for the file layout).
+   Send mode=upsert to re-upload a corrected gradebook: existing scores are updated and counted as updated/unchanged.
+   With ?background=true the file is imported by a background job (see ingestion_jobs.py) and the job is returned instead.
+   """
+   queryset = EvaluationInstrument.objects.all()
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   parser_classes = [MultiPartParser]  # Uploads are spooled to disk past FILE_UPLOAD_MAX_MEMORY_SIZE instead of being parsed into memory
+   
+   def post(self, request, pk):
+      try:
+         instrument = EvaluationInstrument.objects.get(pk=pk)
+      except EvaluationInstrument.DoesNotExist:
+         raise NotFound(detail="Evaluation Instrument not found")
+      
+      uploaded_file = request.FILES.get("file")
+      if not uploaded_file:
+         return Response({"error": "Missing required field: file."}, status=status.HTTP_400_BAD_REQUEST)
+      mode = request.data.get("mode", "insert")
+      if mode not in ("insert", "upsert"):
+         return Response({"error": "mode must be 'insert' or 'upsert'."}, status=status.HTTP_400_BAD_REQUEST)
+      
+      if request.query_params.get("background") == "true":  # Import in a background job and return right away, poll ingestion-jobs/<pk>/
+         if not uploaded_file.name.lower().endswith((".csv", ".xlsx")):
+            return Response({"error": "Unsupported file type, upload a .csv or .xlsx gradebook."}, status=status.HTTP_400_BAD_REQUEST)
+         with transaction.atomic():
+            job = IngestionJob.objects.create(source="file", evaluation_instrument=instrument, payload={"mode": mode, "file_name": uploaded_file.name}, requested_by=request.user)
+            ingestion_jobs.save_upload(job, uploaded_file)
+            ingestion_jobs.enqueue_ingestion_job(job)  # Handed to the worker pool once this transaction commits
+         return Response(IngestionJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+      
+      try:
+         report = ingestion.import_gradebook_file(instrument, uploaded_file, upsert=(mode == "upsert"))
+      except ingestion.IngestionError as e:  # The file could not be imported at all, nothing was saved
+         return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+      return Response(report, status=status.HTTP_200_OK)
+# STOP - EvaluationInstrument
+
+
+
+# START - EmbeddedTask
+class EmbeddedTaskListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Embedded Task instance.
+   """
+   serializer_class = EmbeddedTaskSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      embedded_tasks = EmbeddedTask.objects.all()
+      return paginated_response(self, embedded_tasks, EmbeddedTaskSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Embedded Tasks."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = EmbeddedTaskSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class EmbeddedTaskDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Embedded Task instance.
+   """
+   queryset = EmbeddedTask.objects.all()  # Define queryset for the view
+   serializer_class = EmbeddedTaskSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return EmbeddedTask.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Embedded Tasks."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Embedded Tasks."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - EmbeddedTask
+
+
+
+# START - IngestionJob
+class IngestionJobList(generics.ListAPIView):
+   """
+   API endpoint for listing your background gradebook imports (created by the ?background=true uploads).
+   """
+   serializer_class = IngestionJobSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get_queryset(self):
+      jobs = IngestionJob.objects.all().order_by("-created_at")
+      if not self.request.user.is_superuser:  # Users only see their own jobs
+         jobs = jobs.filter(requested_by=self.request.user)
+      return jobs
+
+class IngestionJobDetail(generics.RetrieveAPIView):
+   """
+   API endpoint for polling a background gradebook import: its status, rows validated and written so far, final counts or error.
+   """
+   serializer_class = IngestionJobSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      jobs = IngestionJob.objects.all()
+      if not self.request.user.is_superuser:  # Users only see their own jobs
+         jobs = jobs.filter(requested_by=self.request.user)
+      return jobs
+# STOP - IngestionJob
@@ -0,0 +1,172 @@
+# API App views/mappings.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+from .. import bulk # Bulk create / update / delete of the mapping tables
+
+
+# NOTE:
+# - Views for the Task-CLO and PLO-CLO mapping tables, and the bulk endpoints of every mapping table
+
+
+
+# START - TaskCLOMapping
+class TaskCLOMappingListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Task CLO Mapping instance.
+   """
+   serializer_class = TaskCLOMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      task_CLO_mappings = TaskCLOMapping.objects.all()
+      return paginated_response(self, task_CLO_mappings, TaskCLOMappingSerializer)
+   
+   def post(self, request):
+      serializer = CourseLearningObjectiveSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class TaskCLOMappingDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Task CLO Mapping instance.
+   """
+   queryset = TaskCLOMapping.objects.all()  # Define queryset for the view
+   serializer_class = TaskCLOMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return TaskCLOMapping.objects.all()
+   
+   def perform_update(self, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      serializer.save()
+   
+   def perform_destroy(self, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      instance.delete()
+# STOP - TaskCLOMapping
+
+
+
+# START - PLOCLOMapping
+class PLOCLOMappingListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new PLO CLO Mapping instance.
+   """
+   serializer_class = PLOCLOMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      plo_clo_mappings = PLOCLOMapping.objects.all()
+      return paginated_response(self, plo_clo_mappings, PLOCLOMappingSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = PLOCLOMappingSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class PLOCLOMappingDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific PLO CLO Mapping instance.
+   """
+   queryset = PLOCLOMapping.objects.all()  # Define queryset for the view
+   serializer_class = PLOCLOMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return PLOCLOMapping.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Course Learning Objectives."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - PLOCLOMapping
+
+
+
+# START - Bulk Mapping Writes
+class MappingBulk(generics.GenericAPIView):
+   """
+   Base of the bulk endpoints of the mapping tables (<mapping-route>/bulk/). Every method takes a JSON list:
+   - POST: rows to create, e.g. [{"task": 1, "clo": 2}, ...]
+   - PATCH: partial updates, each naming its row with "pk", e.g. [{"pk": 7, "clo": 3}, ...]
+   - DELETE: primary keys of the rows to delete, e.g. [7, 8, 9]
+   Items are reported one by one ({"index", "pk"} or {"index", "errors"}). Invalid items are skipped, unless ?atomic=true
+   is passed, in which case a single invalid item means nothing is written (see bulk.py).
+   """
+   model = None
+   superuser_only = True  # Same rule as the table's single object endpoints
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def write(self, request, operation, success_status):
+      if self.superuser_only and not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": f"Only superusers can bulk edit {self.model._meta.verbose_name_plural}."}, status=status.HTTP_403_FORBIDDEN)
+      if not isinstance(request.data, list) or not request.data:
+         return Response({"error": "Expected a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+      
+      atomic = request.query_params.get("atomic", "").lower() in ("1", "true", "yes")
+      results, written = operation(self.model, request.data, atomic=atomic)
+      failed = sum(1 for result in results if result.get("errors"))
+      succeeded = len(results) - failed if written else 0
+      body = {"results": results, "succeeded": succeeded, "failed": failed}
+      if not succeeded:
+         return Response(body, status=status.HTTP_400_BAD_REQUEST)
+      return Response(body, status=success_status if not failed else status.HTTP_200_OK)
+   
+   def post(self, request):
+      return self.write(request, bulk.bulk_create_mappings, status.HTTP_201_CREATED)
+   
+   def patch(self, request):
+      return self.write(request, bulk.bulk_update_mappings, status.HTTP_200_OK)
+   
+   def delete(self, request):
+      return self.write(request, bulk.bulk_delete_mappings, status.HTTP_200_OK)
+
+class TaskCLOMappingBulk(MappingBulk):
+   model = TaskCLOMapping
+   superuser_only = False
+
+class PLOCLOMappingBulk(MappingBulk):
+   model = PLOCLOMapping
+
+class ProgramCourseMappingBulk(MappingBulk):
+   model = ProgramCourseMapping
+
+class StudentTaskMappingBulk(MappingBulk):
+   model = StudentTaskMapping
+# STOP - Bulk Mapping Writes
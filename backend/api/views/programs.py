@@ -0,0 +1,131 @@
+# API App views/programs.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+
+
+# NOTE:
+# - Views for programs and the courses mapped to them
+
+
+
+# START - Program
+class ProgramListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Program instance.
+   """
+   serializer_class = ProgramSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      programs = Program.objects.all()
+      for _ in range(20):
+         print("")
+      print("Programs: ", programs)
+      return paginated_response(self, programs, ProgramSerializer)
+   
+   def post(self, request):
+      user = self.request.user
+      # Get the role IDs where the role name is either 'Admin' or 'root'
+      admin_role_ids = UserRole.objects.filter(role_name__in=["Admin", "root"]).values_list('id', flat=True)
+      
+      # Check if the user's role is in the list of admin role IDs
+      if user.role_id in admin_role_ids:
+         return Response({"error": "Only superusers can create new Programs."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = ProgramSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class ProgramDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Program instance.
+   """
+   queryset = Program.objects.all()  # Define queryset for the view
+   serializer_class = ProgramSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      return Program.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Programs."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Programs."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - Program
+
+
+
+# START - ProgramCourseMapping
+class ProgramCourseMappingListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Program Course Mapping instance.
+   """
+   serializer_class = ProgramCourseMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      program_course_mappings = ProgramCourseMapping.objects.all()
+      return paginated_response(self, program_course_mappings, ProgramCourseMappingSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Program Course Mappings."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = ProgramCourseMappingSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class ProgramCourseMappingDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Program Course Mapping instance.
+   """
+   queryset = ProgramCourseMapping.objects.all()  # Define queryset for the view
+   serializer_class = ProgramCourseMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      return ProgramCourseMapping.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Program Course Mappings."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Program Course Mappings."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - ProgramCourseMapping
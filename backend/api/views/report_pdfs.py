@@ -0,0 +1,1572 @@
+# API App views/report_pdfs.py
+
+# Django Imports
+from django.conf import settings
+from rest_framework.exceptions import ParseError, NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework import generics
+from django.http import FileResponse
+from django.db.models import F
+from collections import defaultdict
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from .. import metrics # Task, CLO, PLO and grade metrics shared with the performance endpoints
+from .. import report_cache # On-disk cache of finished report PDFs
+from .. import charts # Chart rendering service (loads matplotlib and seaborn)
+
+# PDF imports
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Spacer, Paragraph, Image, Table, TableStyle, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER 
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+
+# Misc. imports
+from io import BytesIO
+import logging
+import numpy as np
+import json
+import os
+
+
+# NOTE:
+# - These are the views that build the PDF performance reports (program, course and section)
+# - They live apart from the other views because they pull in matplotlib, seaborn and ReportLab, which take hundreds of milliseconds
+#   and tens of MB to load. Nothing imports this module up front: urls.py routes the report endpoints through
+#   lazy_report_view() (views/reports.py) and report_jobs.py imports it when a job runs, so a worker only pays for these libraries
+#   once a report is actually requested (see: python manage.py benchmark_startup)
+
+logger = logging.getLogger(__name__)
+
+
+
+# START - Program Report
+class ProgramPerformanceReport(generics.RetrieveAPIView):
+   """
+   A view for retrieving a program's performance report
+   """
+   queryset = Course.objects.all()
+   serializer_class = SectionSerializer
+   lookup_field = "pk"
+   
+   report_filename = "Program_Performance.pdf"  # Download name of the PDF, also used by report jobs
+   
+   def get(self, request, *args, **kwargs):
+      pk = self.kwargs.get("pk")
+      pdf_file = report_cache.open_or_build("program", pk, request.query_params, lambda: self.build_report(pk, request.query_params))
+      return FileResponse(pdf_file, as_attachment=True, filename=self.report_filename)
+   
+   def build_report(self, program_id, query_params):
+      """
+      Builds the report PDF in memory and returns its bytes.
+      Kept out of get() so that report jobs (see report_jobs.py) can build reports outside of a request,
+      query_params can be anything with a getlist() method (e.g. a QueryDict) holding the GET request's parameters.
+      """
+      # Fetch the course
+      try:
+         program = Program.objects.get(pk=program_id)
+      except Program.DoesNotExist:
+         raise NotFound(detail="Program not found")
+            
+      # Extract query parameters from request
+      selectedProgramSemesters = query_params.getlist("selectedProgramSemesters", [])
+      
+      # Parse selectedProgramSemesters into semester IDs
+      try:
+         semester_ids = []
+         if selectedProgramSemesters:
+            for entry in selectedProgramSemesters:
+               try:
+                  semester_obj = json.loads(entry)  # Convert JSON string to dictionary
+                  semester_ids.append(int(semester_obj["semester_id"]))
+               except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                  raise ValidationError("Invalid semester format in selectedProgramSemesters")
+            
+         # Get all courses for this program via the mapping table
+         program_course_ids = ProgramCourseMapping.objects.filter(program=program).values_list("course", flat=True)
+         
+         # Fetch sections based on whether semesters were selected
+         if semester_ids:
+            sections = Section.objects.filter(course_id__in=program_course_ids, semester_id__in=semester_ids)
+         else:
+            sections = Section.objects.filter(course_id__in=program_course_ids)
+      except ValidationError as e:
+         raise e  # Return 400 Bad Request if anything fails
+      
+      # Get all a_versions + their course and PLO data
+      a_version_data = self.find_all_plos(program_id, semester_ids)
+      if not a_version_data:
+         raise ParseError("No course data found for the selected semesters.")
+      
+      # Load the gradebook and mappings for every section of the program's courses once (the heatmap uses all semesters)
+      self.aggregator = metrics.outcome_aggregator(courses=program_course_ids)
+      
+      # Final result dict to pass to the PDF generator
+      final_result_per_version = {}
+      
+      for a_version, version_data in a_version_data.items():
+         courses = version_data["courses"]
+         plos = version_data["plos"]
+         
+         # Get sections for the version
+         sections = Section.objects.filter(
+            course__in=courses,
+            semester_id__in=semester_ids if semester_ids else Section.objects.values_list('semester_id', flat=True)
+         ).distinct()
+         
+         if not sections.exists():
+            continue  # Skip this version if there are no sections
+         
+         # Compute performance
+         plo_performance = self.aggregator.program_plo_performance(sections.values_list("section_id", flat=True))
+         
+         # Append missing PLOs with a performance of 0.0
+         for plo in plos:
+            if plo.plo_id not in plo_performance:
+                  plo_performance[plo.plo_id] = -1.0  # Set performance to 0.0 for missing PLOs
+         
+         # Add designations
+         plo_designations = {
+            plo.plo_id: plo.designation
+            for plo in ProgramLearningObjective.objects.filter(plo_id__in=plo_performance.keys())
+         }
+         
+         plo_performance_with_designations = {
+            plo_designations[plo_id]: value
+            for plo_id, value in plo_performance.items()
+            if plo_id in plo_designations
+         }
+         
+         # Get used eval types
+         program_learning_objectives = plos
+         plo_ids = {plo.plo_id for plo in plos}  # Set membership, only PLOs from this version count
+         plos_by_id = {plo.plo_id: plo for plo in plos}
+         
+         # PLO → Eval Types, one joined query over this version's courses only:
+         # every evaluation type with a task mapped to a CLO of those courses that is mapped to one of the version's PLOs
+         plo_evaluation_types = defaultdict(set)
+         eval_type_coverage = EvaluationType.objects.filter(
+            evaluationinstrument__embeddedtask__taskclomapping__clo__course__in=courses,
+            evaluationinstrument__embeddedtask__taskclomapping__clo__ploclomapping__plo__in=plo_ids,
+         ).annotate(
+            plo_id=F("evaluationinstrument__embeddedtask__taskclomapping__clo__ploclomapping__plo")
+         ).distinct()
+         for eval_type in eval_type_coverage:
+            plo_evaluation_types[plos_by_id[eval_type.plo_id]].add(eval_type)
+         
+         # Convert to lists
+         plo_evaluation_types = {
+            plo: list(types) if types else ["N/A"]
+            for plo in program_learning_objectives
+            for types in [plo_evaluation_types.get(plo, set())]
+         }
+         
+         # Generate performance chart for this version
+         plo_graph = self.create_bar_chart_plos(
+            plo_performance_with_designations,
+            f"{a_version.a_organization.name} {a_version.year} PLO Performance",
+            "PLOs",
+            "Average Score"
+         )
+         
+         # Save all version-specific data
+         final_result_per_version[a_version] = {
+            "courses": courses,
+            "program_learning_objectives": program_learning_objectives,
+            "plo_evaluation_types": plo_evaluation_types,
+            "plo_performance": plo_performance,
+            "plo_graph": plo_graph,
+         }
+      
+      if not final_result_per_version:
+         raise ParseError("No PLO performance data found for any academic version.")
+      
+      return self.generate_pdf_report(program, final_result_per_version)
+   
+   def generate_pdf_report(self, program, final_result_per_version):
+      """
+      Generate a single PDF holding the program header followed by one section per version in final_result_per_version.
+      Everything goes into one story that is rendered once, each version starts on a new page.
+      """
+      # Create a memory buffer to store the final PDF
+      output_pdf_buffer = BytesIO()
+      doc = SimpleDocTemplate(output_pdf_buffer, pagesize=letter)
+      
+      # Create the initial elements for the top of the PDF (logos, title, description)
+      elements = []
+      styles = getSampleStyleSheet()
+      
+      # Create a new style based on Heading1 and center align it.
+      centered_title_style = ParagraphStyle(
+         name='CenteredHeading1',
+         parent=styles['Heading1'],
+         alignment=TA_CENTER  # Set alignment to center
+      )
+      
+      width, height = letter
+      
+      # Path to the static images
+      dsu_logo_justwords_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "DSU_Logo_JustWords.png")
+      pemacs_logo_long_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "PEMaCS_Logo_LongStandard.jpg")
+      
+      # Check if both images exist, then make a table to make them inline with each other at the top of the document
+      if os.path.exists(dsu_logo_justwords_image_path) and os.path.exists(pemacs_logo_long_image_path):
+         dsu_logo = Image(dsu_logo_justwords_image_path, width=3*inch, height=1*inch)
+         pemacs_logo_long = Image(pemacs_logo_long_image_path, width=4*inch, height=1.2*inch)
+         
+         # Adjust column widths to match image sizes
+         logo_table = Table(
+               [[dsu_logo, pemacs_logo_long]],
+               colWidths=[3.2*inch, 4.2*inch]  # Make the first column wide enough
+         )
+         # Apply table styling
+         logo_table.setStyle(TableStyle([
+               ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # Center vertically
+               ('ALIGN', (0, 0), (0, 0), 'LEFT'),       # Align DSU logo to left
+               ('ALIGN', (1, 0), (1, 0), 'LEFT'),       # Align PEMaCS logo to left
+               ('LEFTPADDING', (0, 0), (0, 0), 0),      # Remove extra left padding
+               ('RIGHTPADDING', (0, 0), (0, 0), 5),     # Add space between logos
+               ('BOTTOMPADDING', (0, 0), (-1, -1), 10),  # Add spacing
+         ]))
+         elements.append(logo_table)  # Add table to PDF
+      
+      # Document title using centered style
+      title = Paragraph(f"Program Performance Report", centered_title_style)
+      elements.append(title)
+      
+      # Title (Program Name)
+      program_name = Paragraph(f"{program.designation}", styles['Heading3'])
+      elements.append(program_name)
+      
+      # Description (Program Description) with wrapping
+      description = Paragraph(f"{program.description}", styles['Normal'])
+      elements.append(description)
+      
+      # Comment Section
+      elements.append(Paragraph("Comments:", styles['Heading3']))
+      for _ in range(6):  # Add 5 lines for comments
+            elements.append(Spacer(1, 12))
+            elements.append(Paragraph(
+               "__________________________________________________________________________________",
+               styles['Normal']
+            ))
+      elements.append(Spacer(1, 12))
+      
+      # Start rendering every version's heatmap now so they are drawn alongside each other (and the PLO charts)
+      heatmaps = {}
+      for version_obj, data in final_result_per_version.items():
+         # Generate heatmap data and plot for Courses and their usage of PLOs
+         matrix, sorted_courses, sorted_plos = self.generate_heatmap_data(data["courses"], data["program_learning_objectives"])
+         heatmap_title = f"Course-PLO Associations - {version_obj.a_organization.name} {version_obj.year}"
+         heatmaps[version_obj] = self.create_heatmap_plo_courses(matrix, sorted_courses, sorted_plos, heatmap_title, program)
+      
+      # Iterate over each version to append its content to the story
+      for version_obj, data in final_result_per_version.items():
+         courses = data["courses"]
+         program_learning_objectives = data["program_learning_objectives"]
+         plo_evaluation_types = data["plo_evaluation_types"]
+         plo_performance = data["plo_performance"]
+         plo_graph = data.get("plo_graph") # Use get to handle potential missing key
+         
+         # Start the current version on a new page
+         elements.append(PageBreak())
+         styles = getSampleStyleSheet()
+         
+         width, height = letter
+         
+         # TODO
+         # Accreditation Organization and Version Information
+         # List all courses, ensuring that the courses are listed in ascending numerical order using course number
+         accreditation_title = Paragraph(f"{version_obj.a_organization.name} - {version_obj.year}", styles['Title'])
+         elements.append(accreditation_title)
+         # - Add the accreditation organization name + a_version year
+         # - Add the accreditation organziation's description
+         elements.append(Spacer(1, 12))
+         
+         # Courses
+         # List all courses, ensuring that the courses are listed in ascending numerical order using course number
+         courses_section_title = Paragraph(f"Courses", styles['Heading3'])
+         elements.append(courses_section_title)
+         
+         # Sort courses by course number in ascending order
+         sorted_courses = sorted(courses, key=lambda x: x.course_number)
+         
+         for course in sorted_courses:
+               if not course.date_removed:  # If the course is ACTIVE (date_removed is None)
+                  elements.append(Paragraph(f"- {course.name} ({course.course_number}) | Added: {course.date_added}", styles['Normal']))
+               else:  # If the course is INACTIVE (date_removed is not None)
+                  elements.append(Paragraph(f"- {course.name} ({course.course_number}) | Added: {course.date_added} - Removed: {course.date_removed}", styles['Normal']))
+         
+         # Comment Section
+         elements.append(Paragraph("Comments:", styles['Heading3']))
+         for _ in range(5):  # Add 5 lines for comments
+               elements.append(Spacer(1, 12))
+               elements.append(Paragraph(
+                  "__________________________________________________________________________________",
+                  styles['Normal']
+               ))
+         elements.append(Spacer(1, 12))
+         
+         # START - PLOs Table
+         # Define section header for the table
+         section_header = Paragraph(f"Program Learning Objectives (PLOs):", styles['Heading4'])
+         elements.append(section_header)
+         # Create a table for PLOs with 'Designation' and 'Description' as headers
+         table_data = []
+         table_data.append(['Designation', 'Description'])  # Header row
+         # Iterate through the PLOs to populate the table data
+         sorted_plos = sorted(program_learning_objectives, key=lambda plo: plo.designation) # Sort them alphabetically
+         for plo in sorted_plos:
+            # Create a row for each PLO with its designation and description
+            designation = str(plo.designation)  # Convert designation to string if it's not already
+            description = str(plo.description)  # Convert description to string if it's not already
+            
+            # Create a paragraph for the description to ensure text wrapping
+            description_paragraph = Paragraph(description, style=getSampleStyleSheet()['BodyText'])
+            
+            # Add the row to the table data
+            table_data.append([designation, description_paragraph])
+         # Create the table
+         table = Table(table_data, colWidths=[1*inch, 5.5*inch])
+         # Define table styles
+         table_style = TableStyle([
+               ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+               ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+               ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+               ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text (header, initially)
+               ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # Center-align text in the first column (Designations)
+               ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Descriptions)
+               ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+               ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+               ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+               ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+               ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+               ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+               ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+               ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+         ])
+         table.setStyle(table_style)
+         # Add the table to the document
+         elements.append(table)
+         # STOP - PLOs Table
+         
+         # START - PLOs -> Evaluation Types Used
+         #Define section header for the table
+         section_header = Paragraph("Program Learning Objectives (PLOs) and Evaluation Types:", styles['Heading4'])
+         elements.append(section_header)
+         
+         # Create a table for PLOs with 'PLO Designation' and 'Evaluation Types' as headers
+         table_data = []
+         table_data.append(['Designation', 'Evaluation Types'])  # Header row
+         
+         # Iterate through the CLOs to populate the table data
+         for plo, evaluation_types in plo_evaluation_types.items():
+            plo_designation = str(plo.designation)  # Convert designation to string
+            
+            # Check if evaluation_types contains EvaluationType objects or just strings
+            evaluation_text = []
+            for evaluation in evaluation_types:
+               if hasattr(evaluation, 'type_name'):
+                  # If it's an EvaluationType object, use its type_name attribute
+                  evaluation_text.append(str(evaluation.type_name))
+               else:
+                  # If it's just a string, append it directly
+                  evaluation_text.append(str(evaluation))
+            
+            # Join the text and create the paragraph
+            evaluation_paragraph = Paragraph(', '.join(evaluation_text), styles['BodyText'])
+            
+            # Add the row to the table data
+            table_data.append([plo_designation, evaluation_paragraph])
+         
+         # Sort the table data by PLO Designation (first column)
+         table_data.sort(key=lambda x: x[0])  # Sorting by the first column (designation)
+         
+         # Create the table
+         table = Table(table_data, colWidths=[1*inch, 5.5*inch])
+         
+         # Define table styles
+         table_style = TableStyle([
+               ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+               ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+               ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+               ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text initially
+               ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Evaluation Types)
+               ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+               ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+               ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+               ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+               ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+               ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+               ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+               ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+         ])
+         
+         table.setStyle(table_style)
+         
+         # Add the table to the document
+         elements.append(table)
+         # STOP  - PLOs -> Evaluation Types Used
+         
+         # START - PLO Performance Table w/ Designations
+         elements.append(Paragraph("PLO Performance", styles['Heading3']))
+         plo_data = [["PLO", "Average Score"]]  # Header row
+         
+         # Define a style for wrapping text at 200 characters
+         plo_style = ParagraphStyle(
+               "PLOStyle",
+               parent=styles["Normal"],
+               wordWrap="CJK",  # Ensures text wraps properly
+               maxLineLength=200  # Helps keep the text contained within the cell
+         )
+         
+         # Create a list to hold PLOs and their performance scores
+         plo_performance_list = []
+         
+         for plo_id, score in plo_performance.items():
+            # Query the ProgramLearningObjective model to get the PLO designation
+            try:
+               plo = ProgramLearningObjective.objects.get(plo_id=plo_id)  # Fetch the PLO by its id
+               plo_designation = plo.designation  # Get designation
+               plo_description = plo.description  # Get description
+            except ProgramLearningObjective.DoesNotExist:
+               plo_designation = "Unknown PLO"
+               plo_description = "No description available"
+            
+            # Create a wrapped paragraph for the PLO column
+            plo_text = Paragraph(f"<b>{plo_designation}:</b> {plo_description}", plo_style)
+            
+            # Add PLO and its score to the list, excluding the ones with unused PLO (-1 score)
+            if score != -1:  # Check for unused PLO
+               plo_performance_list.append([plo_text, f"{score:.2f}%"])
+            else:
+               plo_performance_list.append([plo_text, "N/A"])
+         
+         # Sort the list alphabetically based on PLO designation
+         plo_performance_list.sort(key=lambda x: x[0].getPlainText().lower())  # Sorting by designation, case insensitive
+         
+         # Add the sorted data to plo_data
+         for plo_entry in plo_performance_list:
+            plo_data.append(plo_entry)
+         
+         plo_table = Table(plo_data, colWidths=[350, 100])  # Adjust width as needed
+         
+         plo_table.setStyle(TableStyle([
+               ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+               ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+               ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left-align PLO column
+               ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center-align score column
+               ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+               ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+               ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+               ('GRID', (0, 0), (-1, -1), 1, colors.black)
+         ]))
+         
+         elements.append(plo_table)
+         # STOP  - PLO Performance Table with designations
+         
+         # Embed Graphs
+         # PLO Performance
+         plo_label = Paragraph("PLO Performance", styles['Normal'])
+         elements.append(plo_label)
+         if plo_graph:
+            try:
+               plo_image = Image(charts.image(plo_graph), width=4*inch, height=2.5*inch)
+               elements.append(plo_image)
+            except Exception as e:
+               elements.append(Paragraph(f"Error embedding graph: {e}", styles['Normal']))
+         else:
+            elements.append(Paragraph("PLO Performance Graph Not Available", styles['Normal']))
+         
+         # START - Courses and PLO Association Heatmap
+         heatmap = heatmaps[version_obj]
+         
+         # Add Heatmap
+         elements.append(Spacer(1, 24))
+         elements.append(Paragraph("Course-PLO Associations", styles['Heading3']))
+         if heatmap:
+               try:
+                  heatmap_img = Image(charts.image(heatmap), width=6*inch, height=4*inch)
+                  elements.append(heatmap_img)
+               except Exception as e:
+                  elements.append(Paragraph(f"Error embedding heatmap: {e}", styles['Normal']))
+         else:
+               elements.append(Paragraph("Heatmap Not Available", styles['Normal']))
+         # STOP  - Courses and PLO Association Heatmap
+         
+      # Create the document in one pass
+      doc.build(elements)
+      
+      return output_pdf_buffer.getvalue()
+   
+   def find_all_plos(self, program_id, semester_ids):
+      """
+      Purpose: Finds all PLOs (Program Learning Objectives) for a given program
+               and list of semesters by grouping them under their accreditation version.
+      Args:
+         program_id (int): ID of the program.
+         semester_ids (list[int]): List of semester IDs.
+      Returns:
+         dict: {
+               a_version_0: {
+                  'courses': [course_0, course_1, ...],
+                  'plos': [plo_0, plo_1, ...]
+               },
+               ...
+         }
+      """
+      result = defaultdict(lambda: {'courses': set(), 'plos': set()})
+      
+      # Step 1: Grab all related courses to the current program
+      course_ids = ProgramCourseMapping.objects.filter(
+         program=program_id
+      ).values_list('course_id', flat=True)
+      
+      if not course_ids:
+         logger.error("find_all_plos: no courses found for program %s", program_id)
+         return Response({"error": "No courses found for the given program."}, status=404)
+      
+      # Step 2: Grab all related sections to the courses just grabbed
+      if (len(semester_ids) > 0):
+         valid_sections = Section.objects.filter(
+            course__in=course_ids,
+            semester__in=semester_ids
+         )
+      else: # If no semester_ids were passed, grab ALL sections no matter the semester
+         valid_sections = Section.objects.filter(
+            course__in=course_ids,
+         )
+      
+      if not valid_sections:
+         logger.error("find_all_plos: no sections found for program %s in semesters %s", program_id, semester_ids)
+         return Response({"error": "No sections found for the given courses and semesters."}, status=404)
+      
+      # Step 3: For each valid section, extract the course and its a_version
+      seen_courses = set()
+      for section in valid_sections:
+         course = section.course
+         
+         # Avoid repeating the same course if it appears in multiple sections
+         if course.course_id in seen_courses:
+               continue
+         seen_courses.add(course.course_id)
+         
+         a_version = course.a_version
+         result[a_version]['courses'].add(course)
+         
+         # Step 4: Get all PLOs linked to this accreditation version
+         plos = ProgramLearningObjective.objects.filter(
+               a_version=a_version
+         )
+         result[a_version]['plos'].update(plos)
+      
+      # Convert sets to lists
+      for a_version in result:
+         result[a_version]['courses'] = list(result[a_version]['courses'])
+         result[a_version]['plos'] = list(result[a_version]['plos'])
+      
+      return dict(result)
+   
+   def create_bar_chart_plos(self, data, title, xlabel, ylabel):
+      """
+      Start rendering a bar chart of the PLO averages, returns the chart's Future (see charts.py).
+      """
+      # Sort the keys of the data dictionary alphabetically
+      sorted_data = {k: data[k] for k in sorted(data.keys())}
+      return charts.render(charts.bar_chart, sorted_data, title, xlabel, ylabel)
+   
+   def generate_heatmap_data(self, courses, plos):
+      """
+      Prepares a matrix with performance scores for course-PLO pairs.
+      Includes program designation in course labels.
+      """
+      # Sort courses and PLOs consistently
+      sorted_courses = sorted(courses, key=lambda c: c.course_number)
+      sorted_plos = sorted(plos, key=lambda p: p.designation)
+      
+      # Calculate each course's PLO performance once, rather than once per PLO
+      course_plo_performance = {
+         course.course_id: self.aggregator.program_plo_performance(self.aggregator.section_ids_for([course.course_id]))
+         for course in sorted_courses
+      }
+      
+      # Build course-PLO performance matrix
+      matrix = []
+      for plo in sorted_plos:
+         plo_row = []
+         for course in sorted_courses:
+               # Calculate PLO performance for all sections of this course
+               performance = course_plo_performance[course.course_id]
+               score = performance.get(plo.plo_id, -1.0)  # -1 indicates no association
+               
+               # Convert to percentage and handle missing data
+               final_score = score if score != -1.0 else np.nan
+               plo_row.append(final_score)
+         matrix.append(plo_row)
+      
+      return matrix, sorted_courses, sorted_plos
+   
+   def create_heatmap_plo_courses(self, matrix, courses, plos, title, program):
+      """
+      Start rendering a blue-themed heatmap with performance gradient, returns the chart's Future (see charts.py).
+      Includes program designation in course labels.
+      """
+      # Create course labels with program prefix (e.g., "BSCS-101")
+      course_labels = [f"{program.designation}-{c.course_number}" for c in courses]
+      return charts.render(
+         charts.heatmap,
+         matrix,
+         course_labels,
+         [p.designation for p in plos],
+         title,
+         program.designation + " Courses",
+         "Program Learning Objectives",
+      )
+# STOP - Program Report
+
+
+
+# START - Course Report
+class CoursePerformanceReport(generics.RetrieveAPIView):
+   """
+   A view for retrieving a course's performance report
+   """
+   queryset = Course.objects.all()
+   serializer_class = SectionSerializer
+   lookup_field = "pk"
+   
+   report_filename = "Course_Performance.pdf"  # Download name of the PDF, also used by report jobs
+   
+   def get(self, request, *args, **kwargs):
+      pk = self.kwargs.get("pk")
+      pdf_file = report_cache.open_or_build("course", pk, request.query_params, lambda: self.build_report(pk, request.query_params))
+      return FileResponse(pdf_file, as_attachment=True, filename=self.report_filename)
+   
+   def build_report(self, course_id, query_params):
+      """
+      Builds the report PDF in memory and returns its bytes.
+      Kept out of get() so that report jobs (see report_jobs.py) can build reports outside of a request,
+      query_params can be anything with a getlist() method (e.g. a QueryDict) holding the GET request's parameters.
+      """
+      # Fetch the course
+      try:
+         course = Course.objects.get(pk=course_id)
+      except Course.DoesNotExist:
+         raise NotFound(detail="Course not found")
+      
+      program_names = list(ProgramCourseMapping.objects.filter(course=course).values_list("program__designation", flat=True))
+      
+      # Extract query parameters from request
+      selectedCourseSemesters = query_params.getlist("selectedCourseSemesters", [])
+      excludedSections = query_params.getlist("excludedSection", [])
+      
+      # Convert excludedSections to integers
+      try:
+         excludedSections = [int(section_id) for section_id in excludedSections]
+      except ValueError:
+         raise ParseError("Invalid excluded section ID format")
+      
+      # Parse selectedCourseSemesters into semester IDs
+      try:
+         if selectedCourseSemesters:  # Check if semesters were passed
+            semester_ids = []
+            
+            for entry in selectedCourseSemesters:
+                  try:
+                     semester_obj = json.loads(entry)  # Convert JSON string to dictionary
+                     semester_ids.append(int(semester_obj["semester_id"]))
+                  except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                     raise ParseError("Invalid semester format in selectedCourseSemesters")
+            
+            logger.debug("Semester IDs: %s", semester_ids)
+            sections = Section.objects.filter(course=course, semester_id__in=semester_ids)  # Whitelist filter
+         else:
+            sections = Section.objects.filter(course=course)  # No filtering if no semesters provided
+      except NotFound as e:
+         raise e  # Raise a 400 Bad Request error with the message
+      
+      # Whitelist filtering (match semester_id)
+      logger.debug("Sections left after semester whitelisting: %s", sections)
+      
+      # Blacklist filtering (exclude specific section IDs)
+      if excludedSections:
+         sections = sections.exclude(section_id__in=excludedSections)
+      logger.debug("Sections left after excludedSections filtering: %s", sections)
+      
+      if len(sections) <= 0: # If there are no sections after filtering
+         raise ValidationError("There were no sections left after filtering!")
+      
+      # Load the gradebook and mappings for the remaining sections once
+      aggregator = metrics.outcome_aggregator(sections=sections)
+      section_ids = [section.section_id for section in sections]
+      
+      # Compute performance metrics
+      overall_avg_grade = metrics.average_student_grade(sections)
+      overall_clo_performance = aggregator.course_clo_performance(section_ids)
+      overall_plo_performance = aggregator.plo_performance(overall_clo_performance)
+      
+      # Query CLOs and PLOs to get the actual objects by their IDs (one query each)
+      clo_objects = CourseLearningObjective.objects.in_bulk(list(overall_clo_performance.keys()))
+      plo_objects = ProgramLearningObjective.objects.in_bulk(list(overall_plo_performance.keys()))
+      
+      # Replace PK IDs with designations in performance dictionaries
+      clo_performance_with_designations = {
+         clo_objects[clo_id].designation: value
+         for clo_id, value in overall_clo_performance.items()
+      }
+      
+      plo_performance_with_designations = {
+         plo_objects[plo_id].designation: value
+         for plo_id, value in overall_plo_performance.items()
+      }
+      
+      # START - Get All CLOs and What PLOs They Correspond To
+      # Construct CLO → PLO mappings dictionary using the mappings already loaded by the aggregator
+      clo_plo_mappings = {}
+      for clo_id in overall_clo_performance.keys():
+         clo_plo_mappings[clo_objects[clo_id]] = [
+            plo_objects[plo_id] for plo_id in aggregator.clo_plos.get(clo_id, []) if plo_id in plo_objects
+         ]
+      # STOP  - Get All CLOs and What PLOs They Correspond To
+      
+      # START - PLOs For This Course
+      plos = ProgramLearningObjective.objects.filter( plo_id__in=[plo.plo_id for clo in clo_plo_mappings.values() for plo in clo] ) # Fetch only PLOs relevant to the class
+      # STOP  - PLOs For This Course
+      
+      # START - Get All CLOs and What Types of Evaluation Instruments They Used
+      clo_evaluation_type_ids = aggregator.clo_evaluation_type_ids(section_ids)
+      evaluation_types = EvaluationType.objects.in_bulk([type_id for type_ids in clo_evaluation_type_ids.values() for type_id in type_ids if type_id is not None])
+      clo_evaluation_types = {
+         clo: [evaluation_types.get(type_id) for type_id in type_ids]
+         for clo, type_ids in clo_evaluation_type_ids.items()
+      }
+      logger.debug("CLOs to types: %s", clo_evaluation_types)
+      # STOP  - Get All CLOs and What Types of Evaluation Instruments They Used
+      
+      # START - Find Course Performance for CLOs and PLOs
+      course_performance = {
+         'clo_performance': overall_clo_performance,
+         'plo_performance': overall_plo_performance
+      }
+      # STOP - Find Course Performance for CLOs and PLOs
+      
+      # Generate graphs
+      plo_graph = self.create_bar_chart_plos(plo_performance_with_designations, "PLO Performance", "PLOs", "Average Score")
+      clo_graph = self.create_bar_chart_clos(clo_performance_with_designations, "CLO Performance", "CLOs", "Average Score")
+      box_plot = self.create_box_plot_for_sections(sections)
+      
+      # Create and return PDF
+      return self.generate_pdf(course, sections, program_names, plos, clo_plo_mappings, clo_evaluation_types, course_performance, overall_avg_grade, clo_graph, plo_graph, box_plot)
+   
+   def create_bar_chart_plos(self, data, title, xlabel, ylabel):
+      """
+      Start rendering a bar chart of the PLO averages, returns the chart's Future (see charts.py).
+      """
+      return charts.render(charts.bar_chart, data, title, xlabel, ylabel)
+   
+   def create_bar_chart_clos(self, data, title, xlabel, ylabel):
+      """
+      Start rendering a bar chart of the CLO averages, returns the chart's Future (see charts.py).
+      """
+      return charts.render(charts.bar_chart, data, title, xlabel, ylabel, whole_number_ticks=True)  # Ensure x-axis ticks are whole numbers
+   
+   def create_box_plot_for_sections(self, sections):
+      """
+      Start rendering a box plot for student average grades (normalized) across all tasks in each section, returns the chart's Future.
+      If no data is available, an empty box plot is drawn instead of returning None.
+      """
+      section_averages = []  # Store student averages per section for a true box plot
+      valid_sections = []  # List to store sections with data
+      grades_by_section = metrics.student_average_grades_by_section(sections)  # One grouped query for every section
+      
+      for idx, section in enumerate(sections):  # Use enumerate to track the index
+         student_avg_scores = grades_by_section.get(section.section_id)
+         if student_avg_scores:  # Ensure section has data
+               section_averages.append(student_avg_scores)
+               valid_sections.append(f"Section {idx + 1}")  # Use idx to get the section number
+      
+      return charts.render(charts.box_plot, section_averages, valid_sections, "Student Average Grade Distribution by Section", "Sections", (8, 5))
+
+   def generate_pdf(self, course, sections, program_names, program_learning_objectives, clo_plo_mappings, clo_evaluation_types, performance_data, avg_grade, clo_graph, plo_graph, box_plot):
+      """
+      Generate a PDF report containing the course performance data and graphs.
+      """
+      pdf_buffer = BytesIO()
+      doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
+      
+      elements = []
+      styles = getSampleStyleSheet()
+      
+      # Create a new style based on Heading1 and center align it.
+      centered_title_style = ParagraphStyle(
+         name='CenteredHeading1',
+         parent=styles['Heading1'],
+         alignment=TA_CENTER  # Set alignment to center
+      )
+      
+      width, height = letter
+      
+      # Path to the static images
+      dsu_logo_justwords_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "DSU_Logo_JustWords.png")
+      pemacs_logo_long_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "PEMaCS_Logo_LongStandard.jpg")
+      
+      # Check if both images exist, then make a table to make them inline with each other at the top of the document
+      if os.path.exists(dsu_logo_justwords_image_path) and os.path.exists(pemacs_logo_long_image_path):
+         dsu_logo = Image(dsu_logo_justwords_image_path, width=3*inch, height=1*inch)
+         pemacs_logo_long = Image(pemacs_logo_long_image_path, width=4*inch, height=1.2*inch)
+         
+         # Adjust column widths to match image sizes
+         logo_table = Table(
+            [[dsu_logo, pemacs_logo_long]], 
+            colWidths=[3.2*inch, 4.2*inch]  # Make the first column wide enough
+         )
+         # Apply table styling
+         logo_table.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # Center vertically
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),       # Align DSU logo to left
+            ('ALIGN', (1, 0), (1, 0), 'LEFT'),       # Align PEMaCS logo to left
+            ('LEFTPADDING', (0, 0), (0, 0), 0),      # Remove extra left padding
+            ('RIGHTPADDING', (0, 0), (0, 0), 5),     # Add space between logos
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),  # Add spacing
+         ]))
+         elements.append(logo_table)  # Add table to PDF
+      
+      # Document title using centered style
+      title = Paragraph(f"Course Performance Report", centered_title_style)
+      elements.append(title)
+      
+      # Header (Course Information)
+      title = Paragraph(f"Course Information", styles['Heading2'])
+      elements.append(title)
+      
+      # Title (Course Name) 
+      course_name = Paragraph(f"{course.name} - {course.course_number}", styles['Heading3'])
+      elements.append(course_name)
+      
+      # Description (Course Description) with wrapping
+      description = Paragraph(f"{course.description}", styles['Normal'])
+      elements.append(description)
+      
+      # Sections
+      # Title with no indentation
+      semester_title_style = styles['Heading4'].clone('title_style') #clone the style
+      semester_title_style.leftIndent = 0
+      semester_title = Paragraph("Sections Listed By Semester Designation:", semester_title_style)
+      elements.append(semester_title)
+      
+      program_names_inline = "• "
+      for program_name in program_names:
+         program_names_inline += program_name
+      
+      sections_by_semester = defaultdict(list)
+      for section in sections:
+         sections_by_semester[section.semester.designation].append(section)
+      
+      for semester_designation in sorted(sections_by_semester, key=lambda x: int(x)):
+         # Semester Heading with indentation
+         semester_header_style = styles['Heading4'].clone(f'header_style_{semester_designation}') #clone the style
+         semester_header_style.leftIndent = 30
+         semester_header = Paragraph(f"{semester_designation}:", semester_header_style)
+         elements.append(semester_header)
+      
+         # List sections under this semester with indentation
+         for section in sections_by_semester[semester_designation]:
+            section_style = styles['Normal'].clone(f'section_style_{section.crn}') #clone the style
+            section_style.leftIndent = 50
+            section_to_show = Paragraph(
+                  f"{program_names_inline} {section.course.course_number} - {section.section_number} ({section.crn})",
+                  section_style
+            )
+            elements.append(section_to_show)
+      
+      # Instructor Comment Section
+      elements.append(Paragraph("Instructor Comments:", styles['Heading3']))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      
+      # START - CLO <-> PLO Mapping Table
+      section_header = Paragraph(f"Course Learning Outcomes to Program Learning Outcomes Map:", styles['Heading4'])
+      elements.append(section_header)
+         # Create a table with CLO to PLO mappings
+      table_data = []
+      table_data.append(['Course Learning Outcome', 'Program Learning Outcome(s)'])  # Header row
+         # Iterate through the clo_plo_mappings to populate the table data
+      for clo, plos in clo_plo_mappings.items():
+            # Build the list of PLO designations for each CLO
+         plo_designations = ', '.join([str(plo.designation) for plo in plos])
+            # Wrap CLO description text using Paragraph for text wrapping
+         clo_text = f"{str(clo.designation)}. {clo.description}"
+         clo_paragraph = Paragraph(clo_text, style=getSampleStyleSheet()['BodyText'])
+            # Add a row to the table data
+         table_data.append([clo_paragraph, plo_designations])
+      # Create the table
+      table = Table(table_data, colWidths=[4*inch, 2.5*inch])
+         # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text (header, initially)
+         ('ALIGN', (0, 1), (0, -1), 'LEFT'),  # Left-align text in the first column (CLO descriptions)
+         ('ALIGN', (1, 1), (-1, -1), 'CENTER'),  # Center-align text in the second column (PLOs)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      table.setStyle(table_style)
+         # Add the table to the document
+      elements.append(table)
+      # STOP  - CLO <-> PLO Mapping Table
+      
+      # START - PLOs Table
+         # Define section header for the table
+      section_header = Paragraph(f"Program Learning Objectives (PLOs):", styles['Heading4'])
+      elements.append(section_header)
+         # Create a table for PLOs with 'Designation' and 'Description' as headers
+      table_data = []
+      table_data.append(['Designation', 'Description'])  # Header row
+         # Iterate through the PLOs to populate the table data
+      for plo in program_learning_objectives:
+         # Create a row for each PLO with its designation and description
+         designation = str(plo.designation)  # Convert designation to string if it's not already
+         description = str(plo.description)  # Convert description to string if it's not already
+         
+         # Create a paragraph for the description to ensure text wrapping
+         description_paragraph = Paragraph(description, style=getSampleStyleSheet()['BodyText'])
+         
+         # Add the row to the table data
+         table_data.append([designation, description_paragraph])
+         # Create the table
+      table = Table(table_data, colWidths=[1*inch, 5.5*inch])
+         # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text (header, initially)
+         ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # Center-align text in the first column (Designations)
+         ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Descriptions)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      table.setStyle(table_style)
+         # Add the table to the document
+      elements.append(table)
+      # STOP - PLOs Table
+      
+      # START - CLOs -> Evaluation Types Used
+      # Define section header for the table
+      section_header = Paragraph("Course Learning Objectives (CLOs) and Evaluation Types:", styles['Heading4'])
+      elements.append(section_header)
+      
+      # Create a table for CLOs with 'CLO Designation' and 'Evaluation Types' as headers
+      table_data = []
+      table_data.append(['CLO Designation', 'Evaluation Types'])  # Header row
+      
+      # Iterate through the CLOs to populate the table data
+      for clo, evaluation_types in clo_evaluation_types.items():
+         clo_designation = str(clo)  # Convert designation to string
+         evaluation_text = ', '.join(str(evaluation.type_name) for evaluation in evaluation_types)
+         evaluation_paragraph = Paragraph(evaluation_text, styles['BodyText'])
+         
+         # Add the row to the table data
+         table_data.append([clo_designation, evaluation_paragraph])
+      
+      # Create the table
+      table = Table(table_data, colWidths=[1.5*inch, 5*inch])
+      
+      # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text initially
+         ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Evaluation Types)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      
+      table.setStyle(table_style)
+      
+      # Add the table to the document
+      elements.append(table)
+      # STOP  - CLOs -> Evaluation Types Used
+      
+      # START - PLO Performance Table w/ Designations
+      elements.append(Paragraph("PLO Performance", styles['Heading3']))
+      plo_data = [["PLO", "Average Score"]]  # Header row
+      
+      # Define a style for wrapping text at 200 characters
+      plo_style = ParagraphStyle(
+         "PLOStyle",
+         parent=styles["Normal"],
+         wordWrap="CJK",  # Ensures text wraps properly
+         maxLineLength=200  # Helps keep the text contained within the cell
+      )
+      
+      # Create a list to hold PLOs and their performance scores
+      plo_performance_list = []
+      
+      for plo_id, score in performance_data['plo_performance'].items():
+         # Query the ProgramLearningObjective model to get the PLO designation
+         try:
+            plo = ProgramLearningObjective.objects.get(plo_id=plo_id)  # Fetch the PLO by its id
+            plo_designation = plo.designation  # Get designation
+            plo_description = plo.description  # Get description
+         except ProgramLearningObjective.DoesNotExist:
+            plo_designation = "Unknown PLO"
+            plo_description = "No description available"
+         
+         # Create a wrapped paragraph for the PLO column
+         plo_text = Paragraph(f"<b>{plo_designation}:</b> {plo_description}", plo_style)
+         
+         # Add PLO and its score to the list, excluding the ones with unused PLO (-1 score)
+         if score != -1:  # Check for unused PLO
+            plo_performance_list.append([plo_text, f"{score:.2f}%"])
+         else:
+            plo_performance_list.append([plo_text, "N/A"])
+      
+      # Sort the list alphabetically based on PLO designation
+      plo_performance_list.sort(key=lambda x: x[0].getPlainText().lower())  # Sorting by designation, case insensitive
+      
+      # Add the sorted data to plo_data
+      for plo_entry in plo_performance_list:
+         plo_data.append(plo_entry)
+      
+      plo_table = Table(plo_data, colWidths=[350, 100])  # Adjust width as needed
+      
+      plo_table.setStyle(TableStyle([
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+         ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left-align PLO column
+         ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center-align score column
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+         ('GRID', (0, 0), (-1, -1), 1, colors.black)
+      ]))
+      
+      elements.append(plo_table)
+      # STOP  - PLO Performance Table with designations
+      
+      # START - CLO Performance Table w/ Designations
+      elements.append(Paragraph("CLO Performance", styles['Heading3']))
+      clo_data = [["CLO", "Average Score"]]  # Header row
+      
+      # Define a style for wrapping text at 200 characters
+      clo_style = ParagraphStyle(
+         "CLOStyle",
+         parent=styles["Normal"],
+         wordWrap="CJK",  # Ensures text wraps properly
+         maxLineLength=200  # This indirectly helps keep the text within bounds
+      )
+      
+      for clo_id, score in performance_data['clo_performance'].items():
+         # Query the CourseLearningObjectives model to get the CLO designation based on the clo_id
+         try:
+            clo = CourseLearningObjective.objects.get(clo_id=clo_id)  # Fetch the CLO by its id
+            clo_designation = clo.designation  # Grab designation
+            clo_description = clo.description  # Grab description
+         except CourseLearningObjective.DoesNotExist:
+            clo_designation = "Unknown CLO"
+            clo_description = "No description available"
+         
+         # Create a wrapped paragraph for the CLO column
+         clo_text = Paragraph(f"<b>{clo_designation}:</b> {clo_description}", clo_style)
+         
+         if score != -1: # Check for non-used CLOs (-1 scores)
+            clo_data.append([clo_text, f"{score:.2f}%"])  # Append wrapped text
+         else: 
+            clo_data.append([clo_text, "N/A"])  # Append wrapped text
+      
+      clo_table = Table(clo_data, colWidths=[350, 100])  
+      
+      clo_table.setStyle(TableStyle([
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+         ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left-align CLO column
+         ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center-align score column
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+         ('GRID', (0, 0), (-1, -1), 1, colors.black)
+      ]))
+      
+      elements.append(clo_table)
+      # STOP  - CLO Performance Table
+      
+      # Overall Average Grade
+      avg_grade_text = Paragraph(f"Overall Average Grade: {avg_grade:.2f}", styles['Normal'])
+      elements.append(avg_grade_text)
+      
+      # Embed Graphs
+      # PLO Performance
+      plo_label = Paragraph("PLO Performance", styles['Normal'])
+      elements.append(plo_label)
+      plo_image = Image(charts.image(plo_graph), width=4*inch, height=2.5*inch)
+      elements.append(plo_image)
+      # CLO Performance
+      clo_label = Paragraph("CLO Performance", styles['Normal'])
+      elements.append(clo_label)
+      clo_image = Image(charts.image(clo_graph), width=4*inch, height=2.5*inch)
+      elements.append(clo_image)
+      # Student Grade Box Plot
+      box_plot_label = Paragraph("Student Grade Distribution", styles['Normal'])
+      elements.append(box_plot_label)
+      box_plot_image = Image(charts.image(box_plot), width=4*inch, height=2.5*inch)
+      elements.append(box_plot_image)
+      
+      doc.build(elements)
+      
+      return pdf_buffer.getvalue()
+# STOP - Course Report
+
+
+
+# START - Section Report
+class SectionPerformanceReport(generics.RetrieveAPIView):
+   """
+   This view is meant to ascertain the section performance.
+   It retrieves the section based on the provided primary key (pk).
+   """
+   queryset = Section.objects.all()
+   serializer_class = SectionSerializer
+   lookup_field = "pk"
+   
+   report_filename = "Section_Performance.pdf"  # Download name of the PDF, also used by report jobs
+   
+   def get(self, request, *args, **kwargs):
+      pk = self.kwargs.get("pk")
+      pdf_file = report_cache.open_or_build("section", pk, request.query_params, lambda: self.build_report(pk, request.query_params))
+      return FileResponse(pdf_file, as_attachment=True, filename=self.report_filename)
+   
+   def build_report(self, section_id, query_params):
+      """
+      Builds the report PDF in memory and returns its bytes.
+      Kept out of get() so that report jobs (see report_jobs.py) can build reports outside of a request,
+      query_params can be anything with a getlist() method (e.g. a QueryDict) holding the GET request's parameters.
+      """
+      # Check if the given section_id corresponds to a valid Section object
+      try:
+         section = Section.objects.get(pk=section_id)
+      except Section.DoesNotExist:
+         raise NotFound(detail="Section not found")
+      
+      # Perform necessary logic for performance report generation here
+      aggregator = metrics.outcome_aggregator(sections=[section])
+      performance_data = metrics.section_report_performance(aggregator, section)
+      
+      # Compute performance metrics
+      overall_plo_performance = performance_data["plo_performance"]
+      overall_clo_performance = performance_data["clo_performance"]
+      
+      # START - Get All CLOs and What PLOs They Correspond To
+         # Query CLOs and PLOs to get the actual objects by their IDs (one query each)
+      clo_objects = CourseLearningObjective.objects.in_bulk(list(overall_clo_performance.keys()))
+      plo_objects = ProgramLearningObjective.objects.in_bulk(list(overall_plo_performance.keys()))
+         # Construct CLO → PLO mappings dictionary from the mappings the aggregator already loaded
+      clo_plo_mappings = {}
+      for clo_id, clo in clo_objects.items():
+         clo_plo_mappings[clo] = [plo_objects[plo_id] for plo_id in aggregator.clo_plos.get(clo_id, []) if plo_id in plo_objects]
+      # STOP  - Get All CLOs and What PLOs They Correspond To
+      
+      # START - Get all PLOs
+      program_learning_objectives = plo_objects
+      # STOP  - Get all PLOs
+      
+      # START - Get All CLOs and What Types of Evaluation Instruments They Used
+      clo_evaluation_type_ids = aggregator.clo_evaluation_type_ids([section.section_id])
+      evaluation_types = EvaluationType.objects.in_bulk({type_id for type_ids in clo_evaluation_type_ids.values() for type_id in type_ids if type_id is not None})
+      clo_evaluation_types = {
+         clo: [evaluation_types.get(type_id) for type_id in type_ids]
+         for clo, type_ids in clo_evaluation_type_ids.items()
+      }
+      logger.debug("CLOs to types: %s", clo_evaluation_types)
+      # STOP  - Get All CLOs and What Types of Evaluation Instruments They Used
+      
+      # START - Get PLO & CLO Performance with Designations
+         # Replace PK IDs with designations in performance dictionaries
+      clo_performance_with_designations = {
+         clo_objects[clo_id].designation: value
+         for clo_id, value in overall_clo_performance.items()
+      }
+      plo_performance_with_designations = {
+         plo_objects[plo_id].designation: value
+         for plo_id, value in overall_plo_performance.items()
+      }
+      # STOP  - Get PLO & CLO Performance with Designations
+      
+      # Generate graphs
+      plo_graph = self.create_bar_chart_plos(plo_performance_with_designations, "PLO Performance", "PLOs", "Average Score")
+      clo_graph = self.create_bar_chart_clos(clo_performance_with_designations, "CLO Performance", "CLOs", "Average Score")
+      box_plot = self.create_box_plot_for_section(section)
+      
+      # Generate PDF
+      return self.generate_pdf(performance_data, section, clo_plo_mappings, program_learning_objectives, clo_evaluation_types, clo_graph, plo_graph, box_plot)
+   
+   def create_bar_chart_plos(self, data, title, xlabel, ylabel):
+      """
+      Start rendering a bar chart of the PLO averages, returns the chart's Future (see charts.py).
+      """
+      return charts.render(charts.bar_chart, data, title, xlabel, ylabel)
+   
+   def create_bar_chart_clos(self, data, title, xlabel, ylabel):
+      """
+      Start rendering a bar chart of the CLO averages, returns the chart's Future (see charts.py).
+      """
+      return charts.render(charts.bar_chart, data, title, xlabel, ylabel, whole_number_ticks=True)  # Ensure x-axis ticks are whole numbers
+   
+   def create_box_plot_for_section(self, section):
+      """
+      Start rendering a box plot for student average grades (normalized) in a given section, returns the chart's Future.
+      If no data is available, an empty box plot is drawn instead of returning None.
+      """
+      section_averages = metrics.student_average_grades(section)
+      return charts.render(
+         charts.box_plot,
+         [section_averages] if section_averages else [],
+         None,  # Single section, no x-axis ticks
+         "Student Average Grade Distribution",
+         "Section",
+         (6, 5),  # Adjusted size for a single section
+      )
+
+   def generate_pdf(self, performance_data, section, clo_plo_mappings, program_learning_objectives, clo_evaluation_types, clo_graph, plo_graph, box_plot):
+      """
+      Generate a PDF from the performance data using ReportLab, built in memory.
+      """
+      pdf_buffer = BytesIO()
+      doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
+      styles = getSampleStyleSheet()
+      elements = []
+      
+      # Path to the static images
+      dsu_logo_justwords_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "DSU_Logo_JustWords.png")
+      pemacs_logo_long_image_path = os.path.join(settings.BASE_DIR, "api", "static", "images", "PEMaCS_Logo_LongStandard.jpg")
+      
+      # Check if both images exist, then make a table to make them inline with each other at the top of the document
+      if os.path.exists(dsu_logo_justwords_image_path) and os.path.exists(pemacs_logo_long_image_path):
+         dsu_logo = Image(dsu_logo_justwords_image_path, width=3*inch, height=1*inch)
+         pemacs_logo_long = Image(pemacs_logo_long_image_path, width=4*inch, height=1.2*inch)
+         
+         # Adjust column widths to match image sizes
+         logo_table = Table(
+            [[dsu_logo, pemacs_logo_long]], 
+            colWidths=[3.2*inch, 4.2*inch]  # Make the first column wide enough
+         )
+         # Apply table styling
+         logo_table.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # Center vertically
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),       # Align DSU logo to left
+            ('ALIGN', (1, 0), (1, 0), 'LEFT'),       # Align PEMaCS logo to left
+            ('LEFTPADDING', (0, 0), (0, 0), 0),      # Remove extra left padding
+            ('RIGHTPADDING', (0, 0), (0, 0), 5),     # Add space between logos
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),  # Add spacing
+         ]))
+         elements.append(logo_table)  # Add table to PDF
+      
+      elements.append(Paragraph("Section Performance Report", styles['Title']))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(f"{section.course.name} #{section.section_number} ({section.crn}) | Semester: {section.semester.designation}", styles['Heading2']))
+      elements.append(Spacer(1, 4))
+      
+      # Description (Course Description) with wrapping
+      description = Paragraph(f"{section.course.description}", styles['Normal'])
+      elements.append(description)
+      
+      # Instructor Comment Section
+      elements.append(Paragraph("Instructor Comments:", styles['Heading3']))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      elements.append(Paragraph(
+         "__________________________________________________________________________________",
+         styles['Normal']
+      ))
+      elements.append(Spacer(1, 12))
+      
+      # START - CLO <-> PLO Mapping Table
+      section_header = Paragraph(f"Course Learning Outcomes to Program Learning Outcomes Map:", styles['Heading4'])
+      elements.append(section_header)
+         # Create a table with CLO to PLO mappings
+      table_data = []
+      table_data.append(['Course Learning Outcome', 'Program Learning Outcome(s)'])  # Header row
+         # Iterate through the clo_plo_mappings to populate the table data
+      for clo, plos in clo_plo_mappings.items():
+            # Build the list of PLO designations for each CLO
+         plo_designations = ', '.join([str(plo.designation) for plo in plos])
+            # Wrap CLO description text using Paragraph for text wrapping
+         clo_text = f"{str(clo.designation)}. {clo.description}"
+         clo_paragraph = Paragraph(clo_text, style=getSampleStyleSheet()['BodyText'])
+            # Add a row to the table data
+         table_data.append([clo_paragraph, plo_designations])
+      # Create the table
+      table = Table(table_data, colWidths=[4*inch, 2.5*inch])
+         # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text (header, initially)
+         ('ALIGN', (0, 1), (0, -1), 'LEFT'),  # Left-align text in the first column (CLO descriptions)
+         ('ALIGN', (1, 1), (-1, -1), 'CENTER'),  # Center-align text in the second column (PLOs)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      table.setStyle(table_style)
+         # Add the table to the document
+      elements.append(table)
+      # STOP  - CLO <-> PLO Mapping Table
+      
+      # START - PLOs table
+      section_header = Paragraph("Program Learning Outcomes (PLOs):", styles['Heading4'])
+      elements.append(section_header)
+      
+      # Create table data with header
+      table_data = [['Designation', 'Description']]
+      
+      # Sort PLOs by their designation (single-letter reference)
+      sorted_plos = sorted(program_learning_objectives.values(), key=lambda plo: plo.designation)
+      
+      # Populate table data with sorted PLO designations and descriptions
+      for plo in sorted_plos:
+         table_data.append([plo.designation, Paragraph(plo.description, style=getSampleStyleSheet()['BodyText'])])
+      
+      # Create the table
+      table = Table(table_data, colWidths=[inch, 5.5 * inch])
+      
+      # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text
+         ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # Center-align text in the first column (Designations)
+         ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Descriptions)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      table.setStyle(table_style)
+      
+      # Add the table to the document
+      elements.append(table)
+      # STOP - PLOs table
+      
+      # START - CLOs -> Evaluation Types Used
+         # Define section header for the table
+      section_header = Paragraph("Course Learning Objectives (CLOs) and Evaluation Types:", styles['Heading4'])
+      elements.append(section_header)
+         # Create a table for CLOs with 'CLO Designation' and 'Evaluation Types' as headers
+      table_data = []
+      table_data.append(['CLO Designation', 'Evaluation Types'])  # Header row
+         # Iterate through the CLOs to populate the table data
+      for clo, evaluation_types in clo_evaluation_types.items():
+         clo_designation = str(clo)  # Convert designation to string
+         evaluation_text = ', '.join(str(evaluation.type_name) for evaluation in evaluation_types)
+         evaluation_paragraph = Paragraph(evaluation_text, styles['BodyText'])
+         
+         # Add the row to the table data
+         table_data.append([clo_designation, evaluation_paragraph])
+      
+      # Create the table
+      table = Table(table_data, colWidths=[1.5*inch, 5*inch])
+      
+      # Define table styles
+      table_style = TableStyle([
+         ('GRID', (0, 0), (-1, -1), 1, colors.black),  # Grid for table cells
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Header row background color
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # Header row text color
+         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center align all text initially
+         ('ALIGN', (1, 1), (-1, -1), 'LEFT'),  # Left-align text in the second column (Evaluation Types)
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header row font
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),  # Body rows background color
+         ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),  # Body rows text color
+         ('TOPPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Padding for body rows
+         ('LEFTPADDING', (0, 1), (-1, -1), 6),  # Padding for left column text
+         ('RIGHTPADDING', (0, 1), (-1, -1), 6),  # Padding for right column text
+      ])
+      
+      table.setStyle(table_style)
+      
+      # Add the table to the document
+      elements.append(table)
+      # STOP  - CLOs -> Evaluation Types Used
+      
+      # START - PLO Performance Table w/ Designations
+      elements.append(Paragraph("PLO Performance", styles['Heading3']))
+      plo_data = [["PLO", "Average Score"]]  # Header row
+      
+      # Define a style for wrapping text at 200 characters
+      plo_style = ParagraphStyle(
+         "PLOStyle",
+         parent=styles["Normal"],
+         wordWrap="CJK",  # Ensures text wraps properly
+         maxLineLength=200  # Helps keep the text contained within the cell
+      )
+      
+      for plo_id, score in performance_data['plo_performance'].items():
+         # Query the ProgramLearningObjective model to get the PLO designation
+         try:
+            plo = ProgramLearningObjective.objects.get(plo_id=plo_id)  # Fetch the PLO by its id
+            plo_designation = plo.designation  # Get designation
+            plo_description = plo.description  # Get description
+         except ProgramLearningObjective.DoesNotExist:
+            plo_designation = "Unknown PLO"
+            plo_description = "No description available"
+         
+         # Create a wrapped paragraph for the PLO column
+         plo_text = Paragraph(f"<b>{plo_designation}:</b> {plo_description}", plo_style)
+         
+         if score != -1: # Check for unused PLO
+            plo_data.append([plo_text, f"{score:.2f}%"])  # Append formatted text
+         else:
+            plo_data.append([plo_text, "N/A"])  # Append formatted text
+      
+      plo_table = Table(plo_data, colWidths=[350, 100])  # Adjust width as needed
+      
+      plo_table.setStyle(TableStyle([
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+         ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left-align PLO column
+         ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center-align score column
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+         ('GRID', (0, 0), (-1, -1), 1, colors.black)
+      ]))
+      
+      elements.append(plo_table)
+      # STOP  - PLO Performance Table with designations
+      
+      # START - CLO Performance Table w/ Designations
+      elements.append(Paragraph("CLO Performance", styles['Heading3']))
+      clo_data = [["CLO", "Average Score"]]  # Header row
+      
+      # Define a style for wrapping text at 200 characters
+      clo_style = ParagraphStyle(
+         "CLOStyle",
+         parent=styles["Normal"],
+         wordWrap="CJK",  # Ensures text wraps properly
+         maxLineLength=200  # This indirectly helps keep the text within bounds
+      )
+      
+      for clo_id, score in performance_data['clo_performance'].items():
+         # Query the CourseLearningObjectives model to get the CLO designation based on the clo_id
+         try:
+            clo = CourseLearningObjective.objects.get(clo_id=clo_id)  # Fetch the CLO by its id
+            clo_designation = clo.designation  # Grab designation
+            clo_description = clo.description  # Grab description
+         except CourseLearningObjective.DoesNotExist:
+            clo_designation = "Unknown CLO"
+            clo_description = "No description available"
+         
+         # Create a wrapped paragraph for the CLO column
+         clo_text = Paragraph(f"<b>{clo_designation}:</b> {clo_description}", clo_style)
+         
+         if score != -1: # Check for non-used CLOs (-1 scores)
+            clo_data.append([clo_text, f"{score:.2f}%"])  # Append wrapped text
+         else: 
+            clo_data.append([clo_text, "N/A"])  # Append wrapped text
+      
+      clo_table = Table(clo_data, colWidths=[350, 100])  
+      
+      clo_table.setStyle(TableStyle([
+         ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+         ('ALIGN', (0, 0), (0, -1), 'LEFT'),  # Left-align CLO column
+         ('ALIGN', (1, 0), (1, -1), 'CENTER'),  # Center-align score column
+         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+         ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+         ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+         ('GRID', (0, 0), (-1, -1), 1, colors.black)
+      ]))
+      
+      elements.append(clo_table)
+      # STOP  - CLO Performance Table
+      
+      # Embed Graphs
+      # PLO Performance
+      plo_label = Paragraph("PLO Performance", styles['Normal'])
+      elements.append(plo_label)
+      plo_image = Image(charts.image(plo_graph), width=4*inch, height=2.5*inch)
+      elements.append(plo_image)
+      # CLO Performance
+      clo_label = Paragraph("CLO Performance", styles['Normal'])
+      elements.append(clo_label)
+      clo_image = Image(charts.image(clo_graph), width=4*inch, height=2.5*inch)
+      elements.append(clo_image)
+      # Student Grade Box Plot
+      box_plot_label = Paragraph("Student Grade Distribution", styles['Normal'])
+      elements.append(box_plot_label)
+      box_plot_image = Image(charts.image(box_plot), width=4*inch, height=2.5*inch)
+      elements.append(box_plot_image)
+      
+      doc.build(elements)
+      return pdf_buffer.getvalue() # Return the bytes of the created PDF
+# STOP - Section Report
@@ -0,0 +1,107 @@
+# API App views/reports.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status, generics
+from django.http import FileResponse
+from django.db import transaction
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..report_jobs import enqueue_report_job # Background report generation
+
+# Misc. imports
+import os
+
+
+# NOTE:
+# - Views for the PDF report routes (loaded lazily) and background report jobs
+
+
+
+# START - Report Views
+def lazy_report_view(view_name):
+   """
+   Purpose: Returns a view function for one of the PDF report views in report_pdfs.py that only imports that module
+            (and with it matplotlib, seaborn and ReportLab) the first time the endpoint is hit.
+   Args:
+      view_name (str): The name of the view class in report_pdfs.py, e.g. "ProgramPerformanceReport"
+   """
+   view = None
+   
+   def report_view(request, *args, **kwargs):
+      nonlocal view
+      if view is None:
+         from . import report_pdfs # Imported here on purpose, see the NOTE in report_pdfs.py
+         view = getattr(report_pdfs, view_name).as_view()
+      return view(request, *args, **kwargs)
+   
+   report_view.csrf_exempt = True  # Same as every APIView.as_view(), DRF does its own CSRF checks
+   return report_view
+# STOP - Report Views
+
+
+
+# START - ReportJob
+class ReportJobListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for queueing a performance report to be built in the background and listing your report jobs.
+   POST body: {"report_type": "program" | "course" | "section", "object_id": <pk>, "parameters": {<query parameter>: [<value>, ...]}}
+   The parameters are the same ones the matching performancereport/ GET route takes (selectedProgramSemesters, selectedCourseSemesters, excludedSection)
+   """
+   serializer_class = ReportJobSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get_queryset(self):
+      jobs = ReportJob.objects.all().order_by("-created_at")
+      if not self.request.user.is_superuser:  # Users only see their own jobs
+         jobs = jobs.filter(requested_by=self.request.user)
+      return jobs
+   
+   def post(self, request):
+      serializer = ReportJobSerializer(data=request.data)
+      if not serializer.is_valid():
+         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+      
+      # Fail fast on reports for things that do not exist, everything else is validated by the report itself
+      report_models = {"program": Program, "course": Course, "section": Section}
+      report_type = serializer.validated_data["report_type"]
+      if not report_models[report_type].objects.filter(pk=serializer.validated_data["object_id"]).exists():
+         return Response({"error": f"{report_type.capitalize()} not found."}, status=status.HTTP_404_NOT_FOUND)
+      
+      with transaction.atomic():
+         job = serializer.save(requested_by=request.user)
+         enqueue_report_job(job)  # Handed to the worker pool once this transaction commits
+      return Response(ReportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+class ReportJobDetail(generics.RetrieveAPIView):
+   """
+   API endpoint for polling the status of a report job.
+   """
+   serializer_class = ReportJobSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      jobs = ReportJob.objects.all()
+      if not self.request.user.is_superuser:  # Users only see their own jobs
+         jobs = jobs.filter(requested_by=self.request.user)
+      return jobs
+
+class ReportJobDownload(ReportJobDetail):
+   """
+   API endpoint for downloading the PDF of a finished report job.
+   """
+   def get(self, request, *args, **kwargs):
+      job = self.get_object()
+      if job.status == "failed":
+         return Response({"error": job.error}, status=status.HTTP_409_CONFLICT)
+      if job.status != "succeeded":
+         return Response({"error": f"The report is not ready yet (status: {job.status})."}, status=status.HTTP_409_CONFLICT)
+      if not job.result_path or not os.path.exists(job.result_path):
+         return Response({"error": "The report file is no longer available, please request it again."}, status=status.HTTP_410_GONE)
+      filename = f"{job.report_type.capitalize()}_Performance.pdf"  # Same name the synchronous route uses
+      return FileResponse(open(job.result_path, "rb"), as_attachment=True, filename=filename)
+# STOP - ReportJob
@@ -0,0 +1,138 @@
+# API App views/sections.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+from .. import metrics # Task, CLO, PLO and grade metrics shared by every performance view
+
+
+# NOTE:
+# - Views for semesters, sections and section performance
+
+
+
+# START - Semester
+class SemesterListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Semester instance.
+   """
+   serializer_class = SemesterSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      semesters = Semester.objects.all()
+      return paginated_response(self, semesters, SemesterSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Semesters."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = SemesterSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class SemesterDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Semester instance.
+   """
+   queryset = Semester.objects.all()  # Define queryset for the view
+   serializer_class = SemesterSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return Semester.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Semesters."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new Semesters."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - Semester
+
+
+
+# START - Section
+class SectionListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Section instance.
+   """
+   serializer_class = SectionSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      sections = Section.objects.all()
+      return paginated_response(self, sections, SectionSerializer)
+   
+   def post(self, request):
+      serializer = SectionSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class SectionDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Section instance.
+   """
+   queryset = Section.objects.all()  # Define queryset for the view
+   serializer_class = SectionSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self):
+      return Section.objects.all()
+   
+   def perform_update(self, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      serializer.save()
+   
+   def destroy(self, request, *args, **kwargs):
+      instance = self.get_object() # Grab the instance to delete
+      self.perform_destroy(instance) # Delete it
+      return Response({"message": "Course deleted successfully."}, status=status.HTTP_200_OK) # Tell the frontend
+
+class SectionPerformance(generics.RetrieveAPIView):
+   """
+   This view is meant to ascertain the section performance.
+   It retrieves the section based on the provided primary key (pk).
+   """
+   queryset = Section.objects.all()
+   serializer_class = SectionSerializer
+   lookup_field = "pk"
+   
+   def get(self, request, *args, **kwargs):
+      section_id = self.kwargs.get("pk")
+      
+      # Check if the given section_id corresponds to a valid Section object
+      try:
+         section = Section.objects.get(pk=section_id)
+      except Section.DoesNotExist:
+         raise NotFound(detail="Section not found")
+      
+      # Read the section's CLO and PLO averages
+      return Response(metrics.section_performance(section.section_id))
+# STOP - Section
@@ -0,0 +1,125 @@
+# API App views/students.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+
+
+# NOTE:
+# - Views for students and the gradebook (student-task mappings)
+
+
+
+# START - Student
+class StudentListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Student instance.
+   """
+   serializer_class = StudentSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      students = Student.objects.all()
+      return paginated_response(self, students, StudentSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Students."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = StudentSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class StudentDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Student instance.
+   """
+   queryset = Student.objects.all()  # Define queryset for the view
+   serializer_class = StudentSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return Student.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Students."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Students."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - Student
+
+
+
+# START - StudentTaskMapping
+class StudentTaskMappingListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all instances of and creating a new Student Task Mapping instance.
+   The list is always paged: follow "next" until it is null, ?page_size=<n> sets the rows per page.
+   """
+   serializer_class = StudentTaskMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   always_paginate = True  # The whole gradebook of every year is far too large for one response (see pagination.py)
+   
+   def get(self, request):
+      student_task_mappings = StudentTaskMapping.objects.all()
+      return paginated_response(self, student_task_mappings, StudentTaskMappingSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Student Task Mappings."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = StudentTaskMappingSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class StudentTaskMappingDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific Student Task Mapping instance.
+   """
+   queryset = StudentTaskMapping.objects.all()  # Define queryset for the view
+   serializer_class = StudentTaskMappingSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the instance
+   
+   def get_queryset(self, request):
+      return StudentTaskMapping.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Student Task Mapping."}, status=status.HTTP_403_FORBIDDEN)
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the instance.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new Student Task Mapping."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - StudentTaskMapping
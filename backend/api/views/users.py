@@ -0,0 +1,160 @@
+# API App views/users.py
+
+# Django Imports
+from rest_framework.permissions import IsAuthenticated
+from django.contrib.auth.hashers import make_password
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+from rest_framework import status, generics
+
+# User-made django imports
+from ..serializers import * # Import serializers
+from ..models import * # Import models
+from ..pagination import paginated_response # Keyset pages, or the whole list when none are asked for
+
+
+# NOTE:
+# - Views for user accounts and the activity log
+
+
+
+# START - USERS
+# Create User View (Restricted to Superusers) | This is only separate from the UserLisCreate View due to security concerns.
+class CreateUserView(generics.CreateAPIView):
+   """
+   Allows only superusers to create new users.
+   """
+   queryset = User.objects.all()
+   serializer_class = UserSerializer
+   permission_classes = [IsAuthenticated]  # Only superusers can create users
+
+# User List and Create View (Only Admins can create users)
+class UserListCreate(generics.ListCreateAPIView):
+   """
+   Allows authenticated users to list users.
+   - Superusers can see all users.
+   - Regular users can only see their own details.
+   - Only superusers can create new users.
+   """
+   serializer_class = UserSerializer
+   permission_classes = [IsAuthenticated]
+   
+   def get_queryset(self):
+      """
+      If the user is a superuser, return all users.
+      Otherwise, return only the requesting user's data.
+      """
+      user = self.request.user
+      # Get the role IDs where the role name is either 'Admin' or 'root'
+      admin_role_ids = UserRole.objects.filter(role_name__in=["Admin", "root"]).values_list('id', flat=True)
+      
+      # Check if the user's role is in the list of admin role IDs
+      if user.role_id in admin_role_ids:
+         return UserSerializer.setup_eager_loading(User.objects.all())  # Superusers see all users
+      return UserSerializer.setup_eager_loading(User.objects.filter(user_id=user.user_id)) # only returns the same user
+   
+   def create(self, request, *args, **kwargs):
+      """
+      Override create method to ensure only superusers can create users.
+      """
+      if not request.user.is_superuser:
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      return super().create(request, *args, **kwargs)
+
+# User Detail View (Retrieve, Update, Delete)
+class UserDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   Allows authenticated users to retrieve, update, and delete a user instance.
+   """
+   queryset = User.objects.all()
+   serializer_class = UserSerializer
+   permission_classes = [IsAuthenticated]
+   
+   def get_object(self):
+      """
+      Retrieve user by either ID or username.
+      """
+      user_identifier = self.kwargs['user_identifier']
+      try:
+         return get_object_or_404(User, pk=int(user_identifier))  # Try by ID
+      except ValueError:
+         return get_object_or_404(User, d_number=user_identifier) # Try by d number
+   
+   def perform_update(self, request, serializer):
+      """
+      Hash password before saving, if updated.
+      """
+      if not request.user.is_superuser: # Disallows non-super users from updating user information under any circumstances
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      if 'password' in serializer.validated_data:
+         serializer.validated_data['password'] = make_password(serializer.validated_data['password'])
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      Deletes the user instance.
+      """
+      if not request.user.is_superuser: # Disallows non-super users from deleting users under any circumstances
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+      return Response(status=status.HTTP_204_NO_CONTENT)
+# STOP - USERS
+
+
+
+# START - LOG
+class LogListCreate(generics.ListCreateAPIView):
+   """
+   API endpoint for listing all logs and creating a new log.
+   """
+   serializer_class = LogSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   
+   def get(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      logs = Log.objects.all()
+      return paginated_response(self, logs, LogSerializer)
+   
+   def post(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      serializer = LogSerializer(data=request.data)
+      if serializer.is_valid():  # Checks for valid serializer
+         serializer.save()
+         return Response(serializer.data, status=status.HTTP_201_CREATED)
+      return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+class LogDetail(generics.RetrieveUpdateDestroyAPIView):
+   """
+   A view for retrieving, updating, and deleting a specific log instance.
+   """
+   queryset = Log.objects.all()  # Define queryset for the view
+   serializer_class = LogSerializer
+   permission_classes = [IsAuthenticated]  # Only authenticated users can access this view
+   lookup_field = "pk"  # Use the primary key to find the log instance
+   
+   def get_queryset(self, request):
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      return Log.objects.all()
+   
+   def perform_update(self, request, serializer):
+      """
+      This method is called when an update (PUT) request is made.
+      It allows us to add custom behavior during the update (e.g., adding more info).
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+            return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      # If you want to perform additional checks or modifications before saving the log
+      serializer.save()
+   
+   def perform_destroy(self, request, instance):
+      """
+      This method is called when a delete (DELETE) request is made.
+      We can perform any custom logic before actually deleting the log.
+      """
+      if not request.user.is_superuser:  # Checks for superuser status
+         return Response({"error": "Only superusers can create new users."}, status=status.HTTP_403_FORBIDDEN)
+      instance.delete()
+# STOP - LOGS
@@ -0,0 +1,55 @@
+"""
+Builds the DATABASES setting from environment variables (see settings.py).
+
+Kept out of settings.py so the result for any environment can be checked without reloading the settings module.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+def _flag(value):
+    return value.lower() in ("1", "true", "yes")
+
+
+def database_config(environ, base_dir):
+    """
+    Purpose: Returns the DATABASES dict for the given environment.
+    Args:
+        environ (Mapping): The environment variables, os.environ in settings.py
+        base_dir (Path): The project directory, where the default SQLite file lives
+    Returns:
+        dict: {'default': {...}} ready to assign to DATABASES
+    """
+    engine = environ.get("DB_ENGINE", "sqlite").lower()
+
+    if engine in ("postgresql", "postgres"):
+        pool = _flag(environ.get("DB_POOL", "false"))
+        default = {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': environ.get("DB_NAME", "educational_outcomes"),
+            'USER': environ.get("DB_USER", "postgres"),
+            'PASSWORD': environ.get("DB_PASSWORD", ""),
+            'HOST': environ.get("DB_HOST", "localhost"),
+            'PORT': environ.get("DB_PORT", "5432"),
+            'CONN_MAX_AGE': 0 if pool else int(environ.get("DB_CONN_MAX_AGE", 60)), # The pool owns the connections, Django refuses persistent ones on top of it
+            'CONN_HEALTH_CHECKS': True, # A reused connection is checked before the request uses it, so a restarted server does not fail the next request
+            'OPTIONS': {
+                'connect_timeout': int(environ.get("DB_CONNECT_TIMEOUT", 10)),
+            },
+        }
+        if pool:
+            default['OPTIONS']['pool'] = {
+                'min_size': int(environ.get("DB_POOL_MIN_SIZE", 2)),
+                'max_size': int(environ.get("DB_POOL_MAX_SIZE", 10)),
+                'timeout': int(environ.get("DB_POOL_TIMEOUT", 10)), # Seconds a request waits for a free connection
+            }
+    elif engine == "sqlite":
+        default = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': environ.get("DB_NAME", base_dir / 'db.sqlite3'),
+            'CONN_MAX_AGE': int(environ.get("DB_CONN_MAX_AGE", 0)), # Opening a SQLite file is cheap, connections are only kept when asked for
+        }
+    else:
+        raise ImproperlyConfigured(f'DB_ENGINE must be "sqlite" or "postgresql", not "{engine}"')
+
+    return {'default': default}
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 from datetime import timedelta 
 from dotenv import load_dotenv
+from .database import database_config
 import os
 
 load_dotenv() # Load environment variable for database credentials, etc.
@@ -39,8 +40,13 @@ REST_FRAMEWORK = { # Necessary for JWT token (for secure authorization)
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.KeysetPagination", # Keyset pages, only when the client asks for them (see api/pagination.py)
 }
 
+# Pagination config. variables (see api/pagination.py)
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", 100))  # Rows per page when the request does not send ?page_size=
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", 1000))  # Largest ?page_size= honoured
+
 
 SIMPLE_JWT = { # JWT Auth. Config
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30), # Access token lifetime (set to 30 minutes),
@@ -103,11 +109,24 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+# Database config. variables, read from the environment (or backend/.env, see load_dotenv() above)
+#   DB_ENGINE: "sqlite" (default, BASE_DIR / db.sqlite3 unless DB_NAME says otherwise) or "postgresql"
+#   DB_NAME / DB_USER / DB_PASSWORD / DB_HOST / DB_PORT: PostgreSQL connection details
+#   DB_CONN_MAX_AGE: Seconds a connection is kept open and reused between requests, 0 closes it after every request
+#                    (default 60 for PostgreSQL, 0 for SQLite)
+#   DB_POOL: "true" gives every process a psycopg connection pool instead (PostgreSQL only, needs psycopg[pool])
+#   DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE: Connections the pool keeps open / may open
+DATABASES = database_config(os.environ, BASE_DIR)
+
+# SQLite tuning profile, applied to every new SQLite connection (see api/sqlite_tuning.py)
+SQLITE_TUNING = os.environ.get("SQLITE_TUNING", "true").lower() in ("1", "true", "yes")  # "false" leaves SQLite's defaults alone
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL", # Readers keep reading while a gradebook is written, instead of waiting for the writer's lock
+    "synchronous": "NORMAL", # Safe with WAL, a power cut can lose the last commits but never corrupts the file
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 10000)), # Milliseconds a writer waits for the lock before "database is locked"
+    "cache_size": -int(os.environ.get("SQLITE_CACHE_SIZE_KB", 32768)), # Page cache per connection, negative values are KiB
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)), # Bytes of the file read through memory mapping
+    "temp_store": "MEMORY", # Sorts and temporary tables stay in memory
 }
 
 
@@ -157,3 +176,26 @@ CORS_ALLOWS_CREDENTIALS = True
 
 # Explicitly defining a custom User model to ensure Django does not throw errors
 AUTH_USER_MODEL = 'api.User'
+
+
+# Report job config. variables (see api/report_jobs.py)
+REPORT_JOB_EXECUTOR = os.environ.get("REPORT_JOB_EXECUTOR", "process")  # "process" (spawned worker processes), "thread" or "inline" (runs in the request, useful for tests)
+REPORT_JOB_WORKERS = int(os.environ.get("REPORT_JOB_WORKERS", 2))  # Reports are built in memory and charts are drawn without pyplot, so workers never share files or figures
+REPORT_JOB_DIR = BASE_DIR / "report_jobs"  # Where finished report PDFs are kept until downloaded
+REPORT_JOB_STALE_SECONDS = int(os.environ.get("REPORT_JOB_STALE_SECONDS", 30 * 60))  # A job 'running' for longer than this lost its worker, run_report_jobs re-queues it
+
+# Ingestion job config. variables (see api/ingestion_jobs.py)
+INGESTION_JOB_EXECUTOR = os.environ.get("INGESTION_JOB_EXECUTOR", "thread")  # "thread" (worker threads inside the server process) or "inline" (runs in the request, useful for tests)
+INGESTION_JOB_WORKERS = int(os.environ.get("INGESTION_JOB_WORKERS", 1))  # SQLite takes one writer at a time, more workers would only wait on each other's locks
+INGESTION_JOB_DIR = BASE_DIR / "ingestion_jobs"  # Where uploaded gradebook files wait for their job to run
+INGESTION_JOB_STALE_SECONDS = int(os.environ.get("INGESTION_JOB_STALE_SECONDS", 60 * 60))  # A job 'running' for longer than this lost its worker, run_ingestion_jobs fails it
+
+# Report cache config. variables (see api/report_cache.py)
+REPORT_CACHE_DIR = BASE_DIR / "report_cache"  # Where cached report PDFs are kept
+REPORT_CACHE_MAX_BYTES = int(os.environ.get("REPORT_CACHE_MAX_BYTES", 512 * 1024 * 1024))  # Least recently used reports are evicted past this size, 0 turns the cache off
+
+# Chart rendering config. variables (see api/charts.py)
+CHART_RENDER_WORKERS = int(os.environ.get("CHART_RENDER_WORKERS", 2))  # Size of the chart rendering process pool, 0 draws charts in the calling thread
+
+# Metrics config. variables (see api/metrics.py)
+METRICS_CACHE_TIMEOUT = int(os.environ.get("METRICS_CACHE_TIMEOUT", 300))  # Seconds a performance endpoint's numbers stay in Django's cache (keyed by data version), 0 turns the cache off